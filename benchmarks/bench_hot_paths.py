@@ -0,0 +1,125 @@
+"""Microbenchmarks for the pure-Python work on the request path.
+
+Nothing here touches the database, so the suite runs anywhere the
+requirements are installed.
+
+Usage:
+    python benchmarks/bench_hot_paths.py -o baseline.json
+    python benchmarks/bench_hot_paths.py -o current.json
+    python -m pyperf compare_to baseline.json current.json --table
+"""
+
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+import pyperf  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from src.db.repositories.project import ProjectRepository  # noqa: E402
+from src.models.project import ProjectPublic  # noqa: E402
+from src.models.user import UserInDb  # noqa: E402
+from src.services.auth import AuthService  # noqa: E402
+from src.utils.validators import Validators  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def project_record(contributors: object) -> dict:
+    """A row shaped like the result of GET_PROJECT_QUERY."""
+    now = datetime.now(timezone.utc)
+    return {
+        "id": uuid.uuid4(),
+        "title": "Community solar for the school",
+        "description": "Panels and batteries for the district school.",
+        "goal_amount": 50000,
+        "owner_id": uuid.uuid4(),
+        "deadline": now + timedelta(days=3650),
+        "created_at": now,
+        "updated_at": now,
+        "is_deleted": False,
+        "total_contributions": 12,
+        "amount_raised": 1234,
+        "contribution_count": 40,
+        "contributors": contributors,
+    }
+
+
+def user_record() -> dict:
+    """A row shaped like the result of the user queries."""
+    now = datetime.now(timezone.utc)
+    return {
+        "user_id": uuid.uuid4(),
+        "first_name": "Ama",
+        "last_name": "Mensah",
+        "username": "AmaMensah",
+        "email": "Ama.Mensah@Example.org",
+        "password_hash": "$2b$12$" + "x" * 53,
+        "created_at": now,
+        "updated_at": now,
+        "is_deleted": False,
+    }
+
+
+def main() -> None:
+    """Register and run every benchmark."""
+    runner = pyperf.Runner()
+    usernames = [f"user{i}" for i in range(12)]
+
+    list_record = project_record(usernames)
+    string_record = project_record("{" + ",".join(usernames) + "}")
+    runner.bench_func(
+        "project_from_record", ProjectRepository._build_project, list_record
+    )
+    runner.bench_func(
+        "project_from_record_string_contributors",
+        ProjectRepository._build_project,
+        string_record,
+    )
+
+    user = user_record()
+    runner.bench_func("user_in_db_validation", lambda: UserInDb(**user))
+    runner.bench_func("user_in_db_from_record", UserInDb.from_record, user)
+
+    auth_service = AuthService()
+    claims = {"user_id": str(uuid.uuid4())}
+    token = auth_service.create_access_token(claims)
+    runner.bench_func(
+        "jwt_create_access_token", auth_service.create_access_token, claims
+    )
+    runner.bench_async_func("jwt_verify_token", auth_service.verify_token, token)
+
+    runner.bench_func(
+        "validate_email", Validators.validate_email, "kwame.asante@gmail.com"
+    )
+    runner.bench_func(
+        "is_valid_phonenumber", Validators.is_valid_phonenumber, "+233241234567"
+    )
+
+    response_field = create_model_field(
+        name="Response_projects", type_=list[ProjectPublic], mode="serialization"
+    )
+    projects = [
+        ProjectRepository._build_project(project_record(usernames))
+        for _ in range(PAGE_SIZE)
+    ]
+
+    async def serialize_projects() -> bytes:
+        # The same steps FastAPI runs for a route with response_model.
+        content = await serialize_response(
+            field=response_field, response_content=projects
+        )
+        return JSONResponse(content).body
+
+    runner.bench_async_func(f"serialize_{PAGE_SIZE}_projects", serialize_projects)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark the standard and fast JSON response paths on a project listing.
+
+Both routes return the same page of 1,000 ProjectInDb under
+response_model=ProjectPage, one through FastAPI's default serialization and
+one through FastJSONRoute. Requests are driven straight through the ASGI
+app, so the numbers include routing and response rendering but no network.
+
+Usage:
+    python benchmarks/bench_json_responses.py -o results.json
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+import pyperf  # noqa: E402
+from fastapi import APIRouter, FastAPI  # noqa: E402
+
+from benchmarks.bench_hot_paths import project_record  # noqa: E402
+from src.api.responses import FastJSONRoute  # noqa: E402
+from src.db.repositories.project import ProjectRepository  # noqa: E402
+from src.models.project import ProjectPage  # noqa: E402
+
+PAGE_SIZE = 1000
+
+
+class EnabledFastJSONRoute(FastJSONRoute):
+    """FastJSONRoute regardless of FAST_JSON_RESPONSES."""
+
+    enabled = True
+
+
+def build_app(page: ProjectPage) -> FastAPI:
+    """An app serving the same page through both response paths."""
+    standard_router = APIRouter()
+    fast_router = APIRouter(route_class=EnabledFastJSONRoute)
+
+    @standard_router.get("/standard", response_model=ProjectPage)
+    async def standard() -> ProjectPage:
+        return page
+
+    @fast_router.get("/fast", response_model=ProjectPage)
+    async def fast() -> ProjectPage:
+        return page
+
+    app = FastAPI()
+    app.include_router(standard_router)
+    app.include_router(fast_router)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    """Run one GET request through the ASGI app and return the body."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    body = bytearray()
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return bytes(body)
+
+
+def main() -> None:
+    """Register and run the benchmarks."""
+    runner = pyperf.Runner()
+    usernames = [f"user{i}" for i in range(12)]
+    page = ProjectPage(
+        items=[
+            ProjectRepository._build_project(project_record(usernames))
+            for _ in range(PAGE_SIZE)
+        ],
+        next_cursor="cursor",
+    )
+    app = build_app(page)
+
+    runner.bench_async_func(
+        f"list_{PAGE_SIZE}_projects_standard", call, app, "/standard"
+    )
+    runner.bench_async_func(f"list_{PAGE_SIZE}_projects_fast", call, app, "/fast")
+
+
+if __name__ == "__main__":
+    main()
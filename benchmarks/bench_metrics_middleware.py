@@ -0,0 +1,79 @@
+"""Benchmark the overhead of MetricsMiddleware on a single request.
+
+Calls a small FastAPI app directly over ASGI, with and without the
+middleware, so the difference is the cost of collecting metrics.
+
+Usage:
+    python benchmarks/bench_metrics_middleware.py -o metrics.json
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pyperf  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from src.api.middleware import MetricsMiddleware  # noqa: E402
+
+REQUESTS_PER_LOOP = 100
+
+
+def create_app() -> FastAPI:
+    """Create an app with one parametrized route."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"item_id": item_id}
+
+    return app
+
+
+def make_request(app: object) -> callable:  # type: ignore
+    """Build a coroutine function that sends REQUESTS_PER_LOOP requests."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/42",
+        "raw_path": b"/items/42",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        pass
+
+    async def run() -> None:
+        for _ in range(REQUESTS_PER_LOOP):
+            await app(dict(scope), receive, send)  # type: ignore
+
+    return run
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    runner = pyperf.Runner()
+    runner.metadata["requests_per_loop"] = REQUESTS_PER_LOOP
+    app = create_app()
+    runner.bench_async_func(
+        "asgi_request_without_metrics", make_request(app), inner_loops=REQUESTS_PER_LOOP
+    )
+    runner.bench_async_func(
+        "asgi_request_with_metrics",
+        make_request(MetricsMiddleware(app)),
+        inner_loops=REQUESTS_PER_LOOP,
+    )
+
+
+if __name__ == "__main__":
+    main()
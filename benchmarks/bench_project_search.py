@@ -0,0 +1,91 @@
+"""Benchmark project search against a seeded database.
+
+Seed first, e.g. python -m src.scripts.seed_data --projects 1000000, then run
+the first page of each search term repeatedly through ProjectRepository and
+report latency percentiles next to how many projects match the term. Exits
+with status 1 when a term's p95 is above --target-ms.
+
+Needs the same POSTGRES_* settings as the app.
+
+Usage:
+    python benchmarks/bench_project_search.py --iterations 200
+    python benchmarks/bench_project_search.py --terms "solar panels" maize
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from databases import Database  # noqa: E402
+
+from benchmarks.load_test import percentile  # noqa: E402
+from src.core.config import DATABASE_URL  # noqa: E402
+from src.db.repositories.project import ProjectRepository  # noqa: E402
+
+# Common, middling and rare words of the seeder's vocabulary, a prefix and
+# a multi-word query.
+DEFAULT_TERMS = ["community", "library", "irrigation", "stoves", "tea", "solar panels"]
+
+COUNT_MATCHES_QUERY = """
+    SELECT COUNT(*)
+    FROM projects
+    WHERE is_deleted = FALSE
+    AND search_vector @@ to_tsquery('english', :tsquery)
+"""
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Time every term and print a table."""
+    database = Database(DATABASE_URL)
+    await database.connect()
+    project_repo = ProjectRepository(database)
+    slow = []
+    try:
+        print(f"{'term':<16}{'matches':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for term in args.terms:
+            matches = await database.fetch_val(
+                query=COUNT_MATCHES_QUERY,
+                values={"tsquery": ProjectRepository._to_prefix_tsquery(term)},
+            )
+            await project_repo.search_projects(text=term, limit=args.limit)
+
+            latencies = []
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                await project_repo.search_projects(text=term, limit=args.limit)
+                latencies.append(time.perf_counter() - started)
+            latencies.sort()
+
+            p95 = percentile(latencies, 0.95) * 1000
+            print(
+                f"{term:<16}{matches:>10}"
+                f"{percentile(latencies, 0.50) * 1000:>10.2f}"
+                f"{p95:>10.2f}{percentile(latencies, 0.99) * 1000:>10.2f}"
+            )
+            if p95 > args.target_ms:
+                slow.append(term)
+    finally:
+        await database.disconnect()
+
+    if slow:
+        print(f"p95 above {args.target_ms} ms for: {', '.join(slow)}")
+        return 1
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", nargs="+", default=DEFAULT_TERMS)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20, help="Page size.")
+    parser.add_argument("--target-ms", type=float, default=10)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run(parse_args())))
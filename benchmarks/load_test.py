@@ -0,0 +1,341 @@
+"""End-to-end load generator for the API.
+
+Drives the app in-process over httpx's ASGI transport, or a running server
+with --url, using a weighted mix of scenarios. Prints throughput and
+p50/p95/p99 per scenario, can save the results as JSON, and compares them
+against a saved baseline, exiting with status 1 on a regression.
+
+The in-process mode needs the same POSTGRES_* settings as the app. It turns
+rate limiting off unless RATE_LIMIT_BACKEND is set: every virtual user comes
+from one address, so the per-IP limits would answer most requests with 429.
+Start the server under test with RATE_LIMIT_BACKEND=none when using --url.
+
+Usage:
+    python benchmarks/load_test.py --duration 30 --output baseline.json
+    python benchmarks/load_test.py --duration 30 --baseline baseline.json
+    python benchmarks/load_test.py --url http://localhost:8000 \\
+        --mix list=5,detail=4,contribute=1
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx  # noqa: E402
+
+API = "/api/v1"
+PASSWORD = "load-test-password"
+DEFAULT_MIX = "signup=1,login=2,me=15,list=30,detail=40,contribute=12"
+
+
+@dataclass
+class VirtualUser:
+    """A signed up user with a token and a project of their own."""
+
+    user_id: str
+    email: str
+    token: str
+    project_id: str
+
+
+@dataclass
+class Samples:
+    """Latencies and failures recorded for one scenario."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(values)))
+    return values[rank - 1]
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse 'name=weight,...' into a dict of scenario weights."""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise SystemExit(
+                f"Unknown scenario {name!r}. Known: {', '.join(SCENARIOS)}"
+            )
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def new_user_payload() -> dict:
+    """Payload for a fresh signup."""
+    suffix = uuid.uuid4().hex[:12]
+    return {
+        "first_name": "Load",
+        "last_name": "Tester",
+        "username": f"load{suffix}",
+        "email": f"load{suffix}@example.org",
+        "password_hash": PASSWORD,
+    }
+
+
+def auth_headers(user: VirtualUser) -> dict:
+    """Send the access token the way the app expects it."""
+    return {"Cookie": f"access_token={user.token}"}
+
+
+async def signup(
+    client: httpx.AsyncClient, user: VirtualUser, pool: list
+) -> httpx.Response:
+    """Create a new user."""
+    return await client.post(f"{API}/users", json=new_user_payload())
+
+
+async def login(
+    client: httpx.AsyncClient, user: VirtualUser, pool: list
+) -> httpx.Response:
+    """Log in as an existing user."""
+    return await client.post(
+        f"{API}/users/login", data={"username": user.email, "password": PASSWORD}
+    )
+
+
+async def me(
+    client: httpx.AsyncClient, user: VirtualUser, pool: list
+) -> httpx.Response:
+    """Fetch the current user."""
+    return await client.get(f"{API}/users/me", headers=auth_headers(user))
+
+
+async def project_list(
+    client: httpx.AsyncClient, user: VirtualUser, pool: list
+) -> httpx.Response:
+    """Fetch the first page of projects."""
+    return await client.get(f"{API}/projects")
+
+
+async def project_detail(
+    client: httpx.AsyncClient, user: VirtualUser, pool: list
+) -> httpx.Response:
+    """Fetch a random project."""
+    project_id = random.choice(pool).project_id
+    return await client.get(f"{API}/projects/{project_id}")
+
+
+async def contribute(
+    client: httpx.AsyncClient, user: VirtualUser, pool: list
+) -> httpx.Response:
+    """Contribute to a random project."""
+    project_id = random.choice(pool).project_id
+    return await client.post(
+        f"{API}/projects/{project_id}/contribute",
+        json={"contributor_id": user.user_id, "amount": random.randint(1, 500)},
+        headers=auth_headers(user),
+    )
+
+
+SCENARIOS: dict[
+    str, Callable[[httpx.AsyncClient, VirtualUser, list], Awaitable[httpx.Response]]
+] = {
+    "signup": signup,
+    "login": login,
+    "me": me,
+    "list": project_list,
+    "detail": project_detail,
+    "contribute": contribute,
+}
+
+
+async def create_virtual_user(client: httpx.AsyncClient) -> VirtualUser:
+    """Sign up, log in and create a project."""
+    payload = new_user_payload()
+    response = await client.post(f"{API}/users", json=payload)
+    response.raise_for_status()
+    user_id = response.json()["user_id"]
+    response = await client.post(
+        f"{API}/users/login", data={"username": payload["email"], "password": PASSWORD}
+    )
+    response.raise_for_status()
+    token = response.json()["access_token"]
+    response = await client.post(
+        f"{API}/projects",
+        json={
+            "title": f"Load test {payload['username']}",
+            "description": "Project created by the load generator.",
+            "goal_amount": 100000,
+            "owner_id": user_id,
+            "deadline": (datetime.now(timezone.utc) + timedelta(days=365)).isoformat(),
+        },
+        headers={"Cookie": f"access_token={token}"},
+    )
+    response.raise_for_status()
+    return VirtualUser(user_id, payload["email"], token, response.json()["id"])
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    weights: dict[str, float],
+    users: int,
+    concurrency: int,
+    duration: float,
+) -> tuple[dict[str, Samples], float]:
+    """Run the scenario mix until the duration elapses."""
+    pool = await asyncio.gather(*(create_virtual_user(client) for _ in range(users)))
+    names = list(weights)
+    weight_values = list(weights.values())
+    samples = {name: Samples() for name in names}
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            name = random.choices(names, weights=weight_values)[0]
+            started = time.perf_counter()
+            try:
+                response = await SCENARIOS[name](client, random.choice(pool), pool)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            samples[name].latencies.append(time.perf_counter() - started)
+            samples[name].errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples: dict[str, Samples], elapsed: float) -> dict:
+    """Throughput and latency percentiles per scenario, in milliseconds."""
+    report: dict = {"elapsed_seconds": round(elapsed, 3), "scenarios": {}}
+    total = 0
+    for name, scenario in samples.items():
+        latencies = sorted(scenario.latencies)
+        total += len(latencies)
+        report["scenarios"][name] = {
+            "requests": len(latencies),
+            "errors": scenario.errors,
+            "throughput": round(len(latencies) / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        }
+    report["throughput"] = round(total / elapsed, 2)
+    return report
+
+
+def print_report(report: dict) -> None:
+    """Print the summary as a table."""
+    print(
+        f"{'scenario':<12}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for name, row in report["scenarios"].items():
+        print(
+            f"{name:<12}{row['requests']:>10}{row['errors']:>8}{row['throughput']:>10}"
+            f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}"
+        )
+    print(f"total throughput: {report['throughput']} req/s")
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """List regressions beyond the threshold, as a fraction, against a baseline."""
+    regressions = []
+    for name, row in report["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if not base or not base["requests"] or not row["requests"]:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if base[metric] and row[metric] > base[metric] * (1 + threshold):
+                regressions.append(f"{name} {metric}: {base[metric]} -> {row[metric]}")
+        if row["throughput"] < base["throughput"] * (1 - threshold):
+            regressions.append(
+                f"{name} throughput: {base['throughput']} -> {row['throughput']}"
+            )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run the load test and report."""
+    weights = parse_mix(args.mix)
+    random.seed(args.seed)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    timeout = httpx.Timeout(args.timeout)
+
+    app = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=timeout)
+    else:
+        os.environ.setdefault("RATE_LIMIT_BACKEND", "none")
+        from src.api.main import app
+
+        await app.router.startup()
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://load-test",
+            timeout=timeout,
+        )
+
+    try:
+        async with client:
+            samples, elapsed = await run_load(
+                client, weights, args.users, args.concurrency, args.duration
+            )
+    finally:
+        if app is not None:
+            await app.router.shutdown()
+
+    report = summarize(samples, elapsed)
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(report, baseline, args.threshold / 100)
+        if regressions:
+            print(f"Regressions beyond {args.threshold}%:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions beyond {args.threshold}% against {args.baseline}.")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--url", help="Base URL of a running server. In-process if omitted."
+    )
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run.")
+    parser.add_argument(
+        "--concurrency", type=int, default=20, help="Concurrent clients."
+    )
+    parser.add_argument("--users", type=int, default=20, help="Users created up front.")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Scenario weights.")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--output", help="Save the results as JSON.")
+    parser.add_argument("--baseline", help="Results JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20,
+        help="Allowed regression in percent before failing.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
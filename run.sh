@@ -3,4 +3,4 @@
 
 alembic upgrade head
 
-gunicorn -w 1 -k uvicorn.workers.UvicornWorker src.api.main:app --bind 0.0.0.0:8080
\ No newline at end of file
+gunicorn -w "${WEB_CONCURRENCY:-1}" -k uvicorn.workers.UvicornWorker src.api.main:app --bind 0.0.0.0:8080
\ No newline at end of file
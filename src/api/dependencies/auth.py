@@ -6,10 +6,12 @@ from databases import Database
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 
-from src.api.dependencies.database import get_database
+from src.api.dependencies.database import get_database, get_read_database
+from src.db.replicas import ReadDatabase
 from src.db.repositories.user import UserRepository
 from src.models.user import UserInDb
 from src.services.auth import AuthService
+from src.services.user_cache import user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login", auto_error=False)
 app_logger = logging.getLogger("app")
@@ -20,9 +22,12 @@ async def get_auth_service() -> AuthService:
     return AuthService()
 
 
-async def get_user_repository(db: Database = Depends(get_database)) -> UserRepository:
+async def get_user_repository(
+    db: Database = Depends(get_database),
+    read_db: ReadDatabase = Depends(get_read_database),
+) -> UserRepository:
     """User Repository Dependency."""
-    return UserRepository(db)
+    return UserRepository(db, read_db)
 
 
 async def get_token_from_cookies(request: Request) -> str:
@@ -43,17 +48,26 @@ async def get_current_user(
     user_repo: UserRepository = Depends(get_user_repository),
 ) -> UserInDb:
     """Get the current user from the access token."""
-    try:
-        user_id = await auth_service.verify_token(access_token)
-    except Exception as e:
-        app_logger.exception("Access token verification failed", exc_info=e)
-        raise HTTPException(  # noqa
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
-        )
+    claims = user_cache.get_claims(access_token)
+    if claims is None:
+        try:
+            claims = await auth_service.verify_token_claims(access_token)
+        except Exception as e:
+            app_logger.info("Access token verification failed", extra={"error": str(e)})
+            raise HTTPException(  # noqa
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
+            )
+        user_cache.set_claims(access_token, claims)
+
+    user_id = claims["user_id"]
+    user = user_cache.get_user(user_id)
+    if user:
+        return user
 
     user = await user_repo.get_user(user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         )
+    user_cache.set_user(user)
     return user
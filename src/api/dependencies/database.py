@@ -10,6 +10,7 @@ from databases import Database
 from fastapi import Depends
 from starlette.requests import Request
 
+from src.db.replicas import ReadDatabase
 from src.db.repositories.base import BaseRepository
 
 app_logger = logging.getLogger("app")
@@ -20,12 +21,18 @@ def get_database(request: Request) -> Database:
     return request.app.state._db
 
 
+def get_read_database(request: Request) -> ReadDatabase:
+    """Get the replica-aware read database from app state."""
+    return request.app.state.read_db
+
+
 def get_repository(repo_type: Union[Type[BaseRepository], BaseRepository]) -> Callable:
     """Dependency for db."""
 
     def get_repo(
         db: Database = Depends(get_database),
+        read_db: ReadDatabase = Depends(get_read_database),
     ) -> Type[BaseRepository]:
-        return repo_type(db)  # type: ignore
+        return repo_type(db, read_db)  # type: ignore
 
     return get_repo
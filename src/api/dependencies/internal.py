@@ -0,0 +1,26 @@
+"""Dependency for internal endpoints."""
+
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from src.core.config import INTERNAL_API_TOKEN
+
+
+async def require_internal_token(authorization: Optional[str] = Header(None)) -> None:
+    """Allow only callers sending INTERNAL_API_TOKEN as a bearer token.
+
+    The endpoints answer 404 while no token is configured.
+    """
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        token.encode(), INTERNAL_API_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid internal token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
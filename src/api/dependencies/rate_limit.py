@@ -0,0 +1,32 @@
+"""Dependency for rate limits."""
+
+import math
+from typing import AsyncGenerator, Callable
+
+from fastapi import Depends
+from fastapi.security import OAuth2PasswordRequestForm
+
+from src.errors.core import TooManyRequestsError
+from src.services.rate_limit import RateLimit, rate_limiter
+
+
+def limit_login_attempts(limit: RateLimit) -> Callable:
+    """Limit failed login attempts per account, whichever IPs they come from.
+
+    Every attempt takes a token before the password is checked, so concurrent
+    guesses cannot all get through before the first one fails. A successful
+    login gives its token back.
+    """
+
+    async def check_login_attempts(
+        form_data: OAuth2PasswordRequestForm = Depends(),
+    ) -> AsyncGenerator[None, None]:
+        identity = form_data.username.lower()
+        retry_after = await rate_limiter.hit(limit, identity)
+        if retry_after:
+            raise TooManyRequestsError(retry_after=math.ceil(retry_after))
+        yield
+        # Only reached when the login did not raise.
+        await rate_limiter.refund(limit, identity)
+
+    return check_login_attempts
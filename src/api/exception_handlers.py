@@ -14,5 +14,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         request: Request, exc: CoreError
     ) -> JSONResponse:
         return JSONResponse(
-            status_code=exc.status_code, content={"detail": exc.message}
+            status_code=exc.status_code,
+            content={"detail": exc.message},
+            headers=exc.headers,
         )
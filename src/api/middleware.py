@@ -1,16 +1,383 @@
 """Middleware configuration for the application."""
 
+import asyncio
+import hashlib
 import logging
+import math
+import re
+import time
+from typing import Optional
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from databases.interfaces import Record
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import Headers
 from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import (
+    API_PREFIX,
+    DATABASE_REPLICA_URLS,
+    IDEMPOTENCY_KEY_TTL_SECONDS,
+    IDEMPOTENCY_LOCK_SECONDS,
+    IDEMPOTENCY_WAIT_SECONDS,
+    READ_YOUR_WRITES_SECONDS,
+)
+from src.core.metrics import registry
+from src.db.replicas import read_from_primary
+from src.db.repositories.idempotency import IdempotencyRepository
+from src.errors.core import (
+    CoreError,
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyReusedError,
+    TooManyRequestsError,
+)
+from src.errors.database import BadRequestError
+from src.services.rate_limit import (
+    IP_LIMIT,
+    LOGIN_IP_LIMIT,
+    SIGNUP_IP_LIMIT,
+    RateLimit,
+    rate_limiter,
+)
 
 request_logger = logging.getLogger("request")
+app_logger = logging.getLogger("app")
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+RECENT_WRITE_COOKIE = "recent_write_until"
+
+REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status.",
+    ("method", "route", "status"),
+)
+REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests being served.", ("method",)
+)
+REQUEST_BYTES = registry.counter(
+    "http_request_size_bytes_total",
+    "HTTP request body bytes received.",
+    ("method", "route"),
+)
+# Routes with their own per-IP limit instead of IP_LIMIT. Both hash passwords.
+ROUTE_RATE_LIMITS = {
+    ("POST", f"{API_PREFIX}/users/login"): LOGIN_IP_LIMIT,
+    ("POST", f"{API_PREFIX}/users"): SIGNUP_IP_LIMIT,
+}
+
+# POSTs that accept an Idempotency-Key header.
+IDEMPOTENT_ROUTES = [
+    re.compile(rf"{API_PREFIX}/projects/[^/]+/contribute/?"),
+    re.compile(rf"{API_PREFIX}/users/?"),
+]
+# Statuses that mean the request was refused before it did anything: the
+# password hasher and the connection pool answer 503 when saturated. A key is
+# freed after these, so a retry runs again; other server errors are replayed.
+IDEMPOTENCY_RETRYABLE_STATUSES = {status.HTTP_503_SERVICE_UNAVAILABLE}
+IDEMPOTENCY_REPLAYS = registry.counter(
+    "idempotency_requests_total",
+    "Requests carrying an Idempotency-Key, by outcome.",
+    ("outcome",),
+)
+
+RESPONSE_BYTES = registry.counter(
+    "http_response_size_bytes_total",
+    "HTTP response body bytes sent.",
+    ("method", "route", "status"),
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route request metrics.
+
+    Routes are labelled with their template, such as
+    /api/v1/projects/{project_id}, so label cardinality stays bounded.
+    Requests that match no route are labelled "unmatched".
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initializes the middleware around the application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and count the bytes flowing each way."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        request_bytes = 0
+        response_bytes = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_flight.dec()
+            route = scope.get("route")
+            template = route.path if route is not None else "unmatched"
+            status = str(status_code)
+            REQUEST_DURATION.labels(method, template, status).observe(elapsed)
+            REQUEST_BYTES.labels(method, template).inc(request_bytes)
+            RESPONSE_BYTES.labels(method, template, status).inc(response_bytes)
+
+
+def error_response(error: CoreError) -> JSONResponse:
+    """Render an error the way the CoreError exception handler does.
+
+    Pure ASGI middleware runs outside the app's exception handlers.
+    """
+    return JSONResponse(
+        status_code=error.status_code,
+        content={"detail": error.message},
+        headers=error.headers,
+    )
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware limiting requests per client IP.
+
+    Runs before routing, so a limited request costs one bucket check. The
+    client address is the one the server saw; run uvicorn with
+    --proxy-headers behind a load balancer.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_limit: RateLimit = IP_LIMIT,
+        route_limits: dict = ROUTE_RATE_LIMITS,
+    ) -> None:
+        """Initializes the middleware with the default and per-route limits."""
+        self.app = app
+        self.default_limit = default_limit
+        self.route_limits = route_limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer 429 with Retry-After once the client's bucket is empty."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"].rstrip("/") or "/"
+        limit = self.route_limits.get((scope["method"], path), self.default_limit)
+        client = scope.get("client")
+        retry_after = await rate_limiter.hit(limit, client[0] if client else "unknown")
+        if retry_after:
+            error = TooManyRequestsError(retry_after=math.ceil(retry_after))
+            await error_response(error)(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class IdempotencyMiddleware:
+    """Pure ASGI middleware making retried POSTs safe with an Idempotency-Key.
+
+    The first request with a key claims it and runs. Its response is stored
+    and replayed to every later request with the key, server errors
+    included: a request can commit its write and fail afterwards, e.g. on a
+    cache error, and running it again would write twice. The key is only
+    freed, so a retry runs again, if the app raised before it started a
+    response or refused the request with a retryable status. Duplicates
+    arriving while the first is in flight wait for its response. Keys are
+    scoped to the caller's access token, or to the client IP for anonymous
+    callers such as signups, so a response is only replayed to the caller
+    that caused it, and a key reused for a different request is refused.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initializes the middleware around the application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request once per key, replaying its response to retries."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not any(route.fullmatch(scope["path"]) for route in IDEMPOTENT_ROUTES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get("idempotency-key")
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not 0 < len(key) <= 255:
+            error = BadRequestError("Idempotency-Key must be 1 to 255 characters")
+            await error_response(error)(scope, receive, send)
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        caller = self._caller(scope)
+        fingerprint = hashlib.blake2b(
+            b"\n".join(
+                (scope["path"].encode(), scope["query_string"], body),
+            ),
+            digest_size=32,
+        ).hexdigest()
+        claim = {"scope": caller, "key": key, "fingerprint": fingerprint}
+        idempotency_repo = IdempotencyRepository(scope["app"].state._db)
+
+        try:
+            stored = await self._claim(idempotency_repo, claim)
+        except CoreError as error:
+            IDEMPOTENCY_REPLAYS.labels("rejected").inc()
+            await error_response(error)(scope, receive, send)
+            return
+        if stored is not None:
+            IDEMPOTENCY_REPLAYS.labels("replayed").inc()
+            response = Response(
+                content=stored["body"],
+                status_code=stored["status_code"],
+                media_type=stored["content_type"],
+                headers={"Idempotent-Replayed": "true"},
+            )
+            await response(scope, receive, send)
+            return
+        IDEMPOTENCY_REPLAYS.labels("executed").inc()
+
+        body_sent = False
+        status_code: Optional[int] = None
+        content_type: Optional[str] = None
+        chunks: list[bytes] = []
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, content_type
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = Headers(raw=message["headers"]).get("content-type")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception:
+            # status_code is still None unless the response had started.
+            await self._finish(
+                idempotency_repo, claim, status_code, content_type, b"".join(chunks)
+            )
+            raise
+        await self._finish(
+            idempotency_repo, claim, status_code, content_type, b"".join(chunks)
+        )
+
+    def _caller(self, scope: Scope) -> str:
+        """Hash the access token, or the client IP if there is none.
+
+        Anonymous callers behind one address share a scope, so their keys
+        should be random, e.g. UUIDs.
+        """
+        access_token = Request(scope).cookies.get("access_token")
+        if access_token:
+            caller = f"token:{access_token}"
+        else:
+            client = scope.get("client")
+            caller = f"ip:{client[0] if client else 'unknown'}"
+        return hashlib.blake2b(caller.encode(), digest_size=32).hexdigest()
+
+    async def _claim(
+        self, idempotency_repo: IdempotencyRepository, claim: dict
+    ) -> Optional[Record]:
+        """Claim a key, or wait for the response of the request holding it.
+
+        Returns None once the key is claimed, else the response to replay.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + IDEMPOTENCY_WAIT_SECONDS
+        delay = 0.01
+        while True:
+            if await idempotency_repo.claim(
+                **claim,
+                lock_seconds=IDEMPOTENCY_LOCK_SECONDS,
+                ttl_seconds=IDEMPOTENCY_KEY_TTL_SECONDS,
+            ):
+                return None
+            stored = await idempotency_repo.get(scope=claim["scope"], key=claim["key"])
+            if stored is not None:
+                if stored["fingerprint"] != claim["fingerprint"]:
+                    raise IdempotencyKeyReusedError()
+                if stored["status_code"] is not None:
+                    return stored
+            if loop.time() >= deadline:
+                raise IdempotencyKeyInProgressError()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.25)
+
+    async def _finish(
+        self,
+        idempotency_repo: IdempotencyRepository,
+        claim: dict,
+        status_code: Optional[int],
+        content_type: Optional[str],
+        body: bytes,
+    ) -> None:
+        """Store the response for a claimed key, or free the key.
+
+        The key is freed if no response was started or its status is in
+        IDEMPOTENCY_RETRYABLE_STATUSES. The response has already gone out, so
+        a failure here is only logged; the key frees itself after
+        IDEMPOTENCY_LOCK_SECONDS.
+        """
+        try:
+            if status_code is None or status_code in IDEMPOTENCY_RETRYABLE_STATUSES:
+                await idempotency_repo.release(**claim)
+            else:
+                await idempotency_repo.complete(
+                    **claim,
+                    status_code=status_code,
+                    content_type=content_type,
+                    body=body,
+                )
+        except CoreError:
+            app_logger.warning(
+                f"Could not store the response for Idempotency-Key {claim['key']}",
+                exc_info=True,
+            )
 
 
 def setup_middleware(app: FastAPI) -> None:
     """Configure all middleware."""
+    # Innermost, so replays and 429s still get CORS headers, logs and metrics.
+    # Rate limits apply before idempotency keys are looked up.
+    app.add_middleware(IdempotencyMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+
     # origins = ["http://localhost:3000"]
     origins = ["*"]
     app.add_middleware(
@@ -23,14 +390,49 @@ def setup_middleware(app: FastAPI) -> None:
 
     @app.middleware("http")
     async def log_requests(request: Request, call_next: callable) -> JSONResponse:  # type: ignore
-        client_ip = request.client.host  # type: ignore
-        method = request.method
-        path = request.url.path
-        request_logger.info(f"Incoming request: {method} {path} from {client_ip}")
-
+        started = time.perf_counter()
         response = await call_next(request)
+        route = request.scope.get("route")
+        template = route.path if route is not None else "unmatched"
+        request_logger.info(
+            "%s %s %s",
+            request.method,
+            template,
+            response.status_code,
+            extra={
+                "method": request.method,
+                "route": template,
+                "path": request.url.path,
+                "status": response.status_code,
+                "client": request.client.host if request.client else None,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            },
+        )
+        return response
+
+    if DATABASE_REPLICA_URLS:
+
+        @app.middleware("http")
+        async def read_your_writes(request: Request, call_next: callable) -> JSONResponse:  # type: ignore
+            is_write = request.method not in SAFE_METHODS
+            try:
+                recent_write = float(request.cookies.get(RECENT_WRITE_COOKIE, 0))
+            except ValueError:
+                recent_write = 0.0
+            token = read_from_primary.set(is_write or recent_write > time.time())
+            try:
+                response = await call_next(request)
+            finally:
+                read_from_primary.reset(token)
 
-        status_code = response.status_code
-        request_logger.info(f"Response: {status_code}")
+            if is_write and response.status_code < 400:
+                response.set_cookie(
+                    RECENT_WRITE_COOKIE,
+                    str(time.time() + READ_YOUR_WRITES_SECONDS),
+                    max_age=math.ceil(READ_YOUR_WRITES_SECONDS),
+                    httponly=True,
+                    samesite="lax",
+                )
+            return response
 
-        return response
\ No newline at end of file
+    app.add_middleware(MetricsMiddleware)
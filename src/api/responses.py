@@ -0,0 +1,78 @@
+"""Fast JSON responses module."""
+
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import Request, Response
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+from src.core.config import FAST_JSON_RESPONSES
+
+
+class RenderedJSON(bytes):
+    """A response body that was already serialized to JSON."""
+
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson response that passes pre-rendered bodies through untouched."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content as JSON."""
+        if isinstance(content, RenderedJSON):
+            return content
+        return super().render(content)
+
+
+class RenderedResponseField:
+    """Response field that dumps models straight to JSON bytes.
+
+    Validation is left to the original field, which passes instances of the
+    response model through as they are. Serialization skips the round trip
+    through Python dicts and the standard json encoder: pydantic-core writes
+    the response model's fields directly, so subclasses such as ProjectInDb
+    still only expose their public fields.
+    """
+
+    def __init__(self, field: Any, response_model: Any) -> None:
+        """Initializes the field with the route's response field and model."""
+        self.field = field
+        self.adapter: TypeAdapter = TypeAdapter(response_model)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the original field."""
+        return getattr(self.field, name)
+
+    def validate(self, value: Any, values: dict, *, loc: tuple) -> Any:
+        """Validate the endpoint's return value against the response model."""
+        return self.field.validate(value, values, loc=loc)
+
+    def serialize(self, value: Any, **kwargs: Any) -> RenderedJSON:
+        """Serialize a validated value to JSON."""
+        return RenderedJSON(self.adapter.dump_json(value, **kwargs))
+
+
+class FastJSONRoute(APIRoute):
+    """Route that renders its response model with FastJSONResponse.
+
+    Opt in with FAST_JSON_RESPONSES. Routes with a custom response_class or
+    without a response_model are left as they are.
+    """
+
+    enabled: bool = FAST_JSON_RESPONSES
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Build the request handler, swapping in the fast serializer."""
+        field: Optional[Any] = self.secure_cloned_response_field
+        if (
+            self.enabled
+            and field is not None
+            and not isinstance(field, RenderedResponseField)
+            and isinstance(self.response_class, DefaultPlaceholder)
+        ):
+            self.secure_cloned_response_field = RenderedResponseField(
+                field, self.response_model
+            )
+            self.response_class = Default(FastJSONResponse)
+        return super().get_route_handler()
@@ -1,12 +1,16 @@
 """Route configuration for the application."""
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 
+from src.api.dependencies.internal import require_internal_token
 from src.core.config import API_PREFIX
+from src.core.metrics import registry
 
 
 def setup_routes(app: FastAPI) -> None:
     """Configure all application routes."""
+    from src.api.routes.internal import internal_router
     from src.api.routes.project import project_router
     from src.api.routes.user import user_router
 
@@ -16,6 +20,23 @@ def setup_routes(app: FastAPI) -> None:
     app.include_router(
         project_router, prefix=f"{api_prefix}/projects", tags=["Project"]
     )
+    app.include_router(
+        internal_router,
+        prefix="/internal",
+        tags=["Internal"],
+        include_in_schema=False,
+    )
+
+    @app.get(
+        "/metrics",
+        name="metrics",
+        include_in_schema=False,
+        dependencies=[Depends(require_internal_token)],
+    )
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(
+            registry.render(), media_type="text/plain; version=0.0.4"
+        )
 
     @app.get("/", name="index")
     async def index() -> str:
@@ -0,0 +1,38 @@
+"""Internal routes."""
+
+from fastapi import APIRouter, Depends, Request, status
+
+from src.api.dependencies.internal import require_internal_token
+from src.core.metrics import registry
+
+internal_router = APIRouter()
+
+
+@internal_router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_internal_token)],
+)
+async def get_metrics_snapshot() -> dict:
+    """Get every metric as JSON, with p50/p95/p99 for histograms."""
+    return registry.snapshot()
+
+
+@internal_router.get(
+    "/pool",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_internal_token)],
+)
+async def get_pool_stats(request: Request) -> dict:
+    """Get live database connection pool statistics."""
+    return request.app.state.db_pool.stats()
+
+
+@internal_router.get(
+    "/replicas",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_internal_token)],
+)
+async def get_replica_stats(request: Request) -> list[dict]:
+    """Get the health of each read replica."""
+    return request.app.state.read_db.stats()
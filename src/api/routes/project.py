@@ -1,24 +1,76 @@
 """Project routes."""
 
-from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, AsyncIterator, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from src.api.dependencies.auth import get_current_user
 from src.api.dependencies.database import get_repository
+from src.api.dependencies.internal import require_internal_token
+from src.api.responses import FastJSONRoute
+from src.core.config import (
+    CONTRIBUTION_BULK_MAX_ROWS,
+    PROJECTS_PAGE_DEFAULT_LIMIT,
+    PROJECTS_PAGE_MAX_LIMIT,
+)
 from src.db.repositories.contribution import ContributionRepository
-from src.db.repositories.project import ProjectRepository
+from src.db.repositories.project import PROJECT_RANKING_SIZE, ProjectRepository
 from src.models.contribution import (
+    ContributionBulkResponse,
     ContributionCreate,
     ContributionInDb,
     ContributionPublic,
 )
-from src.models.project import ProjectCreate, ProjectInDb, ProjectPublic
+from src.models.project import (
+    ProjectContributorPage,
+    ProjectCreate,
+    ProjectInDb,
+    ProjectPage,
+    ProjectPublic,
+    ProjectRanking,
+)
 from src.models.user import UserInDb
+from src.utils.etag import ETag
+
+project_router = APIRouter(route_class=FastJSONRoute)
+
+PUBLIC_PROJECT_FIELDS = set(ProjectPublic.model_fields)
+STREAM_FLUSH_BYTES = 64 * 1024
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "json": "application/json"}
 
-project_router = APIRouter()
+
+async def _stream_projects(
+    projects: AsyncIterator[ProjectInDb], output_format: str
+) -> AsyncIterator[bytes]:
+    """Serialize projects one at a time, flushing in chunks of about 64 KiB."""
+    separator = b"\n" if output_format == "ndjson" else b","
+    buffer = bytearray(b"" if output_format == "ndjson" else b"[")
+    first = True
+    async for project in projects:
+        if output_format == "json" and not first:
+            buffer += separator
+        buffer += project.model_dump_json(include=PUBLIC_PROJECT_FIELDS).encode()
+        if output_format == "ndjson":
+            buffer += separator
+        first = False
+        if len(buffer) >= STREAM_FLUSH_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if output_format == "json":
+        buffer += b"]"
+    if buffer:
+        yield bytes(buffer)
 
 
 @project_router.post(
@@ -42,37 +94,168 @@ async def create_project(
 
 @project_router.get(
     "",
-    response_model=list[ProjectPublic],
+    response_model=ProjectPage,
     status_code=status.HTTP_200_OK,
 )
 async def get_projects(
     owner_id: Optional[UUID] = Query(None, description="The owner's ID"),
+    limit: int = Query(
+        PROJECTS_PAGE_DEFAULT_LIMIT,
+        ge=1,
+        le=PROJECTS_PAGE_MAX_LIMIT,
+        description="Maximum number of projects to return",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="The next_cursor of the previous page"
+    ),
     project_repo: ProjectRepository = Depends(get_repository(ProjectRepository)),
-) -> list[ProjectInDb]:
-    """Get the current user."""
-    if owner_id:
-        projects = await project_repo.get_owner_projects_efficient(owner_id=owner_id)
-    else:
-        projects = await project_repo.get_all_projects_efficient()
+) -> ProjectPage:
+    """Get a page of projects, newest first."""
+    return await project_repo.get_projects_page(
+        owner_id=owner_id, limit=limit, cursor=cursor
+    )
 
-    return projects
+
+@project_router.get(
+    "/search",
+    response_model=ProjectPage,
+    status_code=status.HTTP_200_OK,
+)
+async def search_projects(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to look for"),
+    limit: int = Query(
+        PROJECTS_PAGE_DEFAULT_LIMIT,
+        ge=1,
+        le=PROJECTS_PAGE_MAX_LIMIT,
+        description="Maximum number of projects to return",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="The next_cursor of the previous page"
+    ),
+    project_repo: ProjectRepository = Depends(get_repository(ProjectRepository)),
+) -> ProjectPage:
+    """Search project titles and descriptions, best match first."""
+    return await project_repo.search_projects(text=q, limit=limit, cursor=cursor)
+
+
+@project_router.get(
+    "/rankings/{ranking}",
+    response_model=ProjectRanking,
+    status_code=status.HTTP_200_OK,
+)
+async def get_project_ranking(
+    ranking: Literal["trending", "closest_to_goal", "ending_soon"],
+    limit: int = Query(
+        PROJECTS_PAGE_DEFAULT_LIMIT,
+        ge=1,
+        le=PROJECT_RANKING_SIZE,
+        description="Maximum number of projects to return",
+    ),
+    project_repo: ProjectRepository = Depends(get_repository(ProjectRepository)),
+) -> ProjectRanking:
+    """Get the top open projects by recent contributions, progress or deadline."""
+    return await project_repo.get_ranking(ranking=ranking, limit=limit)
+
+
+@project_router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stream_projects(
+    owner_id: Optional[UUID] = Query(None, description="The owner's ID"),
+    output_format: Literal["ndjson", "json"] = Query(
+        "ndjson", alias="format", description="NDJSON lines or a chunked JSON array"
+    ),
+    project_repo: ProjectRepository = Depends(get_repository(ProjectRepository)),
+) -> StreamingResponse:
+    """Stream every project without holding the full listing in memory."""
+    projects = project_repo.iterate_projects(owner_id=owner_id)
+    return StreamingResponse(
+        _stream_projects(projects, output_format),
+        media_type=STREAM_MEDIA_TYPES[output_format],
+    )
+
+
+@project_router.post(
+    "/contributions/bulk",
+    response_model=ContributionBulkResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_internal_token)],
+)
+async def create_contributions_bulk(
+    rows: list[dict[str, Any]] = Body(
+        ..., description="Contributions with project_id, contributor_id and amount"
+    ),
+    contribution_repo: ContributionRepository = Depends(
+        get_repository(ContributionRepository)
+    ),
+) -> ContributionBulkResponse:
+    """Import a batch of contributions, reporting the outcome of every row.
+
+    Rows may be for any active contributor, so only internal callers holding
+    INTERNAL_API_TOKEN, e.g. partner importers, may use it.
+    """
+    if len(rows) > CONTRIBUTION_BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch can hold at most {CONTRIBUTION_BULK_MAX_ROWS} rows.",
+        )
+    return await contribution_repo.create_contributions_bulk(rows=rows)
 
 
 @project_router.get(
     "/{project_id}",
     response_model=ProjectPublic,
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
 )
 async def get_project_by_id(
     project_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     project_repo: ProjectRepository = Depends(get_repository(ProjectRepository)),
-) -> ProjectInDb:
-    """Get the current user."""
-    return await project_repo.get_single_project_efficient(project_id=project_id)
+) -> Any:
+    """Get a project, or 304 if the client's copy is current."""
+    if if_none_match:
+        etag = await project_repo.get_project_etag(project_id=project_id)
+        if etag is not None and ETag.matches(etag, if_none_match):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    project = await project_repo.get_single_project_efficient(project_id=project_id)
+    # Built from the body itself, which may come from the cache.
+    response.headers["ETag"] = ProjectRepository.project_etag(project)
+    return project
+
+
+@project_router.get(
+    "/{project_id}/contributors",
+    response_model=ProjectContributorPage,
+    status_code=status.HTTP_200_OK,
+)
+async def get_project_contributors(
+    project_id: UUID,
+    limit: int = Query(
+        PROJECTS_PAGE_DEFAULT_LIMIT,
+        ge=1,
+        le=PROJECTS_PAGE_MAX_LIMIT,
+        description="Maximum number of contributors to return",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="The next_cursor of the previous page"
+    ),
+    project_repo: ProjectRepository = Depends(get_repository(ProjectRepository)),
+) -> ProjectContributorPage:
+    """Get a page of a project's contributors, latest first."""
+    return await project_repo.get_project_contributors(
+        project_id=project_id, limit=limit, cursor=cursor
+    )
 
 
 @project_router.post(
-    "{project_id}/contribute",
+    "/{project_id}/contribute",
     response_model=ContributionPublic,
     status_code=status.HTTP_201_CREATED,
 )
@@ -82,21 +265,9 @@ async def create_contribution(
     contribution_repo: ContributionRepository = Depends(
         get_repository(ContributionRepository)
     ),
-    project_repo: ProjectRepository = Depends(get_repository(ProjectRepository)),
     user: UserInDb = Depends(get_current_user),
 ) -> ContributionInDb:
     """Register a new contribution."""
-    project = await project_repo.get_single_project_efficient(project_id=project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found.",
-        )
-    if project.deadline < datetime.now(timezone.utc):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Project deadline has passed.",
-        )
     return await contribution_repo.create_contribution(
         project_id=project_id, new_contribution=new_contribution
     )
@@ -1,16 +1,22 @@
 """User routes."""
 
-from fastapi import APIRouter, Depends, Response, status
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, Header, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from src.api.dependencies.auth import get_current_user
 from src.api.dependencies.database import get_repository
+from src.api.dependencies.rate_limit import limit_login_attempts
+from src.api.responses import FastJSONRoute
 from src.core.config import ACCESS_TOKEN_EXPIRE_MINUTES
 from src.db.repositories.user import UserRepository
+from src.services.rate_limit import LOGIN_ACCOUNT_LIMIT
 from src.models.token import AccessToken
 from src.models.user import UserCreate, UserInDb, UserPublic
+from src.utils.etag import ETag
 
-user_router = APIRouter()
+user_router = APIRouter(route_class=FastJSONRoute)
 
 
 @user_router.post(
@@ -26,7 +32,12 @@ async def create_user(
     return await user_repo.create_user(new_user=new_user)
 
 
-@user_router.post("/login", response_model=AccessToken, status_code=status.HTTP_200_OK)
+@user_router.post(
+    "/login",
+    response_model=AccessToken,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(limit_login_attempts(LOGIN_ACCOUNT_LIMIT))],
+)
 async def user_login(
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
@@ -50,9 +61,18 @@ async def user_login(
     "/me",
     response_model=UserPublic,
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
 )
 async def get_current_user(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     user: UserInDb = Depends(get_current_user),
-) -> UserInDb:
-    """Get the current user."""
+) -> Any:
+    """Get the current user, or 304 if the client's copy is current."""
+    etag = ETag.build(user.user_id, user.updated_at)
+    if ETag.matches(etag, if_none_match):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
     return user
@@ -0,0 +1,157 @@
+"""Group commit module."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+from src.core.metrics import registry
+
+app_logger = logging.getLogger("app")
+
+BATCH_SIZE = registry.histogram(
+    "group_commit_batch_size",
+    "Items written per group commit, by batcher.",
+    ("batcher",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+BATCH_DURATION = registry.histogram(
+    "group_commit_flush_seconds",
+    "Time to write one group commit, by batcher.",
+    ("batcher",),
+)
+
+Flush = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class BatcherStoppedError(RuntimeError):
+    """Raised by submit when the batcher is not accepting items."""
+
+
+def _copy_error(error: Exception) -> Exception:
+    """Copy an error for one caller, so callers do not share a traceback."""
+    copied = type(error).__new__(type(error), *error.args)
+    copied.__dict__.update(error.__dict__)
+    copied.__cause__ = error
+    return copied
+
+
+class GroupCommitBatcher:
+    """Collects items from concurrent callers and writes them together.
+
+    The first item waits up to `max_delay` seconds for others to join it, up
+    to `max_size` items, then the batch goes to `flush` as one write. Items
+    arriving while a batch is being written make up the next one, so under
+    load batches grow without waiting. Callers get their own result, or the
+    exception `flush` returned or raised for their item, once the write is
+    committed.
+
+    A stopped batcher raises BatcherStoppedError from submit, so callers can
+    fall back to writing on their own, e.g. during shutdown.
+    """
+
+    def __init__(self, name: str, max_size: int, max_delay: float) -> None:
+        """Initializes the batcher as not yet started.
+
+        Args:
+            name (str): Label used in metrics and logs.
+            max_size (int): Most items written in one batch.
+            max_delay (float): Seconds the first item of a batch waits for more.
+        """
+        self.name = name
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._flush: Optional[Flush] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the batcher accepts items."""
+        return self._task is not None and not self._task.done()
+
+    def start(self, flush: Flush) -> None:
+        """Start writing batches with `flush`.
+
+        `flush` gets the items of a batch and returns one result per item, in
+        order. A result that is an exception is raised to its caller only.
+        """
+        if self._task is None:
+            self._flush = flush
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Write what is queued, then stop."""
+        if self._task is None or self._queue is None:
+            return
+        task, self._task = self._task, None
+        await self._queue.join()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for the batch holding it to be written."""
+        if not self.running or self._queue is None:
+            raise BatcherStoppedError(f"Batcher {self.name} is not running")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect and write batches forever."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: List[tuple[Any, asyncio.Future]]) -> None:
+        """Write one batch and hand every caller its result."""
+        assert self._flush is not None
+        BATCH_SIZE.labels(self.name).observe(len(batch))
+        start = asyncio.get_running_loop().time()
+        try:
+            results = list(await self._flush([item for item, _ in batch]))
+        except Exception as e:
+            app_logger.warning(f"Group commit {self.name} failed", exc_info=True)
+            results = [_copy_error(e) for _ in batch]
+        finally:
+            BATCH_DURATION.labels(self.name).observe(
+                asyncio.get_running_loop().time() - start
+            )
+        if len(results) != len(batch):
+            app_logger.error(
+                f"Group commit {self.name} returned {len(results)} results "
+                f"for {len(batch)} items"
+            )
+        for index, (_, future) in enumerate(batch):
+            # Callers that went away still had their item written.
+            if future.done():
+                continue
+            if index >= len(results):
+                future.set_exception(
+                    RuntimeError(f"Group commit {self.name} returned no result")
+                )
+            elif isinstance(results[index], Exception):
+                future.set_exception(results[index])
+            else:
+                future.set_result(results[index])
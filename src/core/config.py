@@ -1,10 +1,8 @@
 """Setting up configs."""
 
 # Third party imports
-import logging
-import sys
-
 from starlette.config import Config
+from starlette.datastructures import CommaSeparatedStrings
 
 config = Config(".env")
 
@@ -16,6 +14,13 @@ API_PREFIX = "/api/v1"
 
 # Environment
 ENV = config("ENV", cast=str, default="DEV")
+# Worker processes; run.sh passes it to gunicorn.
+WEB_CONCURRENCY = config("WEB_CONCURRENCY", cast=int, default=1)
+
+# Logging
+LOG_LEVEL = config("LOG_LEVEL", cast=str, default="INFO")
+LOG_FORMAT = config("LOG_FORMAT", cast=str, default="json")
+LOG_QUEUE_SIZE = config("LOG_QUEUE_SIZE", cast=int, default=10000)
 
 # Database[Postgres]
 POSTGRES_USERNAME = config("POSTGRES_USERNAME", cast=str, default="")
@@ -29,6 +34,33 @@ if ENV == "PROD":
 else:
     DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USERNAME}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
+# Connection pool
+DATABASE_POOL_MIN_SIZE = config("DATABASE_POOL_MIN_SIZE", cast=int, default=5)
+DATABASE_POOL_MAX_SIZE = config("DATABASE_POOL_MAX_SIZE", cast=int, default=20)
+DATABASE_POOL_ACQUIRE_TIMEOUT = config(
+    "DATABASE_POOL_ACQUIRE_TIMEOUT", cast=float, default=5
+)
+DATABASE_POOL_MAX_LIFETIME = config(
+    "DATABASE_POOL_MAX_LIFETIME", cast=float, default=1800
+)
+DATABASE_POOL_MAX_IDLE_LIFETIME = config(
+    "DATABASE_POOL_MAX_IDLE_LIFETIME", cast=float, default=300
+)
+
+# Query instrumentation
+DB_SLOW_QUERY_SECONDS = config("DB_SLOW_QUERY_SECONDS", cast=float, default=0.2)
+DB_SLOW_QUERY_LOG_MAX_QUERIES = config(
+    "DB_SLOW_QUERY_LOG_MAX_QUERIES", cast=int, default=20
+)
+
+# Read replicas
+DATABASE_REPLICA_URLS = config(
+    "DATABASE_REPLICA_URLS", cast=CommaSeparatedStrings, default=""
+)
+DATABASE_REPLICA_RETRY_SECONDS = config(
+    "DATABASE_REPLICA_RETRY_SECONDS", cast=float, default=30
+)
+READ_YOUR_WRITES_SECONDS = config("READ_YOUR_WRITES_SECONDS", cast=float, default=5)
 
 # JWT
 ACCESS_TOKEN_EXPIRE_MINUTES = config(
@@ -37,12 +69,117 @@ ACCESS_TOKEN_EXPIRE_MINUTES = config(
 SECRET_KEY = config("SECRET_KEY", cast=str, default="")
 ALGORITHM = config("ALGORITHM", cast=str, default="HS256")
 
+# Internal endpoints and bulk imports: sent as "Authorization: Bearer <token>".
+# Unset disables them.
+INTERNAL_API_TOKEN = config("INTERNAL_API_TOKEN", cast=str, default="")
+
+# Password hashing
+PASSWORD_HASH_BACKEND = config("PASSWORD_HASH_BACKEND", cast=str, default="thread")
+PASSWORD_HASH_WORKERS = config("PASSWORD_HASH_WORKERS", cast=int, default=2)
+PASSWORD_HASH_MAX_PENDING = config("PASSWORD_HASH_MAX_PENDING", cast=int, default=32)
 
-def configure_logging() -> None:
-    """Configure logging."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        stream=sys.stdout,
-    )
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+# Authenticated user cache
+USER_CACHE_TTL_SECONDS = config("USER_CACHE_TTL_SECONDS", cast=float, default=30)
+USER_CACHE_MAX_SIZE = config("USER_CACHE_MAX_SIZE", cast=int, default=10000)
+
+# Pagination
+PROJECTS_PAGE_DEFAULT_LIMIT = config(
+    "PROJECTS_PAGE_DEFAULT_LIMIT", cast=int, default=20
+)
+PROJECTS_PAGE_MAX_LIMIT = config("PROJECTS_PAGE_MAX_LIMIT", cast=int, default=100)
+# Project payloads list this many of the latest contributors; the rest are paged.
+PROJECT_CONTRIBUTORS_PREVIEW_SIZE = config(
+    "PROJECT_CONTRIBUTORS_PREVIEW_SIZE", cast=int, default=5
+)
+
+# Search
+PROJECT_SEARCH_FUZZY = config("PROJECT_SEARCH_FUZZY", cast=bool, default=True)
+# Around sqrt(projects * page size): ranks with fewer matches are sorted, ranks
+# with more walk the keyset index.
+PROJECT_SEARCH_INDEX_WALK_MIN_ROWS = config(
+    "PROJECT_SEARCH_INDEX_WALK_MIN_ROWS", cast=int, default=5000
+)
+# Planner estimates only drift as the table grows; cache them per search text.
+PROJECT_SEARCH_ESTIMATE_TTL_SECONDS = config(
+    "PROJECT_SEARCH_ESTIMATE_TTL_SECONDS", cast=float, default=600
+)
+PROJECT_SEARCH_ESTIMATE_CACHE_SIZE = config(
+    "PROJECT_SEARCH_ESTIMATE_CACHE_SIZE", cast=int, default=10000
+)
+
+# Rankings
+PROJECT_RANKINGS_REFRESH_SECONDS = config(
+    "PROJECT_RANKINGS_REFRESH_SECONDS", cast=float, default=60
+)
+PROJECT_RANKINGS_MAX_STALENESS_SECONDS = config(
+    "PROJECT_RANKINGS_MAX_STALENESS_SECONDS", cast=float, default=300
+)
+
+# Bulk imports
+CONTRIBUTION_BULK_MAX_ROWS = config(
+    "CONTRIBUTION_BULK_MAX_ROWS", cast=int, default=5000
+)
+
+# Group commit: single contributions are queued and written in batches.
+CONTRIBUTION_GROUP_COMMIT = config(
+    "CONTRIBUTION_GROUP_COMMIT", cast=bool, default=False
+)
+CONTRIBUTION_GROUP_COMMIT_MAX_ROWS = config(
+    "CONTRIBUTION_GROUP_COMMIT_MAX_ROWS", cast=int, default=500
+)
+CONTRIBUTION_GROUP_COMMIT_MAX_DELAY_MS = config(
+    "CONTRIBUTION_GROUP_COMMIT_MAX_DELAY_MS", cast=float, default=2
+)
+
+# Responses
+FAST_JSON_RESPONSES = config("FAST_JSON_RESPONSES", cast=bool, default=False)
+VALIDATE_DB_ROWS = config("VALIDATE_DB_ROWS", cast=bool, default=False)
+
+# Idempotency keys
+IDEMPOTENCY_KEY_TTL_SECONDS = config(
+    "IDEMPOTENCY_KEY_TTL_SECONDS", cast=float, default=86400
+)
+# A request holding a key this long is presumed dead and the key is freed.
+IDEMPOTENCY_LOCK_SECONDS = config("IDEMPOTENCY_LOCK_SECONDS", cast=float, default=60)
+# How long a duplicate waits for the request holding its key to answer.
+IDEMPOTENCY_WAIT_SECONDS = config("IDEMPOTENCY_WAIT_SECONDS", cast=float, default=10)
+IDEMPOTENCY_EXPIRY_INTERVAL_SECONDS = config(
+    "IDEMPOTENCY_EXPIRY_INTERVAL_SECONDS", cast=float, default=300
+)
+IDEMPOTENCY_EXPIRY_BATCH_SIZE = config(
+    "IDEMPOTENCY_EXPIRY_BATCH_SIZE", cast=int, default=5000
+)
+
+# Rate limiting
+RATE_LIMIT_BACKEND = config("RATE_LIMIT_BACKEND", cast=str, default="memory")
+RATE_LIMIT_MAX_KEYS = config("RATE_LIMIT_MAX_KEYS", cast=int, default=100000)
+RATE_LIMIT_PER_IP = config("RATE_LIMIT_PER_IP", cast=str, default="600/minute")
+RATE_LIMIT_LOGIN_PER_IP = config(
+    "RATE_LIMIT_LOGIN_PER_IP", cast=str, default="20/minute"
+)
+RATE_LIMIT_LOGIN_PER_ACCOUNT = config(
+    "RATE_LIMIT_LOGIN_PER_ACCOUNT", cast=str, default="5/minute"
+)
+RATE_LIMIT_SIGNUP_PER_IP = config(
+    "RATE_LIMIT_SIGNUP_PER_IP", cast=str, default="5/minute"
+)
+
+# Redis
+REDIS_URL = config("REDIS_URL", cast=str, default="redis://localhost:6379/0")
+REDIS_SOCKET_TIMEOUT = config("REDIS_SOCKET_TIMEOUT", cast=float, default=0.5)
+
+# Read-through cache
+# The memory backend is per worker, and deletes only reach the worker making
+# them, so other workers would serve stale entries until their TTL. It is only
+# the default for a single worker.
+CACHE_BACKEND = config(
+    "CACHE_BACKEND", cast=str, default="redis" if WEB_CONCURRENCY > 1 else "memory"
+)
+CACHE_MAX_ENTRIES = config("CACHE_MAX_ENTRIES", cast=int, default=10000)
+PROJECT_CACHE_TTL_SECONDS = config("PROJECT_CACHE_TTL_SECONDS", cast=float, default=30)
+PROJECT_CACHE_NOT_FOUND_TTL_SECONDS = config(
+    "PROJECT_CACHE_NOT_FOUND_TTL_SECONDS", cast=float, default=5
+)
+PROJECT_PAGE_CACHE_TTL_SECONDS = config(
+    "PROJECT_PAGE_CACHE_TTL_SECONDS", cast=float, default=10
+)
@@ -0,0 +1,117 @@
+"""Structured, queue-backed logging module."""
+
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from src.core.config import LOG_FORMAT, LOG_LEVEL, LOG_QUEUE_SIZE
+from src.core.metrics import registry
+
+LOG_RECORDS_DROPPED = registry.counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full.",
+    ("logger",),
+)
+
+RESERVED_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName", "color_message"}
+
+_listener: Optional[QueueListener] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line.
+
+    Attributes passed through `extra` become top-level fields.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as JSON."""
+        entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that never blocks and formats nothing on the caller.
+
+    Records are handed to the listener thread as they are, so message
+    interpolation and traceback formatting happen off the event loop. When
+    the queue is full the record is dropped and counted.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through unformatted."""
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels(record.name).inc()
+
+
+class BlockingStopQueueListener(QueueListener):
+    """Queue listener whose stop sentinel waits for room in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop sentinel behind the pending records."""
+        self.queue.put(self._sentinel)
+
+
+def configure_logging() -> None:
+    """Route every log record through a bounded queue to a background writer."""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if LOG_FORMAT == "json":
+        stream_handler.setFormatter(JSONFormatter())
+    else:
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        )
+
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(BoundedQueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        logging.getLogger(name).handlers.clear()
+        logging.getLogger(name).propagate = True
+
+    _listener = BlockingStopQueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
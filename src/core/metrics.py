@@ -0,0 +1,337 @@
+"""In-process metrics primitives shared by the application."""
+
+import math
+from bisect import bisect_left
+from typing import Callable, Iterator, Optional, Sequence, Union
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _CounterChild:
+    """Value holder for a single label combination of a counter."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Initializes the counter at zero."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter."""
+        self.value += amount
+
+
+class _GaugeChild:
+    """Value holder for a single label combination of a gauge."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Initializes the gauge at zero."""
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the gauge."""
+        self.value -= amount
+
+
+class _HistogramChild:
+    """Bucket counts for a single label combination of a histogram."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initializes empty buckets."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside the matching bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for index, bucket_count in enumerate(self.counts):
+            if index == len(self.buckets):
+                return self.buckets[-1]
+            upper = self.buckets[index]
+            if bucket_count and seen + bucket_count >= rank:
+                return lower + (upper - lower) * ((rank - seen) / bucket_count)
+            seen += bucket_count
+            lower = upper
+        return self.buckets[-1]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(labels: dict) -> str:
+    """Format labels for the Prometheus text format."""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """Base class for labelled metrics."""
+
+    type_ = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Initializes the metric with its name, help text and label names."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict = {}
+
+    def _new_child(self):  # type: ignore  # noqa
+        raise NotImplementedError
+
+    def labels(self, *values: str):  # type: ignore  # noqa
+        """Get the child for a combination of label values."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def children(self) -> Iterator[tuple]:
+        """Iterate over (label values, child) pairs."""
+        return iter(list(self._children.items()))
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type_ = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Value that can go up and down, optionally read from a callback."""
+
+    type_ = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        function: Optional[Callable[[], Union[float, dict]]] = None,
+    ) -> None:
+        """Initializes the gauge, optionally backed by a callback."""
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled gauge."""
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the unlabelled gauge."""
+        self.labels().dec(amount)
+
+    def set_function(self, function: Callable[[], Union[float, dict]]) -> None:
+        """Read the gauge from a callback at collection time.
+
+        The callback returns a number, or a dict of label values to numbers
+        for labelled gauges.
+        """
+        self.function = function
+
+    def children(self) -> Iterator[tuple]:
+        """Iterate over (label values, child) pairs."""
+        if self.function is None:
+            return super().children()
+        value = self.function()
+        if not isinstance(value, dict):
+            value = {(): value}
+        pairs = []
+        for label_values, number in value.items():
+            child = _GaugeChild()
+            child.set(number)
+            pairs.append((tuple(label_values), child))
+        return iter(pairs)
+
+
+class Histogram(Metric):
+    """Distribution of observations over fixed buckets."""
+
+    type_ = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initializes the histogram with sorted bucket upper bounds."""
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabelled histogram."""
+        self.labels().observe(value)
+
+
+class MetricsRegistry:
+    """Holds every metric the application exposes."""
+
+    def __init__(self) -> None:
+        """Initializes an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Register a metric, returning the existing one if already known."""
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"Metric {metric.name} is already registered")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self.register(Counter(name, documentation, labelnames))  # type: ignore
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        function: Optional[Callable[[], Union[float, dict]]] = None,
+    ) -> Gauge:
+        """Get or create a gauge."""
+        return self.register(  # type: ignore
+            Gauge(name, documentation, labelnames, function=function)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self.register(  # type: ignore
+            Histogram(name, documentation, labelnames, buckets=buckets)
+        )
+
+    def collect(self) -> Iterator[Metric]:
+        """Iterate over all registered metrics."""
+        return iter(list(self._metrics.values()))
+
+    def snapshot(self) -> dict:
+        """Return a JSON friendly view of every metric."""
+        result: dict = {}
+        for metric in self.collect():
+            samples = []
+            for label_values, child in metric.children():
+                sample: dict = {"labels": dict(zip(metric.labelnames, label_values))}
+                if isinstance(child, _HistogramChild):
+                    sample.update(
+                        count=child.count,
+                        sum=child.sum,
+                        p50=child.quantile(0.5),
+                        p95=child.quantile(0.95),
+                        p99=child.quantile(0.99),
+                    )
+                else:
+                    sample["value"] = child.value
+                samples.append(sample)
+            result[metric.name] = samples
+        return result
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_}")
+            for label_values, child in metric.children():
+                labels = dict(zip(metric.labelnames, label_values))
+                formatted = _format_labels(labels)
+                if not isinstance(child, _HistogramChild):
+                    lines.append(
+                        f"{metric.name}{formatted} {_format_value(child.value)}"
+                    )
+                    continue
+                cumulative = 0
+                for bound, count in zip((*child.buckets, math.inf), child.counts):
+                    cumulative += count
+                    bucket = _format_labels({**labels, "le": _format_value(bound)})
+                    lines.append(f"{metric.name}_bucket{bucket} {cumulative}")
+                lines.append(f"{metric.name}_sum{formatted} {_format_value(child.sum)}")
+                lines.append(f"{metric.name}_count{formatted} {child.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
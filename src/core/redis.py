@@ -0,0 +1,30 @@
+"""Shared Redis client."""
+
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.core.config import REDIS_SOCKET_TIMEOUT, REDIS_URL
+
+_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Get the process wide Redis client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = Redis.from_url(
+            REDIS_URL,
+            decode_responses=True,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the Redis client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
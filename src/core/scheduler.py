@@ -0,0 +1,51 @@
+"""Periodic background jobs module."""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Optional
+
+app_logger = logging.getLogger("app")
+
+
+class PeriodicTask:
+    """Runs a job every `interval` seconds until stopped.
+
+    Runs are spread by up to a tenth of the interval, so app instances started
+    together do not all fire at once. A failing run is logged and the next one
+    goes ahead as planned.
+    """
+
+    def __init__(
+        self, name: str, job: Callable[[], Awaitable[object]], interval: float
+    ) -> None:
+        """Initializes the task as not yet started."""
+        self.name = name
+        self.job = job
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start running the job in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Cancel the job, waiting for a run in progress to unwind."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Run the job forever."""
+        while True:
+            try:
+                await self.job()
+            except Exception:
+                app_logger.exception(f"Periodic task {self.name} failed")
+            await asyncio.sleep(self.interval * random.uniform(0.9, 1.1))
@@ -1,30 +1,103 @@
 """Core task: Connect and Disconnect to db when application starts and stops."""
 
 # Standard library imports
+import logging
 from typing import Callable
 
 # Third party imports is right
 from fastapi import FastAPI
 
-from src.core.config import configure_logging
+from src.core.config import (
+    CONTRIBUTION_GROUP_COMMIT,
+    IDEMPOTENCY_EXPIRY_BATCH_SIZE,
+    IDEMPOTENCY_EXPIRY_INTERVAL_SECONDS,
+    PROJECT_RANKINGS_REFRESH_SECONDS,
+)
+from src.core.logs import configure_logging, stop_logging
+from src.core.redis import close_redis
+from src.core.scheduler import PeriodicTask
+from src.db.repositories.contribution import (
+    ContributionRepository,
+    contribution_batcher,
+)
+from src.db.repositories.idempotency import IdempotencyRepository
+from src.db.repositories.project import ProjectRepository
 from src.db.repositories.tasks import connect_database, disconnect_database
+from src.services.hashing import password_hasher
+
+app_logger = logging.getLogger("app")
 
 
 def create_start_app_handler(app: FastAPI) -> Callable:
     """Connect to db."""
 
     async def start_app() -> None:
-        print("Starting app.")
-        await connect_database(app)
         configure_logging()
+        app_logger.info("Starting app.")
+        await connect_database(app)
+        start_periodic_tasks(app)
+        start_group_commit(app)
 
     return start_app
 
 
+def start_periodic_tasks(app: FastAPI) -> None:
+    """Start the background jobs that need the database."""
+    app.state.periodic_tasks = []
+    if not hasattr(app.state, "_db"):
+        return
+    project_repo = ProjectRepository(app.state._db)
+
+    async def refresh_project_rankings() -> None:
+        # Skip only if another instance refreshed during this interval.
+        await project_repo.refresh_rankings(
+            max_age=PROJECT_RANKINGS_REFRESH_SECONDS / 2
+        )
+
+    rankings = PeriodicTask(
+        "refresh_project_rankings",
+        refresh_project_rankings,
+        interval=PROJECT_RANKINGS_REFRESH_SECONDS,
+    )
+    rankings.start()
+    app.state.periodic_tasks.append(rankings)
+
+    idempotency_repo = IdempotencyRepository(app.state._db)
+
+    async def expire_idempotency_keys() -> None:
+        await idempotency_repo.delete_expired(batch_size=IDEMPOTENCY_EXPIRY_BATCH_SIZE)
+
+    idempotency_keys = PeriodicTask(
+        "expire_idempotency_keys",
+        expire_idempotency_keys,
+        interval=IDEMPOTENCY_EXPIRY_INTERVAL_SECONDS,
+    )
+    idempotency_keys.start()
+    app.state.periodic_tasks.append(idempotency_keys)
+
+
+def start_group_commit(app: FastAPI) -> None:
+    """Start batching contribution writes, if enabled."""
+    if not CONTRIBUTION_GROUP_COMMIT or not hasattr(app.state, "_db"):
+        return
+    contribution_repo = ContributionRepository(app.state._db)
+
+    async def write_contributions(contributions: list) -> list:
+        return await contribution_repo.insert_contributions(contributions=contributions)
+
+    contribution_batcher.start(write_contributions)
+
+
 def create_stop_app_handler(app: FastAPI) -> Callable:
     """Disconnect db."""
 
     async def stop_app() -> None:
+        for task in getattr(app.state, "periodic_tasks", []):
+            await task.stop()
+        await contribution_batcher.stop()
         await disconnect_database(app)
+        password_hasher.shutdown()
+        await close_redis()
+        stop_logging()
 
     return stop_app
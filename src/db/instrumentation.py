@@ -0,0 +1,174 @@
+"""Query timing and slow-query logging module."""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Iterator, List, Optional
+
+from databases import Database
+
+from src.core.config import DB_SLOW_QUERY_LOG_MAX_QUERIES, DB_SLOW_QUERY_SECONDS
+from src.core.metrics import registry
+
+slow_query_logger = logging.getLogger("slow_query")
+
+REPOSITORY_CALL_SECONDS = registry.histogram(
+    "db_repository_call_seconds",
+    "Repository method latency by repository, method and outcome.",
+    ("repository", "method", "outcome"),
+)
+REPOSITORY_ROWS = registry.counter(
+    "db_repository_rows_total",
+    "Rows returned to repository methods by their queries.",
+    ("repository", "method"),
+)
+REPOSITORY_QUERIES = registry.counter(
+    "db_repository_queries_total",
+    "Queries issued by repository methods.",
+    ("repository", "method"),
+)
+SLOW_CALLS = registry.counter(
+    "db_repository_slow_calls_total",
+    "Repository method calls slower than DB_SLOW_QUERY_SECONDS.",
+    ("repository", "method"),
+)
+
+_current_queries: ContextVar[Optional[List[dict]]] = ContextVar(
+    "current_queries", default=None
+)
+
+
+def parameter_shapes(values: Optional[dict]) -> dict:
+    """Describe bound parameters by type and length, never by value."""
+    if not values:
+        return {}
+    shapes = {}
+    for name, value in values.items():
+        if value is None:
+            shapes[name] = "null"
+        elif isinstance(value, (list, tuple)):
+            shapes[name] = f"{type(value).__name__}[{len(value)}]"
+        else:
+            shapes[name] = type(value).__name__
+    return shapes
+
+
+def _record_query(
+    query: Any, values: Optional[dict], rows: int, started: float
+) -> None:
+    """Record a query against the repository call being tracked, if any."""
+    queries = _current_queries.get()
+    if queries is None:
+        return
+    queries.append(
+        {
+            "sql": query,
+            "values": values,
+            "rows": rows,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+    )
+
+
+class InstrumentedDatabase(Database):
+    """Database that reports each query to the repository call running it."""
+
+    async def fetch_all(self, query: Any, values: Optional[dict] = None) -> Any:
+        """Fetch every row."""
+        started = time.perf_counter()
+        records = await super().fetch_all(query, values)
+        _record_query(query, values, len(records), started)
+        return records
+
+    async def fetch_one(self, query: Any, values: Optional[dict] = None) -> Any:
+        """Fetch a single row."""
+        started = time.perf_counter()
+        record = await super().fetch_one(query, values)
+        _record_query(query, values, int(record is not None), started)
+        return record
+
+    async def fetch_val(
+        self, query: Any, values: Optional[dict] = None, column: Any = 0
+    ) -> Any:
+        """Fetch a single value."""
+        started = time.perf_counter()
+        value = await super().fetch_val(query, values, column=column)
+        _record_query(query, values, int(value is not None), started)
+        return value
+
+    async def execute(self, query: Any, values: Optional[dict] = None) -> Any:
+        """Execute a statement."""
+        started = time.perf_counter()
+        result = await super().execute(query, values)
+        _record_query(query, values, 0, started)
+        return result
+
+    async def execute_many(self, query: Any, values: list) -> None:
+        """Execute a statement once per set of values."""
+        started = time.perf_counter()
+        await super().execute_many(query, values)
+        _record_query(query, {"values": values}, 0, started)
+
+    async def iterate(
+        self, query: Any, values: Optional[dict] = None
+    ) -> AsyncGenerator[Any, None]:
+        """Iterate over rows."""
+        started = time.perf_counter()
+        rows = 0
+        async for record in super().iterate(query, values):
+            rows += 1
+            yield record
+        _record_query(query, values, rows, started)
+
+
+@contextmanager
+def track_repository_call(repository: str, method: str) -> Iterator[None]:
+    """Time a repository method and the queries it runs.
+
+    Calls slower than DB_SLOW_QUERY_SECONDS are logged with their SQL
+    templates and parameter shapes. Queries of nested tracked calls also
+    count towards the caller.
+    """
+    parent = _current_queries.get()
+    queries: List[dict] = []
+    token = _current_queries.set(queries)
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        elapsed = time.perf_counter() - started
+        _current_queries.reset(token)
+        if parent is not None:
+            parent.extend(queries)
+
+        REPOSITORY_CALL_SECONDS.labels(repository, method, outcome).observe(elapsed)
+        if queries:
+            REPOSITORY_QUERIES.labels(repository, method).inc(len(queries))
+            REPOSITORY_ROWS.labels(repository, method).inc(
+                sum(query["rows"] for query in queries)
+            )
+        if elapsed >= DB_SLOW_QUERY_SECONDS:
+            SLOW_CALLS.labels(repository, method).inc()
+            slow_query_logger.warning(
+                "Slow repository call %s.%s",
+                repository,
+                method,
+                extra={
+                    "repository": repository,
+                    "method": method,
+                    "outcome": outcome,
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "queries": [
+                        {
+                            "sql": " ".join(str(query["sql"]).split()),
+                            "parameters": parameter_shapes(query["values"]),
+                            "rows": query["rows"],
+                            "duration_ms": query["duration_ms"],
+                        }
+                        for query in queries[:DB_SLOW_QUERY_LOG_MAX_QUERIES]
+                    ],
+                },
+            )
@@ -0,0 +1,40 @@
+"""add project keyset indexes
+
+Revision ID: 2259d4096cb1
+Revises: f06c85b28783
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2259d4096cb1"
+down_revision: Optional[str] = "f06c85b28783"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade DB."""
+    op.create_index(
+        "ix_projects_keyset",
+        "projects",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("is_deleted = FALSE"),
+    )
+    op.create_index(
+        "ix_projects_owner_keyset",
+        "projects",
+        ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("is_deleted = FALSE"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade DB."""
+    op.drop_index("ix_projects_owner_keyset", table_name="projects")
+    op.drop_index("ix_projects_keyset", table_name="projects")
@@ -0,0 +1,67 @@
+"""add project search vectors
+
+Revision ID: 2a3e6b0a0a9a
+Revises: 6415058e394d
+Create Date: 2026-10-18 21:02:17.408113
+
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "2a3e6b0a0a9a"
+down_revision: Optional[str] = "6415058e394d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade DB."""
+    # Adding stored generated columns rewrites the table. Titles get their own
+    # vector so the planner has statistics for title matches alone.
+    op.add_column(
+        "projects",
+        sa.Column(
+            "title_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', title)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "projects",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', title || ' ' || description)", persisted=True
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_projects_title_vector",
+        "projects",
+        ["title_vector"],
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_deleted = FALSE"),
+    )
+    op.create_index(
+        "ix_projects_search_vector",
+        "projects",
+        ["search_vector"],
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_deleted = FALSE"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade DB."""
+    op.drop_index("ix_projects_search_vector", table_name="projects")
+    op.drop_index("ix_projects_title_vector", table_name="projects")
+    op.drop_column("projects", "search_vector")
+    op.drop_column("projects", "title_vector")
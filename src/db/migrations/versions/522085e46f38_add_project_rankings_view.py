@@ -0,0 +1,91 @@
+"""add project rankings view
+
+Revision ID: 522085e46f38
+Revises: ebf465a39a8c
+Create Date: 2026-10-18 23:14:08.291734
+
+"""
+
+from typing import Optional, Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "522085e46f38"
+down_revision: Optional[str] = "ebf465a39a8c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade DB."""
+    # The top 100 open projects of each ranking. Refreshed concurrently by the
+    # app, so every row carries the time of the refresh that produced it.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW project_rankings AS
+        WITH open_projects AS (
+            SELECT id, goal_amount, amount_raised, deadline
+            FROM projects
+            WHERE is_deleted = FALSE
+            AND deadline > now()
+        ), recent_contributions AS (
+            SELECT project_id, COUNT(*) as contributions, SUM(amount) as amount
+            FROM contributions
+            WHERE is_deleted = FALSE
+            AND created_at > now() - interval '7 days'
+            GROUP BY project_id
+        )
+        SELECT ranking, position, project_id, now() as refreshed_at
+        FROM (
+            (
+                SELECT
+                    'trending'::text as ranking,
+                    row_number() OVER (
+                        ORDER BY rc.contributions DESC, rc.amount DESC, p.id
+                    ) as position,
+                    p.id as project_id
+                FROM recent_contributions rc
+                INNER JOIN open_projects p ON p.id = rc.project_id
+                ORDER BY position
+                LIMIT 100
+            )
+            UNION ALL
+            (
+                SELECT
+                    'closest_to_goal'::text,
+                    row_number() OVER (
+                        ORDER BY p.amount_raised::float8 / p.goal_amount DESC, p.id
+                    ),
+                    p.id
+                FROM open_projects p
+                WHERE p.goal_amount > 0
+                AND p.amount_raised < p.goal_amount
+                ORDER BY 2
+                LIMIT 100
+            )
+            UNION ALL
+            (
+                SELECT
+                    'ending_soon'::text,
+                    row_number() OVER (ORDER BY p.deadline, p.id),
+                    p.id
+                FROM open_projects p
+                ORDER BY 2
+                LIMIT 100
+            )
+        ) rankings
+        """
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index.
+    op.create_index(
+        "ix_project_rankings_ranking_position",
+        "project_rankings",
+        ["ranking", "position"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade DB."""
+    op.execute("DROP MATERIALIZED VIEW project_rankings")
@@ -0,0 +1,144 @@
+"""add project funding aggregates
+
+Revision ID: 6415058e394d
+Revises: 2259d4096cb1
+Create Date: 2026-10-18 10:04:51.532671
+
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "6415058e394d"
+down_revision: Optional[str] = "2259d4096cb1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def add_funding_columns() -> None:
+    """Add running funding totals to projects."""
+    op.add_column(
+        "projects",
+        sa.Column("amount_raised", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "projects",
+        sa.Column(
+            "contribution_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "projects",
+        sa.Column(
+            "contributor_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+
+
+def create_project_contributors_table() -> None:
+    """Create the distinct contributors of each project."""
+    op.create_table(
+        "project_contributors",
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            "contributor_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            "first_contributed_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=func.now(),
+        ),
+    )
+
+
+def ignore_funding_updates_in_modtime_trigger() -> None:
+    """Keep updated_at for edits to the project itself, not funding updates."""
+    op.execute("DROP TRIGGER update_projects_modtime ON projects")
+    op.execute(
+        """
+        CREATE TRIGGER update_projects_modtime
+            BEFORE UPDATE
+            ON projects
+            FOR EACH ROW
+            WHEN (
+                (OLD.owner_id, OLD.title, OLD.description, OLD.goal_amount, OLD.deadline, OLD.is_deleted)
+                IS DISTINCT FROM
+                (NEW.owner_id, NEW.title, NEW.description, NEW.goal_amount, NEW.deadline, NEW.is_deleted)
+            )
+        EXECUTE PROCEDURE update_updated_at_column()
+        """
+    )
+
+
+def backfill_funding() -> None:
+    """Compute the totals for existing contributions."""
+    op.execute(
+        """
+        INSERT INTO project_contributors (project_id, contributor_id, first_contributed_at)
+        SELECT project_id, contributor_id, MIN(created_at)
+        FROM contributions
+        WHERE is_deleted = FALSE
+        GROUP BY project_id, contributor_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE projects p
+        SET amount_raised = totals.amount_raised,
+            contribution_count = totals.contribution_count,
+            contributor_count = totals.contributor_count
+        FROM (
+            SELECT
+                project_id,
+                SUM(amount) AS amount_raised,
+                COUNT(*) AS contribution_count,
+                COUNT(DISTINCT contributor_id) AS contributor_count
+            FROM contributions
+            WHERE is_deleted = FALSE
+            GROUP BY project_id
+        ) totals
+        WHERE p.id = totals.project_id
+        """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade DB."""
+    add_funding_columns()
+    create_project_contributors_table()
+    ignore_funding_updates_in_modtime_trigger()
+    backfill_funding()
+
+
+def downgrade() -> None:
+    """Downgrade DB."""
+    op.execute("DROP TRIGGER update_projects_modtime ON projects")
+    op.execute(
+        """
+        CREATE TRIGGER update_projects_modtime
+            BEFORE UPDATE
+            ON projects
+            FOR EACH ROW
+        EXECUTE PROCEDURE update_updated_at_column()
+        """
+    )
+    op.drop_table("project_contributors")
+    op.drop_column("projects", "contributor_count")
+    op.drop_column("projects", "contribution_count")
+    op.drop_column("projects", "amount_raised")
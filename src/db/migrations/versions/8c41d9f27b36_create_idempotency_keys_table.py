@@ -0,0 +1,53 @@
+"""create idempotency keys table
+
+Revision ID: 8c41d9f27b36
+Revises: e37f81195ec1
+Create Date: 2026-10-19 10:12:53.118406
+
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import func
+
+# revision identifiers, used by Alembic.
+revision: str = "8c41d9f27b36"
+down_revision: Optional[str] = "e37f81195ec1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade DB."""
+    # One row per key. The response columns stay NULL while the first request
+    # carrying the key is in flight.
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("scope", sa.String(64), nullable=False),
+        sa.Column("key", sa.String(255), nullable=False),
+        sa.Column("fingerprint", sa.String(64), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("content_type", sa.String(255), nullable=True),
+        sa.Column("body", sa.LargeBinary(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+        sa.Column("locked_until", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "key"),
+    )
+    # Expired keys are deleted in batches, oldest first.
+    op.create_index(
+        "ix_idempotency_keys_expires_at", "idempotency_keys", ["expires_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade DB."""
+    op.drop_index("ix_idempotency_keys_expires_at", table_name="idempotency_keys")
+    op.drop_table("idempotency_keys")
@@ -0,0 +1,36 @@
+"""add project contributors keyset index
+
+Revision ID: e37f81195ec1
+Revises: 522085e46f38
+Create Date: 2026-10-19 08:41:27.604512
+
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e37f81195ec1"
+down_revision: Optional[str] = "522085e46f38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade DB."""
+    op.create_index(
+        "ix_project_contributors_keyset",
+        "project_contributors",
+        [
+            "project_id",
+            sa.text("first_contributed_at DESC"),
+            sa.text("contributor_id DESC"),
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade DB."""
+    op.drop_index("ix_project_contributors_keyset", table_name="project_contributors")
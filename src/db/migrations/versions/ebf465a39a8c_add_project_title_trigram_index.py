@@ -0,0 +1,37 @@
+"""add project title trigram index
+
+Revision ID: ebf465a39a8c
+Revises: 2a3e6b0a0a9a
+Create Date: 2026-10-18 21:05:42.730961
+
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ebf465a39a8c"
+down_revision: Optional[str] = "2a3e6b0a0a9a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade DB."""
+    # pg_trgm ships with the Postgres contrib modules.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_projects_title_trgm",
+        "projects",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+        postgresql_where=sa.text("is_deleted = FALSE"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade DB."""
+    op.drop_index("ix_projects_title_trgm", table_name="projects")
@@ -0,0 +1,145 @@
+"""Connection pool instrumentation module."""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from asyncpg import Connection
+from asyncpg.pool import Pool
+from databases import Database
+
+from src.core.metrics import registry
+from src.errors.core import ServiceUnavailableError
+
+ACQUIRE_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+POOL_ACQUIRE_SECONDS = registry.histogram(
+    "db_pool_acquire_seconds",
+    "Time spent waiting for a pooled database connection.",
+    buckets=ACQUIRE_BUCKETS,
+)
+POOL_ACQUIRE_TIMEOUTS = registry.counter(
+    "db_pool_acquire_timeouts_total",
+    "Connection acquisitions that gave up after the acquire timeout.",
+)
+POOL_RECYCLED = registry.counter(
+    "db_pool_recycled_connections_total",
+    "Connections closed on release for exceeding their maximum lifetime.",
+)
+
+
+class PoolMonitor:
+    """Proxy over the asyncpg pool used by `databases`.
+
+    Records acquire latency and waiters, applies the acquire timeout and
+    recycles connections older than the maximum lifetime when they are
+    released. Everything else is delegated to the wrapped pool.
+    """
+
+    def __init__(self, acquire_timeout: float, max_lifetime: float) -> None:
+        """Initializes the monitor before the pool exists."""
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.waiters = 0
+        self._pool: Optional[Pool] = None
+        self._opened_at: dict[int, float] = {}
+
+    async def init_connection(self, connection: Connection) -> None:
+        """Remember when each new connection was opened. Used as pool `init`."""
+        self._opened_at[connection.get_server_pid()] = time.monotonic()
+
+    def attach(self, database: Database) -> None:
+        """Install the monitor in front of the pool of a connected database."""
+        self._pool = database._backend._pool  # type: ignore
+        database._backend._pool = self  # type: ignore
+
+    async def acquire(self) -> Any:
+        """Acquire a connection, giving up after the acquire timeout."""
+        self.waiters += 1
+        started = time.perf_counter()
+        try:
+            return await self._pool.acquire(timeout=self.acquire_timeout)  # type: ignore
+        except asyncio.TimeoutError:
+            POOL_ACQUIRE_TIMEOUTS.inc()
+            raise ServiceUnavailableError("Database connection pool exhausted")
+        finally:
+            self.waiters -= 1
+            POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - started)
+
+    async def release(self, connection: Any) -> None:
+        """Release a connection, closing it first if it outlived max lifetime."""
+        pid = connection.get_server_pid()
+        opened_at = self._opened_at.get(pid)
+        if (
+            self.max_lifetime > 0
+            and opened_at is not None
+            and time.monotonic() - opened_at > self.max_lifetime
+        ):
+            self._opened_at.pop(pid, None)
+            POOL_RECYCLED.inc()
+            await connection.close()
+        await self._pool.release(connection)  # type: ignore
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate the rest of the pool API."""
+        return getattr(self._pool, name)
+
+    def stats(self) -> dict:
+        """Return a snapshot of pool usage and acquire latency."""
+        size = self._pool.get_size() if self._pool else 0
+        idle = self._pool.get_idle_size() if self._pool else 0
+        latency = POOL_ACQUIRE_SECONDS.labels()
+        return {
+            "min_size": self._pool.get_min_size() if self._pool else 0,
+            "max_size": self._pool.get_max_size() if self._pool else 0,
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "waiters": self.waiters,
+            "acquire_timeout_seconds": self.acquire_timeout,
+            "max_lifetime_seconds": self.max_lifetime,
+            "acquire_timeouts": int(POOL_ACQUIRE_TIMEOUTS.labels().value),
+            "recycled_connections": int(POOL_RECYCLED.labels().value),
+            "acquire_seconds": {
+                "count": latency.count,
+                "sum": latency.sum,
+                "p50": latency.quantile(0.5),
+                "p95": latency.quantile(0.95),
+                "p99": latency.quantile(0.99),
+                "buckets": {
+                    str(bound): count
+                    for bound, count in zip((*latency.buckets, "+Inf"), latency.counts)
+                },
+            },
+        }
+
+
+def register_pool_gauges(monitor: PoolMonitor) -> None:
+    """Expose the live pool state through the metrics registry."""
+    registry.gauge(
+        "db_pool_connections", "Pooled connections by state.", ("state",)
+    ).set_function(
+        lambda: {
+            (state,): value
+            for state, value in monitor.stats().items()
+            if state in ("in_use", "idle")
+        }
+    )
+    registry.gauge(
+        "db_pool_waiters", "Tasks waiting for a pooled connection."
+    ).set_function(lambda: monitor.waiters)
@@ -0,0 +1,172 @@
+"""Read replica routing module."""
+
+import asyncio
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, List, Optional
+
+from asyncpg.exceptions import (
+    CannotConnectNowError,
+    InterfaceError,
+    PostgresConnectionError,
+)
+from databases import Database
+
+from src.core.metrics import registry
+
+app_logger = logging.getLogger("app")
+
+READS = registry.counter(
+    "db_reads_total", "Repository reads by the database that served them.", ("target",)
+)
+REPLICA_FAILURES = registry.counter(
+    "db_replica_failures_total",
+    "Replica reads that failed and were retried on the primary.",
+    ("replica",),
+)
+
+read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+REPLICA_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    PostgresConnectionError,
+    CannotConnectNowError,
+    InterfaceError,
+)
+
+
+class Replica:
+    """A replica database and its health."""
+
+    def __init__(self, name: str, database: Database) -> None:
+        """Initializes the replica as not yet connected."""
+        self.name = name
+        self.database = database
+        self.connected = False
+        self.down_until = 0.0
+
+    async def connect(self) -> None:
+        """Connect if not connected yet."""
+        if not self.connected:
+            await self.database.connect()
+            self.connected = True
+
+    async def disconnect(self) -> None:
+        """Close the replica pool."""
+        if self.connected:
+            await self.database.disconnect()
+            self.connected = False
+
+
+class ReadDatabase:
+    """Routes read queries to replicas, falling back to the primary.
+
+    Reads go to the primary when no replica is configured or healthy, and
+    while `read_from_primary` is set for the current request (writes and the
+    read-your-writes window after them). A replica that fails is skipped for
+    `retry_after` seconds.
+    """
+
+    def __init__(
+        self, primary: Database, replicas: List[Replica], retry_after: float
+    ) -> None:
+        """Initializes the router with the primary and replica databases."""
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_after = retry_after
+        self._next = itertools.cycle(range(len(replicas) or 1))
+
+    async def _replica(self) -> Optional[Replica]:
+        """Pick the next healthy replica, or None to use the primary."""
+        if not self.replicas or read_from_primary.get():
+            return None
+        now = time.monotonic()
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._next)]
+            if replica.down_until > now:
+                continue
+            try:
+                await replica.connect()
+            except REPLICA_ERRORS:
+                self._mark_down(replica)
+                continue
+            return replica
+        return None
+
+    def _mark_down(self, replica: Replica) -> None:
+        """Skip a failing replica for a while."""
+        REPLICA_FAILURES.labels(replica.name).inc()
+        replica.down_until = time.monotonic() + self.retry_after
+        app_logger.warning(
+            f"Replica {replica.name} unavailable, reading from primary", exc_info=True
+        )
+
+    async def _run(self, method: str, query: Any, values: Optional[dict]) -> Any:
+        """Run a read on a replica, retrying on the primary if it fails."""
+        replica = await self._replica()
+        if replica is not None:
+            try:
+                result = await getattr(replica.database, method)(
+                    query=query, values=values
+                )
+                READS.labels("replica").inc()
+                return result
+            except REPLICA_ERRORS:
+                self._mark_down(replica)
+        READS.labels("primary").inc()
+        return await getattr(self.primary, method)(query=query, values=values)
+
+    async def fetch_one(self, query: Any, values: Optional[dict] = None) -> Any:
+        """Fetch a single row."""
+        return await self._run("fetch_one", query, values)
+
+    async def fetch_all(self, query: Any, values: Optional[dict] = None) -> List[Any]:
+        """Fetch every row."""
+        return await self._run("fetch_all", query, values)
+
+    async def fetch_val(self, query: Any, values: Optional[dict] = None) -> Any:
+        """Fetch the first column of the first row."""
+        return await self._run("fetch_val", query, values)
+
+    async def iterate(
+        self, query: Any, values: Optional[dict] = None
+    ) -> AsyncGenerator[Any, None]:
+        """Iterate over rows. Falls back only if no row was produced yet."""
+        replica = await self._replica()
+        if replica is not None:
+            started = False
+            try:
+                async for record in replica.database.iterate(
+                    query=query, values=values
+                ):
+                    started = True
+                    yield record
+                READS.labels("replica").inc()
+                return
+            except REPLICA_ERRORS:
+                if started:
+                    raise
+                self._mark_down(replica)
+        READS.labels("primary").inc()
+        async for record in self.primary.iterate(query=query, values=values):
+            yield record
+
+    async def disconnect(self) -> None:
+        """Close every replica pool."""
+        for replica in self.replicas:
+            await replica.disconnect()
+
+    def stats(self) -> list[dict]:
+        """Return the health of each replica."""
+        now = time.monotonic()
+        return [
+            {
+                "name": replica.name,
+                "connected": replica.connected,
+                "healthy": replica.down_until <= now,
+            }
+            for replica in self.replicas
+        ]
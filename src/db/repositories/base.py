@@ -1,18 +1,22 @@
 """Base Repository."""
 
 # Third party imports
-
+from typing import Optional, Union
 
 from databases import Database
 
+from src.db.replicas import ReadDatabase
+
 
 class BaseRepository:
     """Base class for Postgres repositories."""
 
-    def __init__(self, db: Database) -> None:
+    def __init__(self, db: Database, read_db: Optional[ReadDatabase] = None) -> None:
         """Initialize with Postgres database instance.
 
         Args:
             db (Database): An instance of the Database database.
+            read_db (ReadDatabase): Routes reads to replicas. Defaults to db.
         """
         self.db = db
+        self.read_db: Union[Database, ReadDatabase] = read_db or db
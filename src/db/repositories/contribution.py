@@ -1,21 +1,123 @@
 """Contribution repository."""
 
+import uuid
+from typing import Any, List, Optional, Union
 from uuid import UUID
 
 from databases import Database
+from pydantic import ValidationError
 
+from src.core.batching import BatcherStoppedError, GroupCommitBatcher
+from src.core.config import (
+    CONTRIBUTION_GROUP_COMMIT_MAX_DELAY_MS,
+    CONTRIBUTION_GROUP_COMMIT_MAX_ROWS,
+)
+from src.db.replicas import ReadDatabase
 from src.db.repositories.base import BaseRepository
 from src.decorators.db import handle_post_database_exceptions
-from src.errors.database import FailedToCreateEntityError
-from src.models.contribution import ContributionCreate, ContributionInDb
+from src.errors.database import (
+    DatabaseError,
+    FailedToCreateEntityError,
+    NotFoundError,
+    ProjectDeadlinePassedError,
+)
+from src.models.contribution import (
+    ContributionBulkCreate,
+    ContributionBulkResponse,
+    ContributionBulkResult,
+    ContributionCreate,
+    ContributionInDb,
+)
+from src.services.cache import cache
 from src.utils.helpers import Helpers
 
 CREATE_CONTRIBUTION_QUERY = """
-    INSERT INTO contributions (id, project_id, contributor_id, amount)
-    VALUES (:id, :project_id, :contributor_id, :amount)
-    RETURNING id, project_id, contributor_id, amount, created_at, updated_at, is_deleted;
+    WITH project AS (
+        SELECT id, deadline > now() as is_open
+        FROM projects
+        WHERE id = :project_id AND is_deleted = FALSE
+        FOR UPDATE
+    ),
+    created AS (
+        INSERT INTO contributions (id, project_id, contributor_id, amount)
+        SELECT :id, project.id, :contributor_id, :amount
+        FROM project
+        WHERE project.is_open
+        RETURNING id, project_id, contributor_id, amount, created_at, updated_at, is_deleted
+    ),
+    new_contributor AS (
+        INSERT INTO project_contributors (project_id, contributor_id)
+        SELECT project_id, contributor_id FROM created
+        ON CONFLICT DO NOTHING
+        RETURNING project_id
+    ),
+    funding AS (
+        UPDATE projects p
+        SET amount_raised = p.amount_raised + created.amount,
+            contribution_count = p.contribution_count + 1,
+            contributor_count = p.contributor_count + (
+                SELECT COUNT(*) FROM new_contributor
+            )
+        FROM created
+        WHERE p.id = created.project_id
+    )
+    SELECT project.is_open, created.*
+    FROM project
+    LEFT JOIN created ON TRUE;
+"""
+
+GET_TRANSACTION_TIMESTAMP_QUERY = """
+    SELECT now() as now, CAST(now() AS timestamp) as local_now;
+"""
+
+LOCK_CONTRIBUTION_PROJECTS_QUERY = """
+    SELECT id, deadline
+    FROM projects
+    WHERE id = ANY(:ids) AND is_deleted = FALSE
+    ORDER BY id
+    FOR UPDATE;
+"""
+
+GET_ACTIVE_USER_IDS_QUERY = """
+    SELECT user_id
+    FROM users
+    WHERE user_id = ANY(:ids) AND is_deleted = FALSE;
 """
 
+UPDATE_PROJECTS_FUNDING_BULK_QUERY = """
+    WITH new_contributors AS (
+        INSERT INTO project_contributors (project_id, contributor_id, first_contributed_at)
+        SELECT DISTINCT r.project_id, r.contributor_id, CAST(:created_at AS timestamp)
+        FROM unnest(CAST(:project_ids AS uuid[]), CAST(:contributor_ids AS uuid[]))
+            AS r(project_id, contributor_id)
+        ON CONFLICT DO NOTHING
+        RETURNING project_id
+    ),
+    funding AS (
+        SELECT r.project_id, SUM(r.amount) as amount, COUNT(*) as contributions
+        FROM unnest(CAST(:project_ids AS uuid[]), CAST(:amounts AS integer[]))
+            AS r(project_id, amount)
+        GROUP BY r.project_id
+    )
+    UPDATE projects p
+    SET amount_raised = p.amount_raised + funding.amount,
+        contribution_count = p.contribution_count + funding.contributions,
+        contributor_count = p.contributor_count + (
+            SELECT COUNT(*) FROM new_contributors nc WHERE nc.project_id = p.id
+        )
+    FROM funding
+    WHERE p.id = funding.project_id;
+"""
+
+CONTRIBUTION_COPY_COLUMNS = [
+    "id",
+    "project_id",
+    "contributor_id",
+    "amount",
+    "created_at",
+    "updated_at",
+]
+
 GET_CONTRIBUTION_BY_ID_QUERY = """
     SELECT id, project_id, contributor_id, amount, created_at, updated_at, is_deleted
     FROM contributions
@@ -36,13 +138,20 @@ GET_CONTRIBUTIONS_BY_CONTRIBUTOR_ID_QUERY = """
     ORDER BY created_at DESC;
 """
 
+# Started at app startup when CONTRIBUTION_GROUP_COMMIT is on.
+contribution_batcher = GroupCommitBatcher(
+    "contributions",
+    max_size=CONTRIBUTION_GROUP_COMMIT_MAX_ROWS,
+    max_delay=CONTRIBUTION_GROUP_COMMIT_MAX_DELAY_MS / 1000,
+)
+
 
 class ContributionRepository(BaseRepository):
     """Contains logic for all contribution operations."""
 
-    def __init__(self, db: Database) -> None:
-        """Initializes the ContributionRepository with the database instance."""
-        super().__init__(db)
+    def __init__(self, db: Database, read_db: Optional[ReadDatabase] = None) -> None:
+        """Initializes the ContributionRepository with the database instances."""
+        super().__init__(db, read_db)
 
     @handle_post_database_exceptions(
         "Contribution", already_exists_entity="Contribution ID"
@@ -50,10 +159,30 @@ class ContributionRepository(BaseRepository):
     async def create_contribution(
         self, *, project_id: UUID, new_contribution: ContributionCreate
     ) -> ContributionInDb:
-        """Creates a new contribution."""
+        """Creates a new contribution.
+
+        The project lookup, deadline check, insert and funding update run as
+        a single statement, so a missing or closed project costs one round
+        trip and cannot change between the check and the insert.
+
+        With group commit on, the contribution is queued instead and written
+        with others in one transaction by insert_contributions. It returns
+        once that transaction has committed.
+        """
+        if contribution_batcher.running:
+            try:
+                return await contribution_batcher.submit(
+                    ContributionBulkCreate(
+                        project_id=project_id, **new_contribution.model_dump()
+                    )
+                )
+            except BatcherStoppedError:
+                # Stopped since the check, e.g. during shutdown: write directly.
+                pass
+
         id_ = await Helpers.generate_uuid()
         contribution = new_contribution.model_dump()
-        
+
         contribution["id"] = id_
         contribution["project_id"] = project_id
 
@@ -61,5 +190,157 @@ class ContributionRepository(BaseRepository):
             query=CREATE_CONTRIBUTION_QUERY, values=contribution
         )
         if not created_contribution:
+            raise NotFoundError(
+                entity_name="Project", entity_identifier=str(project_id)
+            )
+        if not created_contribution["is_open"]:
+            raise ProjectDeadlinePassedError()
+        if not created_contribution["id"]:
             raise FailedToCreateEntityError(entity_name="Contribution.")
-        return ContributionInDb(**created_contribution)  # type: ignore
+
+        await cache.delete("project", project_id=project_id)
+        await cache.bump_version("projects_page")
+        contribution_data = dict(created_contribution)  # type: ignore
+        del contribution_data["is_open"]
+        return ContributionInDb.from_record(contribution_data)
+
+    @handle_post_database_exceptions("Contribution")
+    async def create_contributions_bulk(
+        self, *, rows: List[dict[str, Any]]
+    ) -> ContributionBulkResponse:
+        """Validates and imports a batch of contributions in one transaction."""
+        results: List[ContributionBulkResult] = []
+        valid: List[tuple[int, ContributionBulkCreate]] = []
+        for index, row in enumerate(rows):
+            try:
+                valid.append((index, ContributionBulkCreate.model_validate(row)))
+            except ValidationError as e:
+                error = e.errors()[0]
+                location = ".".join(str(part) for part in error["loc"])
+                results.append(
+                    ContributionBulkResult(
+                        index=index,
+                        status="rejected",
+                        error=(
+                            f"{location}: {error['msg']}" if location else error["msg"]
+                        ),
+                    )
+                )
+
+        outcomes = await self.insert_contributions(
+            contributions=[contribution for _, contribution in valid]
+        )
+        for (index, _), outcome in zip(valid, outcomes):
+            if isinstance(outcome, DatabaseError):
+                results.append(
+                    ContributionBulkResult(
+                        index=index, status="rejected", error=outcome.message
+                    )
+                )
+            else:
+                results.append(
+                    ContributionBulkResult(
+                        index=index, status="created", contribution=outcome
+                    )
+                )
+
+        results.sort(key=lambda result: result.index)
+        created = sum(1 for result in results if result.status == "created")
+        return ContributionBulkResponse(
+            created=created, rejected=len(results) - created, results=results
+        )
+
+    async def insert_contributions(
+        self, *, contributions: List[ContributionBulkCreate]
+    ) -> List[Union[ContributionInDb, DatabaseError]]:
+        """Inserts validated contributions with COPY in a single transaction.
+
+        Deadlines and contributors are checked once per distinct project and
+        user. Returns, in input order, the created contribution or the error
+        that rejected each row.
+        """
+        if not contributions:
+            return []
+
+        project_ids = sorted({str(c.project_id) for c in contributions})
+        contributor_ids = list({str(c.contributor_id) for c in contributions})
+        outcomes: List[Union[ContributionInDb, DatabaseError]] = []
+
+        async with self.db.transaction():
+            timestamps = await self.db.fetch_one(query=GET_TRANSACTION_TIMESTAMP_QUERY)
+            now, local_now = timestamps["now"], timestamps["local_now"]  # type: ignore
+            deadlines = {
+                str(record["id"]): record["deadline"]
+                for record in await self.db.fetch_all(
+                    query=LOCK_CONTRIBUTION_PROJECTS_QUERY, values={"ids": project_ids}
+                )
+            }
+            active_users = {
+                str(record["user_id"])
+                for record in await self.db.fetch_all(
+                    query=GET_ACTIVE_USER_IDS_QUERY, values={"ids": contributor_ids}
+                )
+            }
+
+            accepted: List[ContributionInDb] = []
+            for contribution in contributions:
+                project_id = str(contribution.project_id)
+                if project_id not in deadlines:
+                    outcomes.append(
+                        NotFoundError(
+                            entity_name="Project", entity_identifier=project_id
+                        )
+                    )
+                elif deadlines[project_id] < now:
+                    outcomes.append(ProjectDeadlinePassedError())
+                elif str(contribution.contributor_id) not in active_users:
+                    outcomes.append(
+                        NotFoundError(
+                            entity_name="Contributor",
+                            entity_identifier=str(contribution.contributor_id),
+                        )
+                    )
+                else:
+                    # Built from an already validated row.
+                    created = ContributionInDb.model_construct(
+                        id=uuid.uuid4(),
+                        project_id=contribution.project_id,
+                        contributor_id=contribution.contributor_id,
+                        amount=contribution.amount,
+                        created_at=local_now,
+                        updated_at=local_now,
+                    )
+                    accepted.append(created)
+                    outcomes.append(created)
+
+            if accepted:
+                raw_connection = self.db.connection().raw_connection
+                await raw_connection.copy_records_to_table(
+                    "contributions",
+                    records=[
+                        (
+                            c.id,
+                            c.project_id,
+                            c.contributor_id,
+                            c.amount,
+                            c.created_at,
+                            c.updated_at,
+                        )
+                        for c in accepted
+                    ],
+                    columns=CONTRIBUTION_COPY_COLUMNS,
+                )
+                await self.db.execute(
+                    query=UPDATE_PROJECTS_FUNDING_BULK_QUERY,
+                    values={
+                        "created_at": local_now,
+                        "project_ids": [str(c.project_id) for c in accepted],
+                        "contributor_ids": [str(c.contributor_id) for c in accepted],
+                        "amounts": [c.amount for c in accepted],
+                    },
+                )
+
+        for project_id in {str(c.project_id) for c in contributions}:
+            await cache.delete("project", project_id=project_id)
+        await cache.bump_version("projects_page")
+        return outcomes
@@ -0,0 +1,178 @@
+"""Idempotency key repository."""
+
+from typing import Optional
+
+from databases import Database
+from databases.interfaces import Record
+
+from src.db.replicas import ReadDatabase
+from src.db.repositories.base import BaseRepository
+from src.decorators.db import (
+    handle_get_database_exceptions,
+    handle_post_database_exceptions,
+)
+
+# Takes a new key, or one whose stored response expired or whose request
+# stopped holding it. Returns no row if the key is held or already answered.
+CLAIM_IDEMPOTENCY_KEY_QUERY = """
+    INSERT INTO idempotency_keys (scope, key, fingerprint, locked_until, expires_at)
+    VALUES (
+        :scope,
+        :key,
+        :fingerprint,
+        now() + make_interval(secs => :lock_seconds),
+        now() + make_interval(secs => :ttl_seconds)
+    )
+    ON CONFLICT (scope, key) DO UPDATE
+    SET fingerprint = EXCLUDED.fingerprint,
+        status_code = NULL,
+        content_type = NULL,
+        body = NULL,
+        created_at = now(),
+        locked_until = EXCLUDED.locked_until,
+        expires_at = EXCLUDED.expires_at
+    WHERE idempotency_keys.expires_at <= now()
+    OR (
+        idempotency_keys.status_code IS NULL
+        AND idempotency_keys.locked_until <= now()
+    )
+    RETURNING TRUE as claimed;
+"""
+
+GET_IDEMPOTENCY_KEY_QUERY = """
+    SELECT fingerprint, status_code, content_type, body
+    FROM idempotency_keys
+    WHERE scope = :scope AND key = :key AND expires_at > now();
+"""
+
+COMPLETE_IDEMPOTENCY_KEY_QUERY = """
+    UPDATE idempotency_keys
+    SET status_code = :status_code,
+        content_type = :content_type,
+        body = :body,
+        locked_until = NULL
+    WHERE scope = :scope
+    AND key = :key
+    AND fingerprint = :fingerprint
+    AND status_code IS NULL;
+"""
+
+RELEASE_IDEMPOTENCY_KEY_QUERY = """
+    DELETE FROM idempotency_keys
+    WHERE scope = :scope
+    AND key = :key
+    AND fingerprint = :fingerprint
+    AND status_code IS NULL;
+"""
+
+DELETE_EXPIRED_IDEMPOTENCY_KEYS_QUERY = """
+    WITH expired AS (
+        SELECT scope, key
+        FROM idempotency_keys
+        WHERE expires_at <= now()
+        ORDER BY expires_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ), deleted AS (
+        DELETE FROM idempotency_keys k
+        USING expired
+        WHERE k.scope = expired.scope AND k.key = expired.key
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM deleted;
+"""
+
+
+class IdempotencyRepository(BaseRepository):
+    """Contains logic for all idempotency key operations."""
+
+    def __init__(self, db: Database, read_db: Optional[ReadDatabase] = None) -> None:
+        """Initializes the IdempotencyRepository with the database instances."""
+        super().__init__(db, read_db)
+
+    @handle_post_database_exceptions("Idempotency key")
+    async def claim(
+        self,
+        *,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        lock_seconds: float,
+        ttl_seconds: float,
+    ) -> bool:
+        """Claims a key for the request with this fingerprint.
+
+        Returns False if another request holds the key or has answered it.
+        A holder that has not answered within `lock_seconds` is taken to have
+        died, and the key can be claimed again.
+        """
+        claimed = await self.db.fetch_val(
+            query=CLAIM_IDEMPOTENCY_KEY_QUERY,
+            values={
+                "scope": scope,
+                "key": key,
+                "fingerprint": fingerprint,
+                "lock_seconds": lock_seconds,
+                "ttl_seconds": ttl_seconds,
+            },
+        )
+        return bool(claimed)
+
+    @handle_get_database_exceptions("Idempotency key")
+    async def get(self, *, scope: str, key: str) -> Optional[Record]:
+        """Gets a key with its stored response, if it has one yet.
+
+        Read from the primary: the request holding the key writes there.
+        """
+        return await self.db.fetch_one(
+            query=GET_IDEMPOTENCY_KEY_QUERY, values={"scope": scope, "key": key}
+        )
+
+    @handle_post_database_exceptions("Idempotency key")
+    async def complete(
+        self,
+        *,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        status_code: int,
+        content_type: Optional[str],
+        body: bytes,
+    ) -> None:
+        """Stores the response to replay for a claimed key."""
+        await self.db.execute(
+            query=COMPLETE_IDEMPOTENCY_KEY_QUERY,
+            values={
+                "scope": scope,
+                "key": key,
+                "fingerprint": fingerprint,
+                "status_code": status_code,
+                "content_type": content_type,
+                "body": body,
+            },
+        )
+
+    @handle_post_database_exceptions("Idempotency key")
+    async def release(self, *, scope: str, key: str, fingerprint: str) -> None:
+        """Gives up a claimed key, so a retry runs the request again."""
+        await self.db.execute(
+            query=RELEASE_IDEMPOTENCY_KEY_QUERY,
+            values={"scope": scope, "key": key, "fingerprint": fingerprint},
+        )
+
+    @handle_post_database_exceptions("Idempotency key")
+    async def delete_expired(self, *, batch_size: int) -> int:
+        """Deletes expired keys in batches of `batch_size`.
+
+        Each batch is its own statement, so no lock is held for long. Returns
+        the number of keys deleted.
+        """
+        total = 0
+        while True:
+            deleted = await self.db.fetch_val(
+                query=DELETE_EXPIRED_IDEMPOTENCY_KEYS_QUERY,
+                values={"batch_size": batch_size},
+            )
+            total += deleted
+            if deleted < batch_size:
+                return total
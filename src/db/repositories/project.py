@@ -1,75 +1,366 @@
 """Project repository."""
 
-from typing import List, Optional
+import json
+import re
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
 from databases import Database
 
+from src.core.config import (
+    PROJECT_CACHE_NOT_FOUND_TTL_SECONDS,
+    PROJECT_CONTRIBUTORS_PREVIEW_SIZE,
+    PROJECT_CACHE_TTL_SECONDS,
+    PROJECT_PAGE_CACHE_TTL_SECONDS,
+    PROJECT_RANKINGS_MAX_STALENESS_SECONDS,
+    PROJECT_SEARCH_FUZZY,
+    PROJECT_SEARCH_ESTIMATE_CACHE_SIZE,
+    PROJECT_SEARCH_ESTIMATE_TTL_SECONDS,
+    PROJECT_SEARCH_INDEX_WALK_MIN_ROWS,
+)
+from src.db.replicas import ReadDatabase
 from src.db.repositories.base import BaseRepository
+from src.decorators.cache import cached_read
 from src.decorators.db import (
     handle_get_database_exceptions,
     handle_post_database_exceptions,
 )
-from src.errors.database import FailedToCreateEntityError, NotFoundError
-from src.models.project import ProjectCreate, ProjectInDb
+from src.errors.database import (
+    BadRequestError,
+    FailedToCreateEntityError,
+    NotFoundError,
+)
+from src.models.project import (
+    ProjectContributor,
+    ProjectContributorPage,
+    ProjectCreate,
+    ProjectInDb,
+    ProjectPage,
+    ProjectPublic,
+    ProjectRanking,
+)
+from src.services.cache import cache
+from src.utils.cache import TTLCache
+from src.utils.etag import ETag
 from src.utils.helpers import Helpers
+from src.utils.pagination import Pagination
 
 CREATE_PROJECT_QUERY = """
     INSERT INTO projects (id, owner_id, title, description, goal_amount, deadline)
     VALUES (:id, :owner_id, :title, :description, :goal_amount, :deadline)
-    RETURNING id, owner_id, title, description, goal_amount, deadline, created_at, updated_at, is_deleted;
+    RETURNING id, owner_id, title, description, goal_amount, deadline, created_at, updated_at, is_deleted,
+        amount_raised, contribution_count;
 """
 
-GET_PROJECT_CONTRIBUTORS_QUERY = """
-    SELECT
-        u.username,
-    FROM contributions c
-    INNER JOIN users u ON c.contributor_id = u.user_id
-    WHERE c.id = :id
-    AND c.is_deleted = FALSE
-    ORDER BY c.created_at DESC;
+GET_PROJECT_CONTRIBUTORS_PAGE_QUERY = """
+    SELECT u.username, pc.first_contributed_at, pc.contributor_id
+    FROM project_contributors pc
+    INNER JOIN projects p ON p.id = pc.project_id AND p.is_deleted = FALSE
+    INNER JOIN users u ON pc.contributor_id = u.user_id
+    WHERE pc.project_id = :project_id
+    {where_clause}
+    ORDER BY pc.first_contributed_at DESC, pc.contributor_id DESC
+    LIMIT :limit
 """
 
 GET_PROJECT_QUERY = """
-    WITH project_data AS (
-        SELECT
-            p.id,
-            p.owner_id,
-            p.title,
-            p.description,
-            p.goal_amount,
-            p.deadline,
-            p.created_at,
-            p.updated_at,
-            COUNT(DISTINCT c.contributor_id) as total_contributions,
-            ARRAY_AGG(DISTINCT u.username) FILTER (WHERE u.username IS NOT NULL) as contributors
+    SELECT
+        p.id,
+        p.owner_id,
+        p.title,
+        p.description,
+        p.goal_amount,
+        p.deadline,
+        p.created_at,
+        p.updated_at,
+        p.contributor_count as total_contributions,
+        p.amount_raised,
+        p.contribution_count,
+        ARRAY(
+            SELECT u.username
+            FROM project_contributors pc
+            INNER JOIN users u ON pc.contributor_id = u.user_id
+            WHERE pc.project_id = p.id
+            ORDER BY pc.first_contributed_at DESC, pc.contributor_id DESC
+            LIMIT :contributors_preview
+        ) as contributors
+    FROM projects p
+    WHERE p.is_deleted = FALSE
+    {where_clause}
+    ORDER BY p.created_at DESC
+"""
+
+# Everything a project's ETag depends on, read from the row by primary key.
+GET_PROJECT_VERSION_QUERY = """
+    SELECT id, updated_at, contribution_count, amount_raised, contributor_count
+    FROM projects
+    WHERE id = :id AND is_deleted = FALSE
+"""
+
+GET_PROJECTS_PAGE_QUERY = """
+    SELECT
+        p.id,
+        p.owner_id,
+        p.title,
+        p.description,
+        p.goal_amount,
+        p.deadline,
+        p.created_at,
+        p.updated_at,
+        p.contributor_count as total_contributions,
+        p.amount_raised,
+        p.contribution_count,
+        ARRAY(
+            SELECT u.username
+            FROM project_contributors pc
+            INNER JOIN users u ON pc.contributor_id = u.user_id
+            WHERE pc.project_id = p.id
+            ORDER BY pc.first_contributed_at DESC, pc.contributor_id DESC
+            LIMIT :contributors_preview
+        ) as contributors
+    FROM projects p
+    WHERE p.is_deleted = FALSE
+    {where_clause}
+    ORDER BY p.created_at DESC, p.id DESC
+    LIMIT :limit
+"""
+
+# One plan estimating both ranks: an Append with a child per rank.
+ESTIMATE_SEARCH_MATCHES_QUERY = """
+    EXPLAIN (FORMAT JSON)
+    SELECT 1 FROM projects p WHERE p.is_deleted = FALSE AND {title_match}
+    UNION ALL
+    SELECT 1 FROM projects p WHERE p.is_deleted = FALSE AND {other_match}
+"""
+
+# Few matches: collect them all through the GIN index, then sort.
+SEARCH_RANK_FROM_MATCHES = """
+        SELECT id, created_at, {rank} as rank
+        FROM (
+            SELECT p.id, p.created_at
+            FROM projects p
+            WHERE p.is_deleted = FALSE
+            AND {match}
+            OFFSET 0
+        ) matches
+        WHERE TRUE
+        {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+"""
+
+# Many matches: walk the keyset index and stop after a page.
+SEARCH_RANK_FROM_INDEX = """
+        SELECT p.id, p.created_at, {rank} as rank
         FROM projects p
-        LEFT JOIN contributions c ON p.id = c.project_id AND c.is_deleted = FALSE
-        LEFT JOIN users u ON c.contributor_id = u.user_id
         WHERE p.is_deleted = FALSE
+        AND {match}
+        {keyset}
+        ORDER BY p.created_at DESC, p.id DESC
+        LIMIT :limit
+"""
+
+SEARCH_TITLE_MATCH = (
+    "(p.title_vector @@ to_tsquery('english', '{tsquery}'){fuzzy_match})"
+)
+SEARCH_OTHER_MATCH = (
+    "p.search_vector @@ to_tsquery('english', '{tsquery}') AND NOT {title_match}"
+)
+
+SEARCH_PROJECTS_QUERY = """
+    WITH page AS (
+        SELECT id, created_at, rank
+        FROM ({ranks}) ranks
+        ORDER BY rank DESC, created_at DESC, id DESC
+        LIMIT :limit
+    )
+    SELECT
+        p.id,
+        p.owner_id,
+        p.title,
+        p.description,
+        p.goal_amount,
+        p.deadline,
+        p.created_at,
+        p.updated_at,
+        p.contributor_count as total_contributions,
+        p.amount_raised,
+        p.contribution_count,
+        ARRAY(
+            SELECT u.username
+            FROM project_contributors pc
+            INNER JOIN users u ON pc.contributor_id = u.user_id
+            WHERE pc.project_id = p.id
+            ORDER BY pc.first_contributed_at DESC, pc.contributor_id DESC
+            LIMIT :contributors_preview
+        ) as contributors,
+        page.rank
+    FROM page
+    INNER JOIN projects p ON p.id = page.id
+    ORDER BY page.rank DESC, page.created_at DESC, page.id DESC
+"""
+
+# Trigram matching on titles catches typos, using the pg_trgm index.
+SEARCH_FUZZY_MATCH = " OR :text <% p.title"
+SEARCH_MAX_TERMS = 8
+
+# Planner estimates of matches per rank, by search text.
+search_estimates = TTLCache(
+    max_size=PROJECT_SEARCH_ESTIMATE_CACHE_SIZE,
+    ttl=PROJECT_SEARCH_ESTIMATE_TTL_SECONDS,
+    name="search_estimates",
+)
+
+GET_PROJECT_RANKING_QUERY = """
+    SELECT
+        p.id,
+        p.owner_id,
+        p.title,
+        p.description,
+        p.goal_amount,
+        p.deadline,
+        p.created_at,
+        p.updated_at,
+        p.contributor_count as total_contributions,
+        p.amount_raised,
+        p.contribution_count,
+        ARRAY(
+            SELECT u.username
+            FROM project_contributors pc
+            INNER JOIN users u ON pc.contributor_id = u.user_id
+            WHERE pc.project_id = p.id
+            ORDER BY pc.first_contributed_at DESC, pc.contributor_id DESC
+            LIMIT :contributors_preview
+        ) as contributors
+    FROM project_rankings r
+    INNER JOIN projects p ON p.id = r.project_id
+    WHERE r.ranking = :ranking
+    AND p.is_deleted = FALSE
+    AND p.deadline > now()
+    ORDER BY r.position
+    LIMIT :limit
+"""
+
+# Read apart from the rows: a ranking can be empty, and an empty view has no
+# refresh time at all, which counts as stale.
+GET_PROJECT_RANKINGS_REFRESHED_AT_QUERY = """
+    SELECT
+        max(refreshed_at) as refreshed_at,
+        coalesce(
+            max(refreshed_at) < now() - make_interval(secs => :max_staleness),
+            TRUE
+        ) as stale
+    FROM project_rankings
+"""
+
+# Every app instance refreshes on a timer; the lock lets one at a time through.
+LOCK_PROJECT_RANKINGS_QUERY = (
+    "SELECT pg_advisory_xact_lock(hashtext('project_rankings'))"
+)
+TRY_LOCK_PROJECT_RANKINGS_QUERY = (
+    "SELECT pg_try_advisory_xact_lock(hashtext('project_rankings'))"
+)
+PROJECT_RANKINGS_FRESH_QUERY = """
+    SELECT EXISTS (
+        SELECT 1
+        FROM project_rankings
+        WHERE refreshed_at > now() - make_interval(secs => :max_age)
+    )
+"""
+REFRESH_PROJECT_RANKINGS_QUERY = (
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY project_rankings"
+)
+# Trending, closest to goal and ending soon keep this many projects each.
+PROJECT_RANKING_SIZE = 100
+
+LOCK_PROJECTS_QUERY = """
+    SELECT id
+    FROM projects
+    WHERE id = ANY(:ids)
+    ORDER BY id
+    FOR UPDATE;
+"""
+
+GET_PROJECT_FUNDING_DRIFT_QUERY = """
+    WITH chunk AS (
+        SELECT id, amount_raised, contribution_count, contributor_count
+        FROM projects
         {where_clause}
-        GROUP BY
-            p.id,
-            p.owner_id,
-            p.title,
-            p.description,
-            p.goal_amount,
-            p.deadline,
-            p.created_at,
-            p.updated_at
-        ORDER BY p.created_at DESC
+        ORDER BY id
+        LIMIT :chunk_size
     )
-    SELECT *
-    FROM project_data
+    SELECT
+        chunk.id,
+        chunk.amount_raised as stored_amount_raised,
+        chunk.contribution_count as stored_contribution_count,
+        chunk.contributor_count as stored_contributor_count,
+        (
+            SELECT COUNT(*)
+            FROM project_contributors pc
+            WHERE pc.project_id = chunk.id
+        ) as listed_contributor_count,
+        COALESCE(SUM(c.amount), 0) as amount_raised,
+        COUNT(c.id) as contribution_count,
+        COUNT(DISTINCT c.contributor_id) as contributor_count
+    FROM chunk
+    LEFT JOIN contributions c ON chunk.id = c.project_id AND c.is_deleted = FALSE
+    GROUP BY
+        chunk.id,
+        chunk.amount_raised,
+        chunk.contribution_count,
+        chunk.contributor_count
+    ORDER BY chunk.id
+"""
+
+RECOMPUTE_PROJECT_FUNDING_QUERY = """
+    UPDATE projects p
+    SET amount_raised = COALESCE(totals.amount_raised, 0),
+        contribution_count = COALESCE(totals.contribution_count, 0),
+        contributor_count = COALESCE(totals.contributor_count, 0)
+    FROM projects target
+    LEFT JOIN (
+        SELECT
+            project_id,
+            SUM(amount) as amount_raised,
+            COUNT(*) as contribution_count,
+            COUNT(DISTINCT contributor_id) as contributor_count
+        FROM contributions
+        WHERE project_id = ANY(:ids) AND is_deleted = FALSE
+        GROUP BY project_id
+    ) totals ON target.id = totals.project_id
+    WHERE p.id = target.id AND target.id = ANY(:ids);
+"""
+
+ADD_MISSING_PROJECT_CONTRIBUTORS_QUERY = """
+    INSERT INTO project_contributors (project_id, contributor_id, first_contributed_at)
+    SELECT project_id, contributor_id, MIN(created_at)
+    FROM contributions
+    WHERE project_id = ANY(:ids) AND is_deleted = FALSE
+    GROUP BY project_id, contributor_id
+    ON CONFLICT DO NOTHING;
+"""
+
+REMOVE_STALE_PROJECT_CONTRIBUTORS_QUERY = """
+    DELETE FROM project_contributors pc
+    WHERE pc.project_id = ANY(:ids)
+    AND NOT EXISTS (
+        SELECT 1
+        FROM contributions c
+        WHERE c.project_id = pc.project_id
+        AND c.contributor_id = pc.contributor_id
+        AND c.is_deleted = FALSE
+    );
 """
 
 
 class ProjectRepository(BaseRepository):
     """Contains logic for all project operations."""
 
-    def __init__(self, db: Database) -> None:
-        """Initializes the ProjectRepository with the database instance."""
-        super().__init__(db)
+    def __init__(self, db: Database, read_db: Optional[ReadDatabase] = None) -> None:
+        """Initializes the ProjectRepository with the database instances."""
+        super().__init__(db, read_db)
 
     @handle_post_database_exceptions("Project", already_exists_entity="Project title")
     async def create_project(self, *, new_project: ProjectCreate) -> ProjectInDb:
@@ -78,14 +369,21 @@ class ProjectRepository(BaseRepository):
         project = new_project.model_dump()
         project["id"] = id_
 
-        print("project", project)
         created_project = await self.db.fetch_one(
             query=CREATE_PROJECT_QUERY, values=project
         )
         if not created_project:
             raise FailedToCreateEntityError(entity_name="Project.")
-        return ProjectInDb(**created_project)  # type: ignore
+        await cache.delete("project", project_id=id_)
+        await cache.bump_version("projects_page")
+        return ProjectInDb.from_record(created_project)  # type: ignore
 
+    @cached_read(
+        "project",
+        model=ProjectInDb,
+        ttl=PROJECT_CACHE_TTL_SECONDS,
+        not_found_ttl=PROJECT_CACHE_NOT_FOUND_TTL_SECONDS,
+    )
     @handle_get_database_exceptions("Project")
     async def get_single_project_efficient(self, project_id: UUID) -> ProjectInDb:
         """Get a project."""
@@ -96,6 +394,41 @@ class ProjectRepository(BaseRepository):
             )
         return projects[0]
 
+    @handle_get_database_exceptions("Project")
+    async def get_project_etag(self, *, project_id: UUID) -> Optional[str]:
+        """Get the ETag of a project without aggregating its contributors.
+
+        Returns None if the project does not exist. Read from the primary: on
+        a lagging replica an outdated ETag would still match and get a 304.
+        """
+        record = await self.db.fetch_one(
+            query=GET_PROJECT_VERSION_QUERY, values={"id": str(project_id)}
+        )
+        if record is None:
+            return None
+        return ETag.build(
+            record["id"],
+            record["updated_at"],
+            record["contribution_count"],
+            record["amount_raised"],
+            record["contributor_count"],
+        )
+
+    @staticmethod
+    def project_etag(project: ProjectPublic) -> str:
+        """Get the ETag of a project that was already loaded.
+
+        updated_at only tracks edits to the project itself, so the funding
+        totals version the contributions.
+        """
+        return ETag.build(
+            project.id,
+            project.updated_at,
+            project.contribution_count,
+            project.amount_raised,
+            int(project.total_contributions),
+        )
+
     @handle_get_database_exceptions("Project")
     async def get_owner_projects_efficient(self, owner_id: UUID) -> List[ProjectInDb]:
         """Get all of owners project."""
@@ -106,12 +439,365 @@ class ProjectRepository(BaseRepository):
         """Get all projects."""
         return await self.get_projects_efficient()
 
+    @cached_read(
+        "projects_page",
+        model=ProjectPage,
+        ttl=PROJECT_PAGE_CACHE_TTL_SECONDS,
+        versioned=True,
+    )
+    @handle_get_database_exceptions("Project")
+    async def get_projects_page(
+        self,
+        owner_id: Optional[UUID] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> ProjectPage:
+        """Get a page of projects, newest first, starting after the cursor."""
+        where_conditions = []
+        values: dict = {
+            "limit": limit + 1,
+            "contributors_preview": PROJECT_CONTRIBUTORS_PREVIEW_SIZE,
+        }
+
+        if owner_id:
+            where_conditions.append("p.owner_id = :owner_id")
+            values["owner_id"] = str(owner_id)
+
+        if cursor:
+            created_at, id_ = Pagination.decode_cursor(
+                cursor, datetime.fromisoformat, UUID
+            )
+            where_conditions.append(
+                "(p.created_at, p.id) < (:cursor_created_at, :cursor_id)"
+            )
+            values["cursor_created_at"] = created_at
+            values["cursor_id"] = str(id_)
+
+        where_clause = (
+            f"AND {' AND '.join(where_conditions)}" if where_conditions else ""
+        )
+
+        query = GET_PROJECTS_PAGE_QUERY.format(where_clause=where_clause)
+        records = await self.read_db.fetch_all(query=query, values=values)
+
+        projects = [self._build_project(record) for record in records[:limit]]
+        next_cursor = None
+        if len(records) > limit:
+            last = projects[-1]
+            next_cursor = Pagination.encode_cursor(last.created_at.isoformat(), last.id)
+        return ProjectPage(items=projects, next_cursor=next_cursor)
+
+    @handle_get_database_exceptions("Project")
+    async def get_project_contributors(
+        self, *, project_id: UUID, limit: int = 20, cursor: Optional[str] = None
+    ) -> ProjectContributorPage:
+        """Get a page of a project's contributors, latest first.
+
+        An empty page of a missing or deleted project raises NotFoundError.
+        """
+        where_clause = ""
+        values: dict = {"project_id": str(project_id), "limit": limit + 1}
+        if cursor:
+            first_contributed_at, contributor_id = Pagination.decode_cursor(
+                cursor, datetime.fromisoformat, UUID
+            )
+            where_clause = (
+                "AND (pc.first_contributed_at, pc.contributor_id) "
+                "< (:cursor_first_contributed_at, :cursor_contributor_id)"
+            )
+            values["cursor_first_contributed_at"] = first_contributed_at
+            values["cursor_contributor_id"] = str(contributor_id)
+
+        query = GET_PROJECT_CONTRIBUTORS_PAGE_QUERY.format(where_clause=where_clause)
+        records = await self.read_db.fetch_all(query=query, values=values)
+        if not records:
+            if await self.get_project_etag(project_id=project_id) is None:
+                raise NotFoundError(
+                    entity_name="Project", entity_identifier=str(project_id)
+                )
+
+        contributors = [
+            ProjectContributor.from_record(
+                {
+                    "username": record["username"],
+                    "first_contributed_at": record["first_contributed_at"],
+                }
+            )
+            for record in records[:limit]
+        ]
+        next_cursor = None
+        if len(records) > limit:
+            last = records[limit - 1]
+            next_cursor = Pagination.encode_cursor(
+                last["first_contributed_at"].isoformat(), last["contributor_id"]
+            )
+        return ProjectContributorPage(items=contributors, next_cursor=next_cursor)
+
+    @handle_get_database_exceptions("Project")
+    async def search_projects(
+        self, *, text: str, limit: int = 20, cursor: Optional[str] = None
+    ) -> ProjectPage:
+        """Search titles and descriptions, best match first.
+
+        Every word must match, the last one as a prefix. Projects with every
+        word in the title rank above those matching through the description,
+        newest first within each. With PROJECT_SEARCH_FUZZY, titles similar to
+        the text count as title matches.
+
+        Each rank with few matches sorts all of them. A rank with many walks
+        the keyset index instead, which finds a page of matches after a few
+        rows. Which is which comes from the planner's estimates, cached per
+        search text, so only the first search for a text pays for an EXPLAIN.
+        Counting the matches of a common word costs more than the search.
+
+        The tsquery is written into the SQL rather than bound: how many rows
+        it matches decides the plan, and a bound tsquery lets Postgres switch
+        to a generic plan after a few runs. It only holds word characters.
+        """
+        tsquery = self._to_prefix_tsquery(text)
+        if not tsquery:
+            return ProjectPage()
+
+        title_match = SEARCH_TITLE_MATCH.format(
+            tsquery=tsquery,
+            fuzzy_match=SEARCH_FUZZY_MATCH if PROJECT_SEARCH_FUZZY else "",
+        )
+        other_match = SEARCH_OTHER_MATCH.format(
+            tsquery=tsquery, title_match=title_match
+        )
+        values: dict = {"text": text} if PROJECT_SEARCH_FUZZY else {}
+
+        matches = {"2": title_match, "1": other_match}
+        keysets = {"2": "", "1": ""}
+        page_values = {
+            **values,
+            "limit": limit + 1,
+            "contributors_preview": PROJECT_CONTRIBUTORS_PREVIEW_SIZE,
+        }
+        if cursor:
+            rank, created_at, id_ = Pagination.decode_cursor(
+                cursor, str, datetime.fromisoformat, UUID
+            )
+            if rank not in matches:
+                raise BadRequestError("Invalid cursor")
+            if rank == "1":
+                del matches["2"]
+            keysets[rank] = "AND (created_at, id) < (:cursor_created_at, :cursor_id)"
+            page_values["cursor_created_at"] = created_at
+            page_values["cursor_id"] = str(id_)
+
+        estimates = await self._estimate_search_matches(
+            tsquery, text, title_match, other_match, values
+        )
+        branches = []
+        for rank, match in matches.items():
+            if estimates[rank] < PROJECT_SEARCH_INDEX_WALK_MIN_ROWS:
+                query = SEARCH_RANK_FROM_MATCHES
+            else:
+                query = SEARCH_RANK_FROM_INDEX
+            branches.append(
+                "(" + query.format(rank=rank, match=match, keyset=keysets[rank]) + ")"
+            )
+
+        records = await self.read_db.fetch_all(
+            query=SEARCH_PROJECTS_QUERY.format(ranks=" UNION ALL ".join(branches)),
+            values=page_values,
+        )
+
+        projects = []
+        ranks = []
+        for record in records[:limit]:
+            project_data = dict(record)  # type: ignore
+            ranks.append(project_data.pop("rank"))
+            projects.append(self._build_project(project_data))
+        next_cursor = None
+        if len(records) > limit:
+            last = projects[-1]
+            next_cursor = Pagination.encode_cursor(
+                ranks[-1], last.created_at.isoformat(), last.id
+            )
+        return ProjectPage(items=projects, next_cursor=next_cursor)
+
+    async def _estimate_search_matches(
+        self,
+        tsquery: str,
+        text: str,
+        title_match: str,
+        other_match: str,
+        values: dict,
+    ) -> dict[str, float]:
+        """Get the planner's estimate of each rank's matches, by rank."""
+        key = (tsquery, text.lower() if PROJECT_SEARCH_FUZZY else "")
+        estimates = search_estimates.get(key)
+        if estimates is None:
+            plan = await self.read_db.fetch_val(
+                query=ESTIMATE_SEARCH_MATCHES_QUERY.format(
+                    title_match=title_match, other_match=other_match
+                ),
+                values=values,
+            )
+            root = json.loads(plan)[0]["Plan"]
+            if root["Node Type"] == "Append" and len(root["Plans"]) == 2:
+                title_plan, other_plan = root["Plans"]
+            else:
+                # The planner can fold the union away; use its total for both.
+                title_plan = other_plan = root
+            estimates = {"2": title_plan["Plan Rows"], "1": other_plan["Plan Rows"]}
+            search_estimates.set(key, estimates)
+        return estimates
+
+    @staticmethod
+    def _to_prefix_tsquery(text: str) -> str:
+        """Turn free text into a tsquery that ANDs its words, the last as a prefix."""
+        words = re.findall(r"\w+", text.lower())[:SEARCH_MAX_TERMS]
+        if not words:
+            return ""
+        return " & ".join(words[:-1] + [f"{words[-1]}:*"])
+
+    @handle_get_database_exceptions("Project")
+    async def get_ranking(self, *, ranking: str, limit: int) -> ProjectRanking:
+        """Get the top open projects of a precomputed ranking.
+
+        Rankings are refreshed in the background. One older than
+        PROJECT_RANKINGS_MAX_STALENESS_SECONDS, say because every refresher
+        is failing, is refreshed before it is served. Staleness comes from the
+        whole view, so an empty ranking or an empty view is refreshed too.
+        """
+        values = {
+            "ranking": ranking,
+            "limit": limit,
+            "contributors_preview": PROJECT_CONTRIBUTORS_PREVIEW_SIZE,
+        }
+        staleness = {"max_staleness": PROJECT_RANKINGS_MAX_STALENESS_SECONDS}
+        db = self.read_db
+        refreshed = await db.fetch_one(
+            query=GET_PROJECT_RANKINGS_REFRESHED_AT_QUERY, values=staleness
+        )
+        if refreshed is None or refreshed["stale"]:
+            await self.refresh_rankings(
+                max_age=PROJECT_RANKINGS_MAX_STALENESS_SECONDS, wait=True
+            )
+            # Replicas may not have the refresh yet.
+            db = self.db
+            refreshed = await db.fetch_one(
+                query=GET_PROJECT_RANKINGS_REFRESHED_AT_QUERY, values=staleness
+            )
+        records = await db.fetch_all(query=GET_PROJECT_RANKING_QUERY, values=values)
+
+        return ProjectRanking(
+            items=[self._build_project(record) for record in records],
+            refreshed_at=refreshed["refreshed_at"] if refreshed else None,
+        )
+
+    @handle_post_database_exceptions("Project")
+    async def refresh_rankings(self, *, max_age: float, wait: bool = False) -> bool:
+        """Recompute the rankings unless they are fresher than max_age seconds.
+
+        Readers keep seeing the previous rankings until the refresh commits.
+        Returns whether this call refreshed them; without wait it gives up
+        when another refresh is running.
+        """
+        async with self.db.transaction():
+            if wait:
+                await self.db.execute(query=LOCK_PROJECT_RANKINGS_QUERY)
+            elif not await self.db.fetch_val(query=TRY_LOCK_PROJECT_RANKINGS_QUERY):
+                return False
+            if await self.db.fetch_val(
+                query=PROJECT_RANKINGS_FRESH_QUERY, values={"max_age": max_age}
+            ):
+                return False
+            await self.db.execute(query=REFRESH_PROJECT_RANKINGS_QUERY)
+        return True
+
+    async def iterate_projects(
+        self, owner_id: Optional[UUID] = None
+    ) -> AsyncIterator[ProjectInDb]:
+        """Yield projects one at a time from a server-side cursor."""
+        where_clause = ""
+        values: dict = {"contributors_preview": PROJECT_CONTRIBUTORS_PREVIEW_SIZE}
+        if owner_id:
+            where_clause = "AND p.owner_id = :owner_id"
+            values["owner_id"] = str(owner_id)
+
+        query = GET_PROJECT_QUERY.format(where_clause=where_clause)
+        async for record in self.read_db.iterate(query=query, values=values):
+            yield self._build_project(record)
+
+    @handle_post_database_exceptions("Project")
+    async def reconcile_funding(
+        self,
+        *,
+        after_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+        apply: bool = True,
+    ) -> Tuple[Optional[UUID], List[dict]]:
+        """Recompute the funding totals of the next chunk of projects by id.
+
+        Returns the last project id of the chunk, or None once every project
+        was checked, and the projects whose stored totals drifted, each with
+        the (stored, actual) pair of every field that differs.
+        """
+        values: dict = {"chunk_size": chunk_size}
+        where_clause = ""
+        if after_id:
+            where_clause = "WHERE id > :after_id"
+            values["after_id"] = str(after_id)
+
+        query = GET_PROJECT_FUNDING_DRIFT_QUERY.format(where_clause=where_clause)
+        records = await self.db.fetch_all(query=query, values=values)
+        if not records:
+            return None, []
+
+        drift = []
+        for record in records:
+            fields = {
+                "amount_raised": (
+                    record["stored_amount_raised"],
+                    int(record["amount_raised"]),
+                ),
+                "contribution_count": (
+                    record["stored_contribution_count"],
+                    record["contribution_count"],
+                ),
+                "contributor_count": (
+                    record["stored_contributor_count"],
+                    record["contributor_count"],
+                ),
+                "listed_contributors": (
+                    record["listed_contributor_count"],
+                    record["contributor_count"],
+                ),
+            }
+            drifted = {k: v for k, v in fields.items() if v[0] != v[1]}
+            if drifted:
+                drift.append({"id": record["id"], **drifted})
+
+        if drift and apply:
+            ids = [str(item["id"]) for item in drift]
+            async with self.db.transaction():
+                # Lock first so the recount sees every committed contribution.
+                await self.db.fetch_all(query=LOCK_PROJECTS_QUERY, values={"ids": ids})
+                await self.db.execute(
+                    query=RECOMPUTE_PROJECT_FUNDING_QUERY, values={"ids": ids}
+                )
+                await self.db.execute(
+                    query=ADD_MISSING_PROJECT_CONTRIBUTORS_QUERY, values={"ids": ids}
+                )
+                await self.db.execute(
+                    query=REMOVE_STALE_PROJECT_CONTRIBUTORS_QUERY, values={"ids": ids}
+                )
+            for id_ in ids:
+                await cache.delete("project", project_id=id_)
+            await cache.bump_version("projects_page")
+
+        return records[-1]["id"], drift
+
     async def get_projects_efficient(
         self, project_id: Optional[UUID] = None, owner_id: Optional[UUID] = None
     ) -> List[ProjectInDb]:
         """General get projects."""
         where_conditions = []
-        values = {}
+        values: dict = {"contributors_preview": PROJECT_CONTRIBUTORS_PREVIEW_SIZE}
 
         if project_id:
             where_conditions.append("p.id = :id")
@@ -126,19 +812,20 @@ class ProjectRepository(BaseRepository):
         )
 
         query = GET_PROJECT_QUERY.format(where_clause=where_clause)
-        records = await self.db.fetch_all(query=query, values=values)
+        records = await self.read_db.fetch_all(query=query, values=values)
 
-        projects = []
-        for record in records:
-            project_data = dict(record)
+        return [self._build_project(record) for record in records]
 
-            usernames = project_data.get("contributors")
-            if usernames is None:
-                project_data["contributors"] = []
-            elif isinstance(usernames, str):
-                clean_usernames = usernames.strip("{}").split(",")
-                project_data["contributors"] = [u for u in clean_usernames if u]
+    @staticmethod
+    def _build_project(record: object) -> ProjectInDb:
+        """Build a project from a row of the aggregate queries."""
+        project_data = dict(record)  # type: ignore
 
-            projects.append(ProjectInDb(**project_data))
+        if project_data.get("contributors") is None:
+            project_data["contributors"] = []
+        # COUNT() comes back as an int; the field is a Decimal.
+        project_data["total_contributions"] = Decimal(
+            project_data.get("total_contributions") or 0
+        )
 
-        return projects
+        return ProjectInDb.from_record(project_data)
@@ -1,26 +1,87 @@
 """Database Connect Tasks"""
 
-from databases import Database
+import logging
+
+from databases import DatabaseURL
 from fastapi import FastAPI
 
-from src.core.config import DATABASE_URL
+from src.core.config import (
+    DATABASE_POOL_ACQUIRE_TIMEOUT,
+    DATABASE_POOL_MAX_IDLE_LIFETIME,
+    DATABASE_POOL_MAX_LIFETIME,
+    DATABASE_POOL_MAX_SIZE,
+    DATABASE_POOL_MIN_SIZE,
+    DATABASE_REPLICA_RETRY_SECONDS,
+    DATABASE_REPLICA_URLS,
+    DATABASE_URL,
+)
+from src.db.instrumentation import InstrumentedDatabase
+from src.db.pool import PoolMonitor, register_pool_gauges
+from src.db.replicas import REPLICA_ERRORS, ReadDatabase, Replica
+
+app_logger = logging.getLogger("app")
 
 
 async def connect_database(app: FastAPI) -> None:
     """Connect to DB"""
     try:
-        database = Database(DATABASE_URL)
+        pool_monitor = PoolMonitor(
+            acquire_timeout=DATABASE_POOL_ACQUIRE_TIMEOUT,
+            max_lifetime=DATABASE_POOL_MAX_LIFETIME,
+        )
+        database = InstrumentedDatabase(
+            DATABASE_URL,
+            min_size=DATABASE_POOL_MIN_SIZE,
+            max_size=DATABASE_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime=DATABASE_POOL_MAX_IDLE_LIFETIME,
+            init=pool_monitor.init_connection,
+        )
         await database.connect()
+        pool_monitor.attach(database)
+        register_pool_gauges(pool_monitor)
         app.state._db = database
-        print("Connected to postgres database. ")
+        app.state.db_pool = pool_monitor
+        app_logger.info("Connected to postgres database.")
+        await connect_replicas(app)
     except Exception as e:
-        print("Failed to connect to postgres database", e)
+        app_logger.exception("Failed to connect to postgres database", exc_info=e)
+
+
+async def connect_replicas(app: FastAPI) -> None:
+    """Connect the read replicas. Unreachable ones are retried on first use."""
+    replicas = []
+    for url in DATABASE_REPLICA_URLS:
+        database_url = DatabaseURL(url)
+        replica = Replica(
+            name=f"{database_url.hostname}:{database_url.port}/{database_url.database}",
+            database=InstrumentedDatabase(
+                url,
+                min_size=DATABASE_POOL_MIN_SIZE,
+                max_size=DATABASE_POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=DATABASE_POOL_MAX_IDLE_LIFETIME,
+            ),
+        )
+        try:
+            await replica.connect()
+            app_logger.info("Connected to replica.", extra={"replica": replica.name})
+        except REPLICA_ERRORS as e:
+            app_logger.warning(
+                "Failed to connect to replica.",
+                extra={"replica": replica.name, "error": str(e)},
+            )
+        replicas.append(replica)
+    app.state.read_db = ReadDatabase(
+        primary=app.state._db,
+        replicas=replicas,
+        retry_after=DATABASE_REPLICA_RETRY_SECONDS,
+    )
 
 
 async def disconnect_database(app: FastAPI) -> None:
     """Close db."""
     try:
+        await app.state.read_db.disconnect()
         await app.state._db.disconnect()
-        print("Disconnected from postgres database. ")
+        app_logger.info("Disconnected from postgres database.")
     except Exception as e:
-        print("Error disconnecting from postgres", e)
+        app_logger.exception("Error disconnecting from postgres", exc_info=e)
@@ -6,6 +6,7 @@ from uuid import UUID
 from databases import Database
 from fastapi.security import OAuth2PasswordRequestForm
 
+from src.db.replicas import ReadDatabase
 from src.db.repositories.base import BaseRepository
 from src.decorators.db import (
     handle_get_database_exceptions,
@@ -50,9 +51,9 @@ GET_USER_BY_USERNAME_QUERY = """
 class UserRepository(BaseRepository):
     """Contains logic for all user operations."""
 
-    def __init__(self, db: Database) -> None:
-        """Initializes the UserRepository with the database instance."""
-        super().__init__(db)
+    def __init__(self, db: Database, read_db: Optional[ReadDatabase] = None) -> None:
+        """Initializes the UserRepository with the database instances."""
+        super().__init__(db, read_db)
 
     @handle_post_database_exceptions("User", already_exists_entity="User email")
     async def create_user(self, *, new_user: UserCreate) -> UserInDb:
@@ -68,7 +69,7 @@ class UserRepository(BaseRepository):
         created_user = await self.db.fetch_one(query=CREATE_USER_QUERY, values=user)
         if not created_user:
             raise FailedToCreateEntityError(entity_name="User.")
-        return UserInDb(**created_user)  # type: ignore
+        return UserInDb.from_record(created_user)  # type: ignore
 
     async def login(self, user_request: OAuth2PasswordRequestForm) -> AccessToken:
         """Logs in a user."""
@@ -104,11 +105,11 @@ class UserRepository(BaseRepository):
 
         for field, (query, value) in search_criteria.items():
             if value:
-                user_record = await self.db.fetch_one(
+                user_record = await self.read_db.fetch_one(
                     query=query, values={field: value}
                 )
                 if user_record:
-                    return UserInDb(**user_record)  # type: ignore
+                    return UserInDb.from_record(user_record)  # type: ignore
                 else:
                     raise NotFoundError(entity_name="user", entity_identifier=value)
 
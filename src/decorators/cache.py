@@ -0,0 +1,65 @@
+"""Decorator to serve repository reads through the read-through cache."""
+
+import inspect
+from functools import wraps
+from typing import Any, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from src.errors.database import NotFoundError
+from src.services.cache import NOT_FOUND, cache
+
+
+def cached_read(
+    namespace: str,
+    model: Type[BaseModel],
+    ttl: float,
+    not_found_ttl: Optional[float] = None,
+    versioned: bool = False,
+) -> callable:  # type: ignore
+    """Decorator to cache the model returned by a repository read.
+
+    Keys are built from the arguments of the call, by name, so positional and
+    keyword calls share entries. Unversioned
+    namespaces are invalidated per key with cache.delete; versioned ones are
+    invalidated all at once with cache.bump_version. When not_found_ttl is
+    set, NotFoundError is cached too and raised again on a hit.
+    """
+
+    def decorator(func: callable) -> callable:  # type: ignore
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:  # noqa
+            version = ""
+            if versioned:
+                version = await cache.get_version(namespace)  # type: ignore
+                if version is None:
+                    return await func(self, *args, **kwargs)
+
+            arguments = signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            parts = dict(arguments.arguments)
+            del parts["self"]
+            key = cache.build_key(namespace, version, **parts)
+            cached = await cache.get(namespace, key)
+            if cached == NOT_FOUND:
+                raise NotFoundError(entity_name=namespace, entity_identifier=key)
+            if cached is not None:
+                try:
+                    return model.model_validate_json(cached)
+                except ValidationError:
+                    pass
+
+            try:
+                result = await func(self, *args, **kwargs)
+            except NotFoundError:
+                if not_found_ttl:
+                    await cache.set(key, NOT_FOUND, ttl=not_found_ttl)
+                raise
+            await cache.set(key, result.model_dump_json(), ttl=ttl)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -5,7 +5,8 @@ from functools import wraps
 from sqlite3 import IntegrityError, OperationalError, ProgrammingError
 from typing import Any
 
-from src.errors.core import InternalServerError, InvalidTokenError
+from src.db.instrumentation import track_repository_call
+from src.errors.core import CoreError, InternalServerError, InvalidTokenError
 from src.errors.database import (
     AlreadyExistsError,
     BadRequestError,
@@ -32,7 +33,8 @@ def handle_get_database_exceptions(entity_name: str) -> callable:  # type: ignor
                 audit_logger if entity_name.lower() in audit_entities else app_logger
             )
             try:
-                return await func(self, *args, **kwargs)
+                with track_repository_call(type(self).__name__, func.__name__):
+                    return await func(self, *args, **kwargs)
             except OperationalError as e:
                 logger.exception(f"OperationalError for {entity_name}", exc_info=True)
                 raise GeneralDatabaseError(entity_name=entity_name) from e
@@ -46,14 +48,23 @@ def handle_get_database_exceptions(entity_name: str) -> callable:  # type: ignor
                 raise BadRequestError(
                     f"Bad Request: Invalid details for {entity_name}"
                 ) from e
-            except NotFoundError:
-                logger.exception(f"NotFoundError for {entity_name}")
+            except NotFoundError as e:
+                logger.info(
+                    f"NotFoundError for {entity_name}", extra={"detail": e.message}
+                )
                 raise
-            except IncorrectCredentialsError:
-                logger.exception(f"Incorrect credentials for {entity_name}")
+            except IncorrectCredentialsError as e:
+                logger.info(
+                    f"Incorrect credentials for {entity_name}",
+                    extra={"detail": e.message},
+                )
                 raise
-            except InvalidTokenError:
-                logger.exception(f"Invalid jwt token for {entity_name}")
+            except InvalidTokenError as e:
+                logger.info(
+                    f"Invalid jwt token for {entity_name}", extra={"detail": e.message}
+                )
+                raise
+            except CoreError:
                 raise
             except Exception as e:
                 logger.exception(f"Unexpected error for {entity_name}", exc_info=True)
@@ -81,7 +92,8 @@ def handle_post_database_exceptions(
                 audit_logger if entity_name.lower() in audit_entities else app_logger
             )
             try:
-                return await func(self, *args, **kwargs)
+                with track_repository_call(type(self).__name__, func.__name__):
+                    return await func(self, *args, **kwargs)
             except IntegrityError as e:
                 logger.exception(f"IntegrityError for {entity_name}", exc_info=True)
                 if "UNIQUE constraint failed" in str(e):
@@ -98,14 +110,23 @@ def handle_post_database_exceptions(
                 raise BadRequestError(
                     f"Bad Request: Invalid details for {entity_name}"
                 ) from e
-            except NotFoundError:
-                logger.exception(f"NotFoundError for {entity_name}")
+            except NotFoundError as e:
+                logger.info(
+                    f"NotFoundError for {entity_name}", extra={"detail": e.message}
+                )
+                raise
+            except IncorrectCredentialsError as e:
+                logger.info(
+                    f"Incorrect credentials for {entity_name}",
+                    extra={"detail": e.message},
+                )
                 raise
-            except IncorrectCredentialsError:
-                logger.exception(f"Incorrect credentials for {entity_name}")
+            except InvalidTokenError as e:
+                logger.info(
+                    f"Invalid jwt token for {entity_name}", extra={"detail": e.message}
+                )
                 raise
-            except InvalidTokenError:
-                logger.exception(f"Invalid jwt token for {entity_name}")
+            except CoreError:
                 raise
             except Exception as e:
                 logger.exception(f"Unexpected error for {entity_name}", exc_info=True)
@@ -1,10 +1,13 @@
 """Registration errors decorator for the WhatsApp bot."""
 
+import logging
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
 
+app_logger = logging.getLogger("app")
+
 
 def handle_registration_errors(
     location: str,
@@ -17,8 +20,8 @@ def handle_registration_errors(
         async def wrapper(self: object, *args: str, **kwargs: dict[str, Any]) -> T:
             try:
                 return await func(self, *args, **kwargs)
-            except Exception as e:
-                print(f"Error in {location}: {e}")
+            except Exception:
+                app_logger.exception(f"Error in {location}")
 
         return wrapper
 
@@ -36,8 +39,8 @@ def handle_errors(
         async def wrapper(self: object, *args: str, **kwargs: dict[str, Any]) -> T:
             try:
                 return await func(self, *args, **kwargs)
-            except Exception as e:
-                print(f"Error in {location}: {e}")
+            except Exception:
+                app_logger.exception(f"Error in {location}")
 
         return wrapper
 
@@ -8,10 +8,13 @@ from starlette import status
 class CoreError(Exception):
     """Base class for database errors."""
 
-    def __init__(self, message: str, status_code: int) -> None:
-        """Initializes the error with a message and status code."""
+    def __init__(
+        self, message: str, status_code: int, headers: Optional[dict] = None
+    ) -> None:
+        """Initializes the error with a message, status code and response headers."""
         self.message = message
         self.status_code = status_code
+        self.headers = headers
 
 
 class InternalServerError(CoreError):
@@ -25,6 +28,58 @@ class InternalServerError(CoreError):
         super().__init__(message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class ServiceUnavailableError(CoreError):
+    """Raised when a resource is saturated and the request should be retried."""
+
+    def __init__(
+        self, additional_message: Optional[str] = None, retry_after: int = 1
+    ) -> None:
+        """Initializes the error with a dynamic message and a Retry-After hint."""
+        message = "Service Unavailable"
+        if additional_message:
+            message += f": {additional_message}"
+        super().__init__(
+            message,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class TooManyRequestsError(CoreError):
+    """Raised when a client goes over a rate limit."""
+
+    def __init__(self, retry_after: int = 1) -> None:
+        """Initializes the error with a Retry-After hint."""
+        super().__init__(
+            "Too Many Requests: Try again later",
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class IdempotencyKeyReusedError(CoreError):
+    """Raised when an Idempotency-Key comes back with a different request."""
+
+    def __init__(self) -> None:
+        """Initializes the error with a static message."""
+        message = (
+            "Unprocessable Entity: Idempotency-Key was already used for another request"
+        )
+        super().__init__(message, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+
+class IdempotencyKeyInProgressError(CoreError):
+    """Raised when the request holding an Idempotency-Key has not answered."""
+
+    def __init__(self, retry_after: int = 1) -> None:
+        """Initializes the error with a Retry-After hint."""
+        super().__init__(
+            "Conflict: A request with this Idempotency-Key is still in progress",
+            status.HTTP_409_CONFLICT,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 class InvalidTokenError(CoreError):
     """Raised when an entity is not found in the database."""
 
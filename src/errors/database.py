@@ -107,3 +107,12 @@ class DataTypeError(DatabaseError):
         if entity_name:
             message += f" for {entity_name.capitalize()}"
         super().__init__(message, status.HTTP_400_BAD_REQUEST)
+
+
+class ProjectDeadlinePassedError(DatabaseError):
+    """Raised when contributing to a project whose deadline has passed."""
+
+    def __init__(self) -> None:
+        """Initializes the error with a static message."""
+        message = "Project deadline has passed."
+        super().__init__(message, status.HTTP_400_BAD_REQUEST)
@@ -1,6 +1,6 @@
 """Contribution model."""
 
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import Field
@@ -42,3 +42,26 @@ class ContributionUpdate(CoreModel):
     """Model for updating a Contribution."""
 
     amount: Optional[int] = Field(None, ge=1, description="Minimum contribution is 1")
+
+
+class ContributionBulkCreate(ContributionBase):
+    """Model for one row of a bulk contribution import."""
+
+    project_id: UUID
+
+
+class ContributionBulkResult(CoreModel):
+    """Outcome of one row of a bulk contribution import."""
+
+    index: int
+    status: Literal["created", "rejected"]
+    contribution: Optional[ContributionPublic] = None
+    error: Optional[str] = None
+
+
+class ContributionBulkResponse(CoreModel):
+    """Outcome of a bulk contribution import."""
+
+    created: int = 0
+    rejected: int = 0
+    results: list[ContributionBulkResult] = Field(default_factory=list)
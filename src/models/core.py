@@ -1,12 +1,18 @@
 """Core data that exist in all Models."""
 
+import logging
 from datetime import datetime, timezone
-from typing import Type
+from typing import Any, Mapping, Type, TypeVar
 from uuid import UUID
 from pydantic import BaseModel, Field
 
+from src.core.config import VALIDATE_DB_ROWS
 from src.db.repositories.base import BaseRepository
 
+app_logger = logging.getLogger("app")
+
+ModelT = TypeVar("ModelT", bound="CoreModel")
+
 
 class CoreModel(BaseModel):
     """Any common logic to be shared by all models."""
@@ -22,6 +28,27 @@ class CoreModel(BaseModel):
             datetime: lambda v: v.isoformat(),
         }
 
+    @classmethod
+    def from_record(cls: Type[ModelT], record: Mapping[str, Any]) -> ModelT:
+        """Build a model from a row of our own tables without validating it.
+
+        The table constraints already hold for stored rows, but the column
+        types must match the fields: nothing is coerced. Set VALIDATE_DB_ROWS
+        to validate every row instead, e.g. while debugging a query or a
+        migration. It also logs a warning when the unvalidated model would
+        serialize differently, as a cache hit goes through validation.
+        """
+        if VALIDATE_DB_ROWS:
+            model = cls.model_validate(dict(record))
+            constructed = cls.model_construct(**dict(record))
+            if constructed.model_dump_json(warnings=False) != model.model_dump_json():
+                app_logger.warning(
+                    f"{cls.__name__}.from_record does not match validation",
+                    extra={"columns": sorted(record.keys())},
+                )
+            return model
+        return cls.model_construct(**dict(record))
+
 
 class IDModelMixin(BaseModel):
     """ID data."""
@@ -22,20 +22,24 @@ class ProjectBase(CoreModel):
     description: str = Field(..., min_length=10)
     goal_amount: int = Field(..., ge=0)
     owner_id: UUID
-    deadline: FutureDatetime = Field(..., description="Deadline must be a future date")
+    deadline: datetime
 
 
 class ProjectCreate(ProjectBase):
     """Model for creating a Project."""
 
-    pass
+    deadline: FutureDatetime = Field(..., description="Deadline must be a future date")
 
 
 class ProjectPublic(ProjectBase, DateTimeModelMixin, IDModelMixin_):
     """Public model for Project."""
 
-    total_contributions: Decimal = Field(default=0, ge=0)
-    contributors: list[str] = Field(default_factory=list)
+    total_contributions: Decimal = Field(default=Decimal(0), ge=0)
+    amount_raised: int = Field(default=0, ge=0)
+    contribution_count: int = Field(default=0, ge=0)
+    contributors: list[str] = Field(
+        default_factory=list, description="Usernames of the latest contributors"
+    )
 
 
 class ProjectInDb(ProjectPublic, IsDeletedModelMixin):
@@ -44,6 +48,34 @@ class ProjectInDb(ProjectPublic, IsDeletedModelMixin):
     pass
 
 
+class ProjectPage(CoreModel):
+    """A page of projects with the cursor for the next page."""
+
+    items: list[ProjectPublic] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class ProjectContributor(CoreModel):
+    """A user who contributed to a project."""
+
+    username: str
+    first_contributed_at: datetime
+
+
+class ProjectContributorPage(CoreModel):
+    """A page of contributors with the cursor for the next page."""
+
+    items: list[ProjectContributor] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class ProjectRanking(CoreModel):
+    """The top projects of a ranking and when it was computed."""
+
+    items: list[ProjectPublic] = Field(default_factory=list)
+    refreshed_at: Optional[datetime] = None
+
+
 class ProjectUpdate(CoreModel):
     """Model for updating a Project."""
 
@@ -0,0 +1,62 @@
+"""Recompute project funding totals from contributions and report drift.
+
+Usage:
+    python -m src.scripts.reconcile_project_funding [--chunk-size 500] [--dry-run]
+"""
+
+import argparse
+import asyncio
+
+from databases import Database
+
+from src.core.config import DATABASE_URL
+from src.db.repositories.project import ProjectRepository
+
+
+async def reconcile(chunk_size: int, apply: bool) -> int:
+    """Walk every project in id order and fix drifted totals."""
+    database = Database(DATABASE_URL)
+    await database.connect()
+    project_repo = ProjectRepository(database)
+
+    after_id = None
+    chunks = 0
+    drifted = 0
+    try:
+        while True:
+            after_id, drift = await project_repo.reconcile_funding(
+                after_id=after_id, chunk_size=chunk_size, apply=apply
+            )
+            if after_id is None:
+                break
+            chunks += 1
+            drifted += len(drift)
+            for item in drift:
+                changes = ", ".join(
+                    f"{field} {values[0]} -> {values[1]}"
+                    for field, values in item.items()
+                    if field != "id"
+                )
+                print(f"{item['id']}: {changes}")
+    finally:
+        await database.disconnect()
+
+    action = "fixed" if apply else "found"
+    print(f"Checked {chunks} chunk(s); {action} drift in {drifted} project(s).")
+    return drifted
+
+
+def main() -> None:
+    """Parse arguments and run the reconciliation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report drift without fixing it."
+    )
+    args = parser.parse_args()
+    drifted = asyncio.run(reconcile(args.chunk_size, apply=not args.dry_run))
+    raise SystemExit(1 if drifted and args.dry_run else 0)
+
+
+if __name__ == "__main__":
+    main()
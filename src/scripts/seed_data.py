@@ -0,0 +1,395 @@
+"""Seed the database with synthetic users, projects and contributions.
+
+Rows are generated in worker processes as CSV and loaded with COPY over
+several connections at once. Contributions per project follow a power law,
+a handful of hot projects take a fixed share of all contributions, project
+deadlines are spread over the past and the coming months, and every user
+shares one password, hashed once up front.
+
+Project funding totals and project_contributors are filled in afterwards
+with the same queries the reconciliation uses.
+
+Usage:
+    python -m src.scripts.seed_data --users 200000 --projects 50000 \\
+        --contributions 5000000 [--workers 8] [--chunk-size 50000] [--seed 0]
+"""
+
+import argparse
+import asyncio
+import io
+import random
+import time
+import uuid
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import accumulate
+from typing import List, Optional, Sequence
+
+from databases import Database
+
+from src.core.config import DATABASE_URL
+from src.db.repositories.contribution import CONTRIBUTION_COPY_COLUMNS
+from src.db.repositories.project import (
+    ADD_MISSING_PROJECT_CONTRIBUTORS_QUERY,
+    RECOMPUTE_PROJECT_FUNDING_QUERY,
+)
+from src.services.hashing import pwd_context
+
+DEFAULT_PASSWORD = "seed-password"
+AGGREGATE_CHUNK_SIZE = 1000
+DAY = 86400
+
+USER_COPY_COLUMNS = [
+    "user_id",
+    "first_name",
+    "last_name",
+    "email",
+    "password_hash",
+    "username",
+    "created_at",
+    "updated_at",
+]
+PROJECT_COPY_COLUMNS = [
+    "id",
+    "owner_id",
+    "title",
+    "description",
+    "goal_amount",
+    "deadline",
+    "created_at",
+    "updated_at",
+]
+
+FIRST_NAMES = ["Ama", "Kwame", "Efua", "Kofi", "Akosua", "Yaw", "Abena", "Kojo"]
+LAST_NAMES = ["Mensah", "Asante", "Owusu", "Boateng", "Osei", "Addo", "Appiah"]
+# Title and description words, most common first; drawn with Zipf weights so
+# search sees both very common and rare terms.
+VOCABULARY = """
+    community school water solar project local children health farm village
+    clinic library women youth energy garden books clean new help support
+    market training music art center kitchen bridge road well pump panels
+    teachers students nurses families elders mobile computer lab internet
+    football pitch playground shelter housing roof repair build expand
+    bakery tailoring sewing carpentry welding cooperative savings loans
+    recycling compost trees forest river fishing boats harvest storage mill
+    maize cassava cocoa coffee honey poultry goats dairy irrigation drip
+    greenhouse seeds tools tractor bicycle ambulance maternity vaccines
+    malaria nutrition meals uniforms scholarships exams tutoring coding
+    robotics science theatre dance film photography festival museum radio
+    podcast newspaper translation braille wheelchair ramps hearing glasses
+    dental surgery pharmacy laboratory hygiene toilets sanitation handwashing
+    lighting streetlights batteries inverter wind biogas stoves charcoal
+""".split()
+
+VOCABULARY_WEIGHTS = list(
+    accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1))
+)
+
+# Set in each worker process by _init_worker.
+_plan: dict = {}
+
+
+def seeded_id(prefix: int, index: int) -> str:
+    """Deterministic UUID4 for the index-th row of a run."""
+    return str(uuid.UUID(int=(prefix << 32) | index, version=4))
+
+
+def _timestamp(epoch: float) -> str:
+    """Naive UTC timestamp, matching the created_at and updated_at columns."""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _init_worker(plan: dict) -> None:
+    """Receive the shared generation plan once per worker process."""
+    _plan.update(plan)
+
+
+def build_users(start: int, stop: int) -> bytes:
+    """CSV rows for users start to stop."""
+    rng = random.Random(f"{_plan['seed']}:users:{start}")
+    tag = _plan["tag"]
+    password_hash = _plan["password_hash"]
+    oldest = _plan["now"] - _plan["history_days"] * DAY
+    lines = []
+    for index in range(start, stop):
+        created_at = _timestamp(rng.uniform(oldest, _plan["now"]))
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        username = f"seed{tag}u{index}"
+        lines.append(
+            f"{seeded_id(_plan['user_prefix'], index)},{first_name},{last_name},"
+            f"{username}@example.org,{password_hash},{username},"
+            f"{created_at},{created_at}\n"
+        )
+    return "".join(lines).encode()
+
+
+def build_projects(start: int, stop: int) -> bytes:
+    """CSV rows for projects start to stop."""
+    rng = random.Random(f"{_plan['seed']}:projects:{start}")
+    tag = _plan["tag"]
+    users = _plan["users"]
+    lines = []
+    for index in range(start, stop):
+        created_at = _timestamp(_plan["project_created"][index])
+        deadline = datetime.fromtimestamp(
+            _plan["project_deadline"][index], timezone.utc
+        ).isoformat()
+        title = " ".join(
+            rng.choices(VOCABULARY, cum_weights=VOCABULARY_WEIGHTS, k=3)
+        ).capitalize()
+        description = " ".join(
+            rng.choices(VOCABULARY, cum_weights=VOCABULARY_WEIGHTS, k=16)
+        ).capitalize()
+        goal_amount = int(rng.lognormvariate(9, 1.2)) + 100
+        lines.append(
+            f"{seeded_id(_plan['project_prefix'], index)},"
+            f"{seeded_id(_plan['user_prefix'], rng.randrange(users))},"
+            f"{title} {tag}-{index},{description}.,"
+            f"{goal_amount},{deadline},{created_at},{created_at}\n"
+        )
+    return "".join(lines).encode()
+
+
+def build_contributions(start: int, stop: int) -> bytes:
+    """CSV rows for contributions start to stop.
+
+    Projects are drawn by their power-law weights, contributors by a
+    Zipf-like weight so a few users give often, and each contribution falls
+    between the project's creation and its deadline or now.
+    """
+    rng = random.Random(f"{_plan['seed']}:contributions:{start}")
+    project_weights = _plan["project_cum_weights"]
+    user_weights = _plan["user_cum_weights"]
+    project_total = project_weights[-1]
+    user_total = user_weights[-1]
+    now = _plan["now"]
+    lines = []
+    for _ in range(start, stop):
+        project = bisect_left(project_weights, rng.random() * project_total)
+        user = bisect_left(user_weights, rng.random() * user_total)
+        opened = _plan["project_created"][project]
+        closed = min(_plan["project_deadline"][project], now)
+        created_at = _timestamp(rng.uniform(opened, max(opened, closed)))
+        amount = min(int(rng.lognormvariate(3.5, 1.1)) + 1, 100000)
+        lines.append(
+            f"{uuid.UUID(int=rng.getrandbits(128), version=4)},"
+            f"{seeded_id(_plan['project_prefix'], project)},"
+            f"{seeded_id(_plan['user_prefix'], user)},"
+            f"{amount},{created_at},{created_at}\n"
+        )
+    return "".join(lines).encode()
+
+
+def project_weights(
+    rng: random.Random, projects: int, alpha: float, hot: int, hot_share: float
+) -> List[float]:
+    """Pareto weights, with `hot` projects taking `hot_share` of the total."""
+    weights = [rng.paretovariate(alpha) for _ in range(projects)]
+    hot = min(hot, projects)
+    if hot and hot < projects and 0 < hot_share < 1:
+        hot_indexes = rng.sample(range(projects), hot)
+        cold_total = sum(weights) - sum(weights[index] for index in hot_indexes)
+        hot_weight = cold_total * hot_share / (1 - hot_share) / hot
+        for index in hot_indexes:
+            weights[index] = hot_weight
+    return weights
+
+
+def make_plan(args: argparse.Namespace) -> dict:
+    """Everything the workers need to generate rows deterministically."""
+    rng = random.Random(args.seed)
+    now = time.time()
+    oldest = now - args.history_days * DAY
+
+    project_created = []
+    project_deadline = []
+    for _ in range(args.projects):
+        created = rng.uniform(oldest, now)
+        project_created.append(created)
+        project_deadline.append(
+            created + rng.uniform(args.min_campaign_days, args.max_campaign_days) * DAY
+        )
+
+    weights = project_weights(
+        rng, args.projects, args.alpha, args.hot_projects, args.hot_share
+    )
+    user_weights = [1 / (rank + 1) ** args.user_skew for rank in range(args.users)]
+    rng.shuffle(user_weights)
+
+    # Ids and usernames are namespaced per run so that seeding again with
+    # the same seed adds rows instead of colliding with the earlier ones.
+    run = random.Random()
+    return {
+        "seed": args.seed,
+        "tag": f"{run.getrandbits(32):08x}",
+        "now": now,
+        "history_days": args.history_days,
+        "users": args.users,
+        "user_prefix": run.getrandbits(96),
+        "project_prefix": run.getrandbits(96),
+        "password_hash": pwd_context.hash(args.password),
+        "project_created": project_created,
+        "project_deadline": project_deadline,
+        "project_cum_weights": list(accumulate(weights)),
+        "user_cum_weights": list(accumulate(user_weights)),
+    }
+
+
+def chunks(total: int, size: int) -> List[range]:
+    """Split 0..total into ranges of at most `size`."""
+    return [range(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+async def copy_table(
+    database: Database,
+    executor: ProcessPoolExecutor,
+    semaphore: asyncio.Semaphore,
+    table: str,
+    columns: Sequence[str],
+    build: object,
+    total: int,
+    chunk_size: int,
+) -> None:
+    """Generate and COPY `total` rows into a table, a chunk per task."""
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+
+    async def load(part: range) -> None:
+        async with semaphore:
+            data = await loop.run_in_executor(executor, build, part.start, part.stop)
+            async with database.connection() as connection:
+                await connection.raw_connection.copy_to_table(
+                    table, source=io.BytesIO(data), columns=list(columns), format="csv"
+                )
+
+    await asyncio.gather(*(load(part) for part in chunks(total, chunk_size)))
+    elapsed = time.perf_counter() - started
+    print(f"{table}: {total} row(s) in {elapsed:.1f}s ({total / elapsed:.0f}/s)")
+
+
+async def fill_aggregates(
+    database: Database, semaphore: asyncio.Semaphore, project_ids: List[str]
+) -> None:
+    """Fill project_contributors and the funding totals of seeded projects."""
+    started = time.perf_counter()
+
+    async def fill(ids: List[str]) -> None:
+        async with semaphore, database.connection() as connection:
+            async with connection.transaction():
+                await connection.execute(
+                    query=ADD_MISSING_PROJECT_CONTRIBUTORS_QUERY, values={"ids": ids}
+                )
+                await connection.execute(
+                    query=RECOMPUTE_PROJECT_FUNDING_QUERY, values={"ids": ids}
+                )
+
+    await asyncio.gather(
+        *(
+            fill(project_ids[part.start : part.stop])
+            for part in chunks(len(project_ids), AGGREGATE_CHUNK_SIZE)
+        )
+    )
+    print(
+        f"aggregates: {len(project_ids)} project(s) in {time.perf_counter() - started:.1f}s"
+    )
+
+
+async def seed(args: argparse.Namespace) -> None:
+    """Load users, then projects, then contributions, then the aggregates."""
+    plan = make_plan(args)
+    database = Database(DATABASE_URL, min_size=1, max_size=args.workers)
+    await database.connect()
+    semaphore = asyncio.Semaphore(args.workers)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=args.workers, initializer=_init_worker, initargs=(plan,)
+        ) as executor:
+            for table, columns, build, total in (
+                ("users", USER_COPY_COLUMNS, build_users, args.users),
+                ("projects", PROJECT_COPY_COLUMNS, build_projects, args.projects),
+                (
+                    "contributions",
+                    CONTRIBUTION_COPY_COLUMNS,
+                    build_contributions,
+                    args.contributions,
+                ),
+            ):
+                await copy_table(
+                    database,
+                    executor,
+                    semaphore,
+                    table,
+                    columns,
+                    build,
+                    total,
+                    args.chunk_size,
+                )
+
+        project_ids = [
+            seeded_id(plan["project_prefix"], index) for index in range(args.projects)
+        ]
+        await fill_aggregates(database, semaphore, project_ids)
+        for table in ("users", "projects", "contributions", "project_contributors"):
+            await database.execute(f"ANALYZE {table}")
+    finally:
+        await database.disconnect()
+
+    print(f"Seeded users share the password {args.password!r}.")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--projects", type=int, default=2000)
+    parser.add_argument("--contributions", type=int, default=200000)
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Generator processes and connections."
+    )
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Rows per COPY.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=1.2,
+        help="Pareto shape of contributions per project; lower is more skewed.",
+    )
+    parser.add_argument("--hot-projects", type=int, default=10)
+    parser.add_argument(
+        "--hot-share",
+        type=float,
+        default=0.2,
+        help="Share of all contributions that go to the hot projects.",
+    )
+    parser.add_argument(
+        "--user-skew",
+        type=float,
+        default=1.0,
+        help="Zipf exponent of contributions per user; 0 is uniform.",
+    )
+    parser.add_argument(
+        "--history-days",
+        type=int,
+        default=365,
+        help="Projects and users are created over this many past days.",
+    )
+    parser.add_argument("--min-campaign-days", type=float, default=7)
+    parser.add_argument("--max-campaign-days", type=float, default=180)
+    args = parser.parse_args(argv)
+    if args.contributions and not (args.users and args.projects):
+        parser.error("contributions need at least one user and one project")
+    if args.projects and not args.users:
+        parser.error("projects need at least one user")
+    return args
+
+
+def main() -> None:
+    """Parse arguments and seed the database."""
+    asyncio.run(seed(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
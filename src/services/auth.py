@@ -4,17 +4,15 @@ from datetime import datetime, timedelta
 from uuid import UUID
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from src.core.config import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY
 from src.errors.core import InvalidTokenError
+from src.services.hashing import password_hasher
 
 
 class AuthService:
     """Auth service."""
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
     def create_access_token(
         self, data: dict, expires_delta: timedelta | None = None
     ) -> str:
@@ -37,24 +35,30 @@ class AuthService:
         """Gets token data"""
         return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
-    async def verify_token(
+    async def verify_token_claims(
         self, token: str, credentials_exception: Exception = InvalidTokenError()
-    ) -> UUID:
-        """Verifies tokens."""
+    ) -> dict:
+        """Verifies tokens and returns their claims."""
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHM)
-            user_id = payload.get("user_id")
-            if not user_id:
+            if not payload.get("user_id"):
                 raise credentials_exception  # noqa
         except JWTError:
             raise credentials_exception
 
-        return user_id
+        return payload
+
+    async def verify_token(
+        self, token: str, credentials_exception: Exception = InvalidTokenError()
+    ) -> UUID:
+        """Verifies tokens."""
+        payload = await self.verify_token_claims(token, credentials_exception)
+        return payload["user_id"]
 
     async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Method to verify passwords"""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await password_hasher.verify(plain_password, hashed_password)
 
     async def get_password_hash(self, password: str) -> str:
         """Method to hash passwords"""
-        return self.pwd_context.hash(password)
+        return await password_hasher.hash(password)
@@ -0,0 +1,221 @@
+"""Read-through cache module."""
+
+import asyncio
+import logging
+import uuid
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+
+from src.core.config import CACHE_BACKEND, CACHE_MAX_ENTRIES
+from src.core.metrics import registry
+from src.core.redis import get_redis
+from src.utils.cache import TTLCache
+
+app_logger = logging.getLogger("app")
+
+CACHE_REQUESTS = registry.counter(
+    "read_cache_requests_total",
+    "Read-through cache lookups by namespace and result.",
+    ("namespace", "result"),
+)
+CACHE_ERRORS = registry.counter(
+    "read_cache_errors_total",
+    "Read-through cache backend failures, served from the database instead.",
+    ("operation",),
+)
+
+NOT_FOUND = "\x00not-found"
+
+
+class CacheBackend:
+    """Interface every cache backend implements. Values are strings."""
+
+    name = "base"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value."""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Set a value. A ttl of None keeps it until deleted."""
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """Delete a value."""
+        raise NotImplementedError
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that never stores anything, used to disable caching."""
+
+    name = "none"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Always miss."""
+        return None
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Discard the value."""
+
+    async def delete(self, key: str) -> None:
+        """Nothing to delete."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU backend. Each worker has its own copy.
+
+    Invalidation only reaches the worker that made the write, so use it with
+    a single worker only.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int) -> None:
+        """Initializes the LRU with a size limit."""
+        self._entries = TTLCache(max_size=max_entries, ttl=0)
+        self._persistent: dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value."""
+        value = self._persistent.get(key)
+        if value is None:
+            value = self._entries.get(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Set a value."""
+        if ttl is None:
+            self._persistent[key] = value
+        else:
+            self._entries.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete a value."""
+        self._persistent.pop(key, None)
+        self._entries.delete(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis backend shared by every worker."""
+
+    name = "redis"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value."""
+        return await get_redis().get(key)
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Set a value."""
+        px = None if ttl is None else max(1, int(ttl * 1000))
+        await get_redis().set(key, value, px=px)
+
+    async def delete(self, key: str) -> None:
+        """Delete a value."""
+        await get_redis().delete(key)
+
+
+def create_cache_backend(name: str) -> CacheBackend:
+    """Build the backend selected by CACHE_BACKEND."""
+    if name == "memory":
+        return MemoryCacheBackend(max_entries=CACHE_MAX_ENTRIES)
+    if name == "redis":
+        return RedisCacheBackend()
+    if name == "none":
+        return NullCacheBackend()
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+class Cache:
+    """Namespaced read-through cache on top of a backend.
+
+    Backend failures are logged and counted, then treated as misses so the
+    database keeps serving requests when the cache is unavailable.
+    """
+
+    backend_errors = (RedisError, OSError, asyncio.TimeoutError)
+
+    def __init__(self, backend: CacheBackend) -> None:
+        """Initializes the cache with a backend."""
+        self.backend = backend
+
+    @staticmethod
+    def build_key(namespace: str, version: str = "", **parts: Any) -> str:
+        """Build a key from a namespace, its version and the lookup arguments."""
+        suffix = "&".join(f"{name}={parts[name]}" for name in sorted(parts))
+        return f"cache:{namespace}:{version}:{suffix}"
+
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        """Get a raw value, recording a hit or a miss."""
+        try:
+            value = await self.backend.get(key)
+        except self.backend_errors:
+            CACHE_ERRORS.labels("get").inc()
+            app_logger.warning(f"Cache get failed for {namespace}", exc_info=True)
+            return None
+        if value is None:
+            result = "miss"
+        elif value == NOT_FOUND:
+            result = "not_found_hit"
+        else:
+            result = "hit"
+        CACHE_REQUESTS.labels(namespace, result).inc()
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float]) -> None:
+        """Store a raw value."""
+        try:
+            await self.backend.set(key, value, ttl=ttl)
+        except self.backend_errors:
+            CACHE_ERRORS.labels("set").inc()
+            app_logger.warning("Cache set failed", exc_info=True)
+
+    async def delete(self, namespace: str, **parts: Any) -> None:
+        """Invalidate the entry of an unversioned namespace."""
+        try:
+            await self.backend.delete(self.build_key(namespace, **parts))
+        except self.backend_errors:
+            CACHE_ERRORS.labels("delete").inc()
+            app_logger.warning(f"Cache delete failed for {namespace}", exc_info=True)
+
+    async def get_version(self, namespace: str) -> Optional[str]:
+        """Get the current version of a versioned namespace, None on failure."""
+        try:
+            return await self.backend.get(f"cache-version:{namespace}") or "0"
+        except self.backend_errors:
+            CACHE_ERRORS.labels("get").inc()
+            app_logger.warning(f"Cache get failed for {namespace}", exc_info=True)
+            return None
+
+    async def bump_version(self, namespace: str) -> None:
+        """Invalidate every entry of a versioned namespace at once."""
+        try:
+            await self.backend.set(f"cache-version:{namespace}", uuid.uuid4().hex)
+        except self.backend_errors:
+            CACHE_ERRORS.labels("delete").inc()
+            app_logger.warning(f"Cache bump failed for {namespace}", exc_info=True)
+
+    @staticmethod
+    def stats() -> dict:
+        """Return hits, misses and hit ratio per namespace."""
+        namespaces: dict = {}
+        for (namespace, result), child in CACHE_REQUESTS.children():
+            counts = namespaces.setdefault(namespace, {})
+            counts[result] = int(child.value)
+        for counts in namespaces.values():
+            hits = counts.get("hit", 0) + counts.get("not_found_hit", 0)
+            lookups = hits + counts.get("miss", 0)
+            counts["hit_ratio"] = hits / lookups if lookups else 0.0
+        return namespaces
+
+
+cache = Cache(create_cache_backend(CACHE_BACKEND))
+
+registry.gauge(
+    "read_cache_hit_ratio",
+    "Share of read-through cache lookups served from the cache.",
+    ("namespace",),
+    function=lambda: {
+        (namespace,): counts["hit_ratio"] for namespace, counts in cache.stats().items()
+    },
+)
@@ -0,0 +1,129 @@
+"""Password hashing module."""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from passlib.context import CryptContext
+
+from src.core.config import (
+    PASSWORD_HASH_BACKEND,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WORKERS,
+)
+from src.core.metrics import registry
+from src.errors.core import ServiceUnavailableError
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+HASH_QUEUE_DEPTH = registry.gauge(
+    "password_hash_queue_depth",
+    "Password hashing jobs queued or running on the worker pool.",
+)
+HASH_DURATION = registry.histogram(
+    "password_hash_duration_seconds",
+    "Time to hash or verify a password, including time spent queued.",
+    labelnames=("operation",),
+)
+HASH_REJECTED = registry.counter(
+    "password_hash_rejected_total",
+    "Password hashing jobs rejected because the queue was full.",
+    labelnames=("operation",),
+)
+
+
+def _hash(password: str) -> str:
+    """Hash a password. Module level so process pools can pickle it."""
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password. Module level so process pools can pickle it."""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded worker pool instead of the event loop."""
+
+    backends = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+    def __init__(
+        self, backend: str = "thread", workers: int = 2, max_pending: int = 32
+    ) -> None:
+        """Initializes the hasher.
+
+        Args:
+            backend (str): "thread" or "process".
+            workers (int): Number of pool workers.
+            max_pending (int): Jobs allowed to queue or run before rejecting.
+        """
+        if backend not in self.backends:
+            raise ValueError(f"Unknown password hash backend: {backend}")
+        self.backend = backend
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        """Create the pool lazily so it is built after the server forks."""
+        if self._executor is None:
+            self._executor = self.backends[self.backend](max_workers=self.workers)
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable, *args: Any) -> Any:
+        """Run a hashing job on the pool, rejecting it when the queue is full."""
+        if self.pending >= self.max_pending:
+            HASH_REJECTED.labels(operation).inc()
+            raise ServiceUnavailableError(
+                additional_message="Too many authentication requests. Try again shortly."
+            )
+
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        HASH_QUEUE_DEPTH.set(self.pending)
+        start = time.perf_counter()
+        try:
+            job = self._get_executor().submit(func, *args)
+        except BaseException:
+            self._release()
+            raise
+        # A job keeps its slot until the pool is done with it, even if the
+        # request awaiting it went away.
+        job.add_done_callback(lambda _: self._release_threadsafe(loop))
+        try:
+            return await asyncio.wrap_future(job)
+        finally:
+            HASH_DURATION.labels(operation).observe(time.perf_counter() - start)
+
+    def _release(self) -> None:
+        """Free the slot of a finished or cancelled job."""
+        self.pending -= 1
+        HASH_QUEUE_DEPTH.set(self.pending)
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Free a slot from the pool thread that finished the job."""
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._release)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password."""
+        return await self._run("hash", _hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash."""
+        return await self._run("verify", _verify, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    backend=PASSWORD_HASH_BACKEND,
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=PASSWORD_HASH_MAX_PENDING,
+)
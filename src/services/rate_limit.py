@@ -0,0 +1,241 @@
+"""Token bucket rate limiting module."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from redis.exceptions import RedisError
+
+from src.core.config import (
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_LOGIN_PER_ACCOUNT,
+    RATE_LIMIT_LOGIN_PER_IP,
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMIT_PER_IP,
+    RATE_LIMIT_SIGNUP_PER_IP,
+)
+from src.core.metrics import registry
+from src.core.redis import get_redis
+
+app_logger = logging.getLogger("app")
+
+RATE_LIMIT_REQUESTS = registry.counter(
+    "rate_limit_requests_total",
+    "Requests checked against a rate limit, by limit and result.",
+    ("limit", "result"),
+)
+RATE_LIMIT_ERRORS = registry.counter(
+    "rate_limit_errors_total",
+    "Rate limit backend failures, let through instead of limited.",
+)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+class RateLimit:
+    """A token bucket: `capacity` requests at once, refilled over `period`."""
+
+    def __init__(self, name: str, capacity: int, period: float) -> None:
+        """Initializes the limit.
+
+        Args:
+            name (str): Label used in bucket keys and metrics.
+            capacity (int): Largest burst allowed, and requests per period.
+            period (float): Seconds for an empty bucket to fill up again.
+        """
+        self.name = name
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+
+    @classmethod
+    def parse(cls, name: str, value: str) -> "RateLimit":
+        """Parse a limit written as e.g. "10/minute"."""
+        count, _, unit = value.partition("/")
+        try:
+            return cls(name, int(count), PERIODS[unit.strip()])
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Invalid rate limit for {name}: {value!r}") from e
+
+
+class RateLimitBackend:
+    """Interface every rate limit backend implements."""
+
+    name = "base"
+
+    async def consume(self, key: str, limit: RateLimit, cost: int = 1) -> float:
+        """Take `cost` tokens from a bucket.
+
+        Returns 0 if the request may go ahead, otherwise the seconds until a
+        token is available. A negative cost gives tokens back, up to the
+        bucket's capacity.
+        """
+        raise NotImplementedError
+
+
+class NullRateLimitBackend(RateLimitBackend):
+    """Backend that lets everything through, used to disable rate limiting."""
+
+    name = "none"
+
+    async def consume(self, key: str, limit: RateLimit, cost: int = 1) -> float:
+        """Always allow."""
+        return 0.0
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """In-process buckets. Each worker limits on its own.
+
+    Buckets are kept in least recently used order and every check is O(1).
+    A bucket left alone long enough to fill up is the same as no bucket, so
+    idle ones are dropped from the old end as new keys come in. Past
+    `max_keys`, the least recently used bucket is dropped even if not full.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_keys: int) -> None:
+        """Initializes an empty set of buckets."""
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float, float]] = OrderedDict()
+
+    async def consume(self, key: str, limit: RateLimit, cost: int = 1) -> float:
+        """Take `cost` tokens from a bucket."""
+        now = time.monotonic()
+        tokens = float(limit.capacity)
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            stored, updated_at, _ = bucket
+            tokens = min(tokens, stored + (now - updated_at) * limit.rate)
+
+        retry_after = 0.0
+        if cost < 0:
+            tokens = min(float(limit.capacity), tokens - cost)
+        elif tokens >= 1:
+            tokens = max(tokens - cost, 0.0)
+        else:
+            retry_after = (1 - tokens) / limit.rate
+        full_at = now + (limit.capacity - tokens) / limit.rate
+        self._buckets[key] = (tokens, now, full_at)
+        self._buckets.move_to_end(key)
+        self._expire(now)
+        return retry_after
+
+    def _expire(self, now: float) -> None:
+        """Drop full buckets from the old end, then any beyond max_keys."""
+        while self._buckets:
+            oldest = next(iter(self._buckets.values()))
+            if oldest[2] > now and len(self._buckets) <= self.max_keys:
+                break
+            self._buckets.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Number of buckets held."""
+        return len(self._buckets)
+
+
+# Refill and take or give back tokens in one step, on Redis' clock, so every
+# worker shares the bucket. Keys expire once the bucket would be full again.
+CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = capacity
+if bucket[1] then
+    tokens = math.min(capacity, tonumber(bucket[1]) + (now - tonumber(bucket[2])) * rate)
+end
+
+local retry_after = 0
+if cost < 0 then
+    tokens = math.min(capacity, tokens - cost)
+elseif tokens >= 1 then
+    tokens = math.max(tokens - cost, 0)
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1)
+return tostring(retry_after)
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Redis buckets shared by every worker."""
+
+    name = "redis"
+
+    async def consume(self, key: str, limit: RateLimit, cost: int = 1) -> float:
+        """Take `cost` tokens from a bucket."""
+        script = get_redis().register_script(CONSUME_SCRIPT)
+        retry_after = await script(keys=[key], args=[limit.capacity, limit.rate, cost])
+        return float(retry_after)
+
+
+def create_rate_limit_backend(name: str) -> RateLimitBackend:
+    """Build the backend selected by RATE_LIMIT_BACKEND."""
+    if name == "memory":
+        return MemoryRateLimitBackend(max_keys=RATE_LIMIT_MAX_KEYS)
+    if name == "redis":
+        return RedisRateLimitBackend()
+    if name == "none":
+        return NullRateLimitBackend()
+    raise ValueError(f"Unknown rate limit backend: {name}")
+
+
+class RateLimiter:
+    """Checks requests against named limits.
+
+    Backend failures are logged and counted, then let through: an outage of
+    the limiter should not take the API down with it.
+    """
+
+    backend_errors = (RedisError, OSError, asyncio.TimeoutError)
+
+    def __init__(self, backend: RateLimitBackend) -> None:
+        """Initializes the limiter with a backend."""
+        self.backend = backend
+
+    async def hit(self, limit: RateLimit, identity: str) -> float:
+        """Count a request by `identity` against a limit.
+
+        Returns 0 if it may go ahead, otherwise the seconds to wait.
+        """
+        try:
+            retry_after = await self.backend.consume(
+                f"rate-limit:{limit.name}:{identity}", limit
+            )
+        except self.backend_errors:
+            RATE_LIMIT_ERRORS.inc()
+            app_logger.warning(
+                f"Rate limit check failed for {limit.name}", exc_info=True
+            )
+            return 0.0
+        RATE_LIMIT_REQUESTS.labels(
+            limit.name, "limited" if retry_after else "allowed"
+        ).inc()
+        return retry_after
+
+    async def refund(self, limit: RateLimit, identity: str) -> None:
+        """Give back the token a hit took, for a request that should not count."""
+        try:
+            await self.backend.consume(
+                f"rate-limit:{limit.name}:{identity}", limit, cost=-1
+            )
+        except self.backend_errors:
+            RATE_LIMIT_ERRORS.inc()
+            app_logger.warning(
+                f"Rate limit refund failed for {limit.name}", exc_info=True
+            )
+
+
+rate_limiter = RateLimiter(create_rate_limit_backend(RATE_LIMIT_BACKEND))
+
+IP_LIMIT = RateLimit.parse("ip", RATE_LIMIT_PER_IP)
+LOGIN_IP_LIMIT = RateLimit.parse("login_ip", RATE_LIMIT_LOGIN_PER_IP)
+LOGIN_ACCOUNT_LIMIT = RateLimit.parse("login_account", RATE_LIMIT_LOGIN_PER_ACCOUNT)
+SIGNUP_IP_LIMIT = RateLimit.parse("signup_ip", RATE_LIMIT_SIGNUP_PER_IP)
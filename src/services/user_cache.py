@@ -0,0 +1,62 @@
+"""Authenticated user cache module."""
+
+import time
+from typing import Optional, Union
+from uuid import UUID
+
+from src.core.config import USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS
+from src.models.user import UserInDb
+from src.utils.cache import TTLCache
+
+
+class UserCache:
+    """Caches decoded token claims and the users they resolve to.
+
+    The cache is per process, so invalidation only reaches the worker that
+    made the change. Other workers pick the change up once the TTL expires.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initializes the claim and user caches with the same limits."""
+        self.claims = TTLCache(max_size=max_size, ttl=ttl, name="token_claims")
+        self.users = TTLCache(max_size=max_size, ttl=ttl, name="users")
+
+    def get_claims(self, token: str) -> Optional[dict]:
+        """Get the verified claims of a token."""
+        return self.claims.get(token)
+
+    def set_claims(self, token: str, claims: dict) -> None:
+        """Cache verified claims, never past the token's own expiry."""
+        ttl = self.claims.ttl
+        expires_at = claims.get("exp")
+        if expires_at is not None:
+            ttl = min(ttl, float(expires_at) - time.time())
+        self.claims.set(token, claims, ttl=ttl)
+
+    def get_user(self, user_id: Union[UUID, str]) -> Optional[UserInDb]:
+        """Get a cached user."""
+        return self.users.get(str(user_id))
+
+    def set_user(self, user: UserInDb) -> None:
+        """Cache a user loaded from the database."""
+        self.users.set(str(user.user_id), user)
+
+    def invalidate_user(self, user_id: Union[UUID, str]) -> None:
+        """Drop a user after their record changes or is soft-deleted."""
+        self.users.delete(str(user_id))
+
+    def invalidate_token(self, token: str) -> None:
+        """Drop the cached claims of a token, e.g. on logout."""
+        self.claims.delete(token)
+
+    def clear(self) -> None:
+        """Drop every cached claim and user."""
+        self.claims.clear()
+        self.users.clear()
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters for both caches."""
+        return {"claims": self.claims.stats(), "users": self.users.stats()}
+
+
+user_cache = UserCache(max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
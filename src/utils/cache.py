@@ -0,0 +1,124 @@
+"""In-process cache helpers."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from src.core.metrics import registry
+
+CACHE_HITS = registry.counter(
+    "cache_hits_total", "Lookups served from an in-process cache.", ("cache",)
+)
+CACHE_MISSES = registry.counter(
+    "cache_misses_total", "Lookups not found in an in-process cache.", ("cache",)
+)
+CACHE_EVICTIONS = registry.counter(
+    "cache_evictions_total",
+    "Entries evicted from an in-process cache to respect its size limit.",
+    ("cache",),
+)
+CACHE_ENTRIES = registry.gauge(
+    "cache_entries", "Entries held by an in-process cache.", ("cache",)
+)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a time to live.
+
+    Every operation is O(1). Expired entries are dropped when they are read
+    or when they reach the least recently used end of the cache.
+    """
+
+    def __init__(self, max_size: int, ttl: float, name: Optional[str] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept.
+            ttl (float): Default time to live in seconds. Zero disables the cache.
+            name (str, optional): Label used for the hit, miss and eviction metrics.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        if name:
+            self._hit_counter = CACHE_HITS.labels(name)
+            self._miss_counter = CACHE_MISSES.labels(name)
+            self._eviction_counter = CACHE_EVICTIONS.labels(name)
+            self._size_gauge = CACHE_ENTRIES.labels(name)
+
+    def __len__(self) -> int:
+        """Number of entries, including ones that expired but were not dropped yet."""
+        return len(self._data)
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+            if self.name:
+                self._hit_counter.inc()
+        else:
+            self.misses += 1
+            if self.name:
+                self._miss_counter.inc()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value or the default when missing or expired."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self._record(False)
+            return default
+        expires_at, value = entry  # type: ignore
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._update_size()
+            self._record(False)
+            return default
+        self._data.move_to_end(key)
+        self._record(True)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+            if self.name:
+                self._eviction_counter.inc()
+        self._update_size()
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove an entry. Returns whether it was present."""
+        removed = self._data.pop(key, _MISSING) is not _MISSING
+        self._update_size()
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+        self._update_size()
+
+    def _update_size(self) -> None:
+        if self.name:
+            self._size_gauge.set(len(self._data))
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,33 @@
+"""ETag module."""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+
+class ETag:
+    """ETag class"""
+
+    @staticmethod
+    def build(*values: Any) -> str:
+        """Build a strong ETag from the values that version a resource."""
+        raw = "|".join(
+            value.isoformat() if isinstance(value, datetime) else str(value)
+            for value in values
+        )
+        return f'"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+    @staticmethod
+    def matches(etag: str, if_none_match: Optional[str]) -> bool:
+        """Check an ETag against an If-None-Match header.
+
+        If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return any(
+            candidate.strip().removeprefix("W/") == etag
+            for candidate in if_none_match.split(",")
+        )
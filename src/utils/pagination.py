@@ -0,0 +1,41 @@
+"""Pagination module."""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable
+
+from src.errors.database import BadRequestError
+
+
+class Pagination:
+    """Pagination class"""
+
+    @staticmethod
+    def encode_cursor(*values: Any) -> str:
+        """Encode the sort key of the last row of a page as an opaque cursor."""
+        raw = json.dumps([str(value) for value in values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> list[Any]:
+        """Decode a cursor produced by encode_cursor.
+
+        Each value is parsed by the matching parser, e.g. `UUID`, and anything
+        malformed is refused as a bad request.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise BadRequestError("Invalid cursor") from e
+        if (
+            not isinstance(values, list)
+            or len(values) != len(parsers)
+            or not all(isinstance(value, str) for value in values)
+        ):
+            raise BadRequestError("Invalid cursor")
+        try:
+            return [parse(value) for parse, value in zip(parsers, values)]
+        except (TypeError, ValueError) as e:
+            raise BadRequestError("Invalid cursor") from e